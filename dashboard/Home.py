@@ -14,6 +14,8 @@ from utils.data_loader import (
     load_weekly_health_comparison,
     load_top_places_this_week,
 )
+from utils.parallel import run_loaders
+from utils.result_cache import clear_loader_caches
 from utils.styling import apply_deck_branding, add_deck_footer, BRAND_COLORS
 
 # Page configuration
@@ -32,15 +34,25 @@ st.title("DECK Analytics — Executive Overview")
 
 # Refresh button
 if st.button("Refresh Data"):
-    st.cache_data.clear()
+    clear_loader_caches()
     st.rerun()
 
 try:
     # Load data — gold_homepage_totals is the single source of truth
-    homepage = load_homepage_totals()
-    mau_data = load_latest_mau()
-    wau_data = load_latest_wau()
-    referral_data = load_referral_metrics()
+    # Every section's loaders run in parallel up front; results come back in order
+    (
+        homepage, mau_data, wau_data, referral_data,
+        growth_df, sparkline_df, health_df, top_places_df,
+    ) = run_loaders([
+        load_homepage_totals,
+        load_latest_mau,
+        load_latest_wau,
+        load_referral_metrics,
+        load_growth_snapshot,
+        (load_dau_sparkline, (), {"days": 30}),
+        load_weekly_health_comparison,
+        load_top_places_this_week,
+    ])
 
     if homepage.empty:
         st.warning("No data available. Run `dbt run` to populate gold_homepage_totals.")
@@ -163,8 +175,6 @@ try:
     # ============================================
     st.subheader("Growth Snapshot")
 
-    growth_df = load_growth_snapshot()
-
     if not growth_df.empty:
         col1, col2, col3 = st.columns(3)
 
@@ -192,7 +202,6 @@ try:
                     )
 
     # DAU Sparkline
-    sparkline_df = load_dau_sparkline(days=30)
     if not sparkline_df.empty:
         fig = go.Figure(go.Scatter(
             x=sparkline_df['activity_date'],
@@ -219,8 +228,6 @@ try:
     # ============================================
     st.subheader("This Week's Health")
 
-    health_df = load_weekly_health_comparison()
-
     if not health_df.empty:
         hw = health_df.iloc[0]
 
@@ -278,8 +285,6 @@ try:
     # ============================================
     st.subheader("Top 5 Places Saved This Week")
 
-    top_places_df = load_top_places_this_week()
-
     if not top_places_df.empty:
         st.dataframe(
             top_places_df,
@@ -11,6 +11,8 @@ from datetime import datetime
 # Add parent directory to path to import utils
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.db_connection import get_database_connection
+from utils.parallel import prefetch_loaders
+from utils.result_cache import cached_loader, clear_loader_caches
 from utils.styling import apply_deck_branding, add_deck_footer
 
 # ── Brand colours (match existing dashboard) ──────────────────────────────────
@@ -40,10 +42,9 @@ apply_deck_branding()
 from sqlalchemy import text
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_power_users():
     """Load all users with >5 sessions (power users)."""
-    engine = get_database_connection()
     query = """
     SELECT
         user_id,
@@ -93,30 +94,28 @@ def load_power_users():
     WHERE total_sessions > 5
     ORDER BY total_sessions DESC
     """
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         df = pd.read_sql(text(query), conn)
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_user_engagement_trajectory(user_id: str):
     """Week-by-week engagement for a specific user."""
-    engine = get_database_connection()
     query = """
     SELECT *
     FROM analytics_prod_gold.fct_user_engagement_trajectory
     WHERE user_id = :uid
     ORDER BY activity_week
     """
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         df = pd.read_sql(text(query), conn, params={"uid": user_id})
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_user_sessions(user_id: str):
     """Session-level outcomes for a specific user."""
-    engine = get_database_connection()
     query = """
     SELECT
         session_id,
@@ -143,15 +142,14 @@ def load_user_sessions(user_id: str):
     WHERE user_id = :uid
     ORDER BY started_at DESC
     """
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         df = pd.read_sql(text(query), conn, params={"uid": user_id})
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_user_prompts(user_id: str):
     """Prompt-level analysis for a specific user."""
-    engine = get_database_connection()
     query = """
     SELECT
         query_id,
@@ -180,15 +178,14 @@ def load_user_prompts(user_id: str):
     WHERE user_id = :uid
     ORDER BY query_timestamp DESC
     """
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         df = pd.read_sql(text(query), conn, params={"uid": user_id})
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_session_explorer(session_id: str):
     """Detailed session drill-down with JSONB event data."""
-    engine = get_database_connection()
     query = """
     SELECT
         session_id,
@@ -216,15 +213,14 @@ def load_session_explorer(session_id: str):
     WHERE session_id = :sid
     LIMIT 1
     """
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         df = pd.read_sql(text(query), conn, params={"sid": session_id})
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_user_conversions(user_id: str):
     """Conversion events for a specific user."""
-    engine = get_database_connection()
     query = """
     SELECT
         card_id,
@@ -240,7 +236,7 @@ def load_user_conversions(user_id: str):
     WHERE user_id = :uid
     ORDER BY action_timestamp DESC
     """
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         df = pd.read_sql(text(query), conn, params={"uid": user_id})
     return df
 
@@ -315,7 +311,7 @@ st.caption("Explore the activity of users who have returned more than 5 times.")
 
 # Refresh
 if st.button("Refresh Data"):
-    st.cache_data.clear()
+    clear_loader_caches()
     st.rerun()
 
 try:
@@ -356,6 +352,14 @@ try:
     user = power_users.loc[selected_idx]
     uid = str(user["user_id"])
 
+    # Warm the per-user section loaders in parallel; the sections below hit the cache
+    prefetch_loaders([
+        (load_user_engagement_trajectory, (uid,)),
+        (load_user_sessions, (uid,)),
+        (load_user_prompts, (uid,)),
+        (load_user_conversions, (uid,)),
+    ])
+
     st.divider()
 
     # ══════════════════════════════════════════════════════════════════════
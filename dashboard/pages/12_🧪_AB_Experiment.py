@@ -6,6 +6,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from utils.styling import apply_deck_branding, add_deck_footer, BRAND_COLORS
 from utils.db_connection import get_database_connection
+from utils.result_cache import cached_loader
 from sqlalchemy import text
 
 try:
@@ -27,26 +28,23 @@ CONTROL_COLOR = BRAND_COLORS.get('text_secondary', '#787774')
 TREATMENT_COLOR = BRAND_COLORS.get('accent', '#2383E2')
 
 # --- Data Loading ---
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_experiment_metadata():
-    engine = get_database_connection()
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         return pd.read_sql(text(
             "SELECT * FROM analytics_prod.experiments WHERE status = 'active' ORDER BY experiment_id DESC LIMIT 1"
         ), conn)
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_experiment_results():
-    engine = get_database_connection()
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         return pd.read_sql(text(
             "SELECT * FROM analytics_prod_gold.fct_experiment_results ORDER BY metric_date, experiment_arm"
         ), conn)
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_experiment_timeseries():
-    engine = get_database_connection()
-    with engine.connect() as conn:
+    with get_database_connection().connect() as conn:
         return pd.read_sql(text(
             "SELECT * FROM analytics_prod_gold.vis_experiment_dashboard ORDER BY metric_date, experiment_arm"
         ), conn)
@@ -16,6 +16,7 @@ import calendar
 from datetime import date, timedelta
 from fpdf import FPDF
 from utils.styling import apply_deck_branding, add_deck_footer, BRAND_COLORS
+from utils.parallel import prefetch_loaders
 from utils.data_loader import (
     # Daily loaders
     load_daily_topline_kpis,
@@ -308,6 +309,9 @@ elif cadence == "Weekly":
 else:
     ctx = _build_monthly_ctx()
 
+# Warm every section's loader in parallel; the section calls below hit the cache
+prefetch_loaders({k: v for k, v in ctx.items() if k.startswith("load_")})
+
 st.markdown(f"### {ctx['heading']}")
 
 # Reserve a slot for the PDF download button (filled at the bottom after all data loads)
@@ -9,6 +9,8 @@ from utils.data_loader import (
     load_north_star_daily,
     load_north_star_weekly,
     load_north_star_headline,
+    load_active_users_over_time,
+    load_north_star_distributions,
     load_psr_ladder_current,
     load_active_planners_trend,
     load_session_diagnostics,
@@ -69,12 +71,20 @@ if daily_df.empty:
 # ============================================================================
 st.subheader("Headline KPIs")
 
+exact_unique_users = st.toggle(
+    "Exact unique-user counts",
+    value=False,
+    help="Unique users are estimated from daily HyperLogLog sketches (~1.6% standard error). "
+         "Turn on for an exact COUNT(DISTINCT) over all sessions in the period — slower on long ranges.",
+)
+
 headline = load_north_star_headline(
     data_source=data_source,
     session_type=session_type,
     app_version=app_version,
     start_date=start_date,
     end_date=end_date,
+    exact_unique_users=exact_unique_users,
 )
 
 if headline:
@@ -106,14 +116,106 @@ if headline:
             help="No-Value Rate: % of sessions with zero saves and zero shares."
         )
 
+    uap_error = float(headline.get('unique_active_planners_error', 0))
     st.metric(
         "Unique Active Planners",
-        f"{headline.get('unique_active_planners', 0):,}",
+        f"{'≈' if uap_error else ''}{headline.get('unique_active_planners', 0):,}",
         help="Distinct users who prompted, saved, or shared in the selected period"
+             + (f" (estimate, ±{uap_error * 100:.1f}% standard error)" if uap_error else "")
     )
 
 st.divider()
 
+# ============================================================================
+# Section A2: Active Users & Planners
+# ============================================================================
+st.subheader("Active Users & Planners")
+
+grain_label = st.radio("Period", ["Daily", "Weekly", "Monthly"], index=1, horizontal=True, key="active_users_grain")
+grain = {"Daily": "day", "Weekly": "week", "Monthly": "month"}[grain_label]
+
+active_df = load_active_users_over_time(
+    grain=grain,
+    data_source=data_source,
+    session_type=session_type,
+    app_version=app_version,
+    start_date=start_date,
+    end_date=end_date,
+    exact=exact_unique_users,
+)
+
+if not active_df.empty:
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=active_df['period_start'], y=active_df['active_users'],
+                             name='Active Users', line=dict(color=BRAND_COLORS['info'], width=2)))
+    fig.add_trace(go.Scatter(x=active_df['period_start'], y=active_df['active_planners'],
+                             name='Active Planners', line=dict(color='#E91E8C', width=2.5)))
+    fig.update_layout(
+        yaxis_title="Users",
+        font=dict(family="Inter, system-ui, sans-serif", size=13, color=BRAND_COLORS['text_primary']),
+        plot_bgcolor='white', paper_bgcolor='white',
+        margin=dict(l=40, r=20, t=40, b=40),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+        xaxis=dict(showgrid=False, linecolor=BRAND_COLORS['border']),
+        yaxis=dict(showgrid=True, gridcolor=BRAND_COLORS['bg_secondary'], linecolor=BRAND_COLORS['border']),
+        hoverlabel=dict(bgcolor='white', font_size=12),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        "Distinct users with any session (Active Users) and with a prompt, save or share "
+        "(Active Planners) per period, for the selected filters. Partial first and last periods "
+        "only count the days inside the date range."
+        + ("" if exact_unique_users else " Estimated from daily sketches, ±1.6% standard error.")
+    )
+else:
+    st.info("No active-user data available for the selected filters.")
+
+st.divider()
+
+# ============================================================================
+# Section A3: Session Timing Distribution
+# ============================================================================
+st.subheader("Session Timing Distribution")
+
+dist_df = load_north_star_distributions(
+    data_source=data_source,
+    session_type=session_type,
+    app_version=app_version,
+    start_date=start_date,
+    end_date=end_date,
+)
+
+if not dist_df.empty and dist_df['sessions'].sum() > 0:
+    ttfs_row = dist_df.set_index('metric').loc['ttfs']
+    col1, col2, col3 = st.columns(3)
+    for col, key in zip((col1, col2, col3), ('p50', 'p90', 'p99')):
+        val = ttfs_row[key]
+        col.metric(f"TTFS {key}", f"{val:.0f}s" if pd.notna(val) else "N/A",
+                   help=f"{key[1:]}th percentile Time to First Save (seconds) across the selected period")
+
+    st.dataframe(
+        dist_df[['label', 'sessions', 'p50', 'p90', 'p99', 'mean']],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'label': "Metric",
+            'sessions': st.column_config.NumberColumn("Sessions", format="%d"),
+            'p50': st.column_config.NumberColumn("p50", format="%.1f"),
+            'p90': st.column_config.NumberColumn("p90", format="%.1f"),
+            'p99': st.column_config.NumberColumn("p99", format="%.1f"),
+            'mean': st.column_config.NumberColumn("Mean", format="%.1f"),
+        },
+    )
+    st.caption(
+        "Exact percentiles over every session in the period, pooled from the daily "
+        "histograms in fct_north_star_daily_sketch. Time metrics count only sessions "
+        "with a save / share."
+    )
+else:
+    st.info("No session distribution data available for the selected filters.")
+
+st.divider()
+
 # ============================================================================
 # Section B: PSR Ladder Funnel
 # ============================================================================
@@ -11,13 +11,16 @@ sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_loader import (
     load_cvp_funnel_metrics,
     load_funnel_by_cohort,
+    load_funnel_event_extract,
     load_like_rate_by_position
 )
+from utils.funnels import FunnelEngine
 from utils.visualizations import (
     create_funnel_chart,
     create_line_chart
 )
 from utils.styling import apply_deck_branding, add_deck_footer
+from utils.result_cache import clear_loader_caches, current_build_generation
 
 # Page configuration
 st.set_page_config(
@@ -45,7 +48,7 @@ st.markdown("""
 col_refresh, col_filter = st.columns([1, 4])
 with col_refresh:
     if st.button("🔄 Refresh Data"):
-        st.cache_data.clear()
+        clear_loader_caches()
         st.rerun()
 
 with col_filter:
@@ -199,5 +202,118 @@ except Exception as e:
     st.error(f"Error loading CVP funnel data: {str(e)}")
     st.exception(e)
 
+# ============================================
+# SECTION 4: CUSTOM FUNNEL BUILDER
+# ============================================
+FUNNEL_STEP_PRESETS = {
+    "Prompt (Dextr query)": {"event_type": "query"},
+    "Card view": {"event_category": "View"},
+    "Any swipe": {"event_category": "Swipe"},
+    "Swipe right": {"event_type": "swipe_right"},
+    "Save": {"event_type": "save"},
+    "Share": {"event_category": "Share"},
+    "Conversion (website, booking, directions...)": {"event_category": "Conversion"},
+}
+
+FUNNEL_WINDOWS = {
+    "1 hour": pd.Timedelta(hours=1),
+    "1 day": pd.Timedelta(days=1),
+    "7 days": pd.Timedelta(days=7),
+    "30 days": pd.Timedelta(days=30),
+    "No limit": None,
+}
+
+
+@st.cache_resource(max_entries=3)
+def _funnel_engine(days, build_generation):
+    """Sorted event index for the builder, rebuilt per period and dbt build."""
+    return FunnelEngine(load_funnel_event_extract(days=days))
+
+
+st.divider()
+st.subheader("🧪 Custom Funnel Builder")
+st.caption(
+    "Pick steps in order. A user enters at their first matching event in the period; each "
+    "later step must be a later event than the previous one and within the conversion window."
+)
+
+try:
+    col_steps, col_window, col_cohort = st.columns([3, 1, 1])
+    with col_steps:
+        step_names = st.multiselect(
+            "Steps (in order)",
+            list(FUNNEL_STEP_PRESETS),
+            default=["Prompt (Dextr query)", "Save", "Share"],
+        )
+    with col_window:
+        window_label = st.selectbox("Conversion window", list(FUNNEL_WINDOWS), index=2)
+    with col_cohort:
+        cohort_choice = st.radio(
+            "Users",
+            ["Signed up in period", "All active users"],
+            help="Signed up in period matches the funnels above; all active users includes existing users",
+        )
+    split_by_week = st.checkbox("Split by signup week")
+
+    if len(step_names) < 2:
+        st.info("Pick at least two steps.")
+    else:
+        engine = _funnel_engine(days_filter, current_build_generation())
+        if not len(engine):
+            st.warning(f"No events in the last {days_filter} days")
+        else:
+            cohort_mask = None
+            if cohort_choice == "Signed up in period":
+                cutoff = (pd.Timestamp.now() - pd.Timedelta(days=days_filter)).date()
+                cohort_mask = engine.users['signup_date'] >= cutoff
+
+            steps = [(name, FUNNEL_STEP_PRESETS[name]) for name in step_names]
+            result = engine.funnel(
+                steps,
+                window=FUNNEL_WINDOWS[window_label],
+                mask=cohort_mask,
+                by='cohort_week' if split_by_week else None,
+            )
+
+            if split_by_week:
+                table = result.pivot(
+                    index=['cohort_week', 'cohort_users'], columns='step_index', values='users'
+                ).reset_index()
+                table.columns = ['Cohort Week', 'Users'] + step_names
+                for name in step_names[1:]:
+                    table[f"{name} %"] = (table[name] / table[step_names[0]] * 100).round(1)
+                st.dataframe(
+                    table.sort_values('Cohort Week', ascending=False),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+            else:
+                st.metric(
+                    label="Users in cohort",
+                    value=f"{int(result['cohort_users'].iloc[0]):,}",
+                    help="Users with at least one event in the period (and matching the user filter)",
+                )
+                funnel_fig = create_funnel_chart(step_names, result['users'].tolist(), "")
+                st.plotly_chart(funnel_fig, use_container_width=True, config={'displayModeBar': False})
+
+                display_df = result[['step', 'users', 'conversion_rate', 'step_conversion', 'median_seconds']].copy()
+                display_df['conversion_rate'] = (display_df['conversion_rate'] * 100).round(1)
+                display_df['step_conversion'] = (display_df['step_conversion'] * 100).round(1)
+                display_df['median_seconds'] = (display_df['median_seconds'] / 3600).round(1)
+                st.dataframe(
+                    display_df.rename(columns={
+                        'step': 'Step',
+                        'users': 'Users',
+                        'conversion_rate': 'From Step 1 %',
+                        'step_conversion': 'From Previous %',
+                        'median_seconds': 'Median Hours from Step 1',
+                    }),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+
+except Exception as e:
+    st.error(f"Error building custom funnel: {str(e)}")
+
 # Add footer
 add_deck_footer()
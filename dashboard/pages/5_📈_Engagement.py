@@ -16,7 +16,10 @@ from utils.data_loader import (
     load_swipe_to_save_weekly,
     load_engagement_cohort_heatmap,
     load_engagement_frequency_distribution,
+    load_session_event_extract,
 )
+from utils.result_cache import current_build_generation
+from utils.sessionize import SessionExtract, DEFAULT_GAP_SECONDS
 
 st.set_page_config(
     page_title="Engagement | DECK Analytics",
@@ -533,5 +536,106 @@ try:
 except Exception as e:
     st.error(f"Error loading engagement frequency distribution: {str(e)}")
 
+# =============================================================================
+# Section G: Session Definition Explorer
+# =============================================================================
+st.divider()
+st.subheader("Session Definition Explorer")
+st.caption(
+    "Inferred sessions split a user's events at a fixed 5-minute inactivity gap. "
+    "Re-sessionize the selected period's events at other gaps to see how session "
+    "counts and rates depend on that choice. Computed in-process; no dbt rebuild."
+)
+
+COMPARE_GAP_MINUTES = [1, 2, 5, 10, 15, 30, 60]
+
+
+@st.cache_resource(max_entries=2)
+def _session_extract(start_date, end_date, build_generation):
+    """Sorted event index for the explorer, rebuilt per period and dbt build."""
+    return SessionExtract(load_session_event_extract(start_date=start_date, end_date=end_date))
+
+
+try:
+    extract = _session_extract(filters['start_date'], filters['end_date'], current_build_generation())
+    if not len(extract):
+        st.info("No events in the selected period.")
+    else:
+        gap_minutes = st.slider(
+            "Inactivity gap (minutes)", min_value=1, max_value=120,
+            value=DEFAULT_GAP_SECONDS // 60, key="session_gap_minutes",
+        )
+        chosen = extract.summarize(gap_minutes * 60)
+        baseline = extract.summarize(DEFAULT_GAP_SECONDS)
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric(
+            "Sessions", f"{chosen['sessions']:,}",
+            delta=f"{chosen['sessions'] - baseline['sessions']:+,} vs 5 min",
+            delta_color="off",
+        )
+        col2.metric("Sessions / User", f"{chosen['sessions_per_user']:.2f}")
+        col3.metric("Median Duration", f"{chosen['median_duration_seconds'] / 60:.1f} min")
+        col4.metric("Genuine Planning", f"{chosen['genuine_planning_rate'] * 100:.1f}%")
+
+        gaps = sorted(set(COMPARE_GAP_MINUTES) | {gap_minutes})
+        compare_df = extract.compare([g * 60 for g in gaps])
+        compare_df['gap_minutes'] = gaps
+
+        fig_gap = go.Figure()
+        for col, label, color in [
+            ('genuine_planning_rate', 'Genuine planning', CHART_COLORS['green']),
+            ('save_rate', 'With save (SSR)', CHART_COLORS['blue']),
+            ('share_rate', 'With share (SHR)', CHART_COLORS['pink']),
+        ]:
+            fig_gap.add_trace(go.Scatter(
+                x=compare_df['gap_minutes'], y=compare_df[col] * 100,
+                mode='lines+markers', name=label, line=dict(color=color, width=2),
+                hovertemplate=f"{label}<br>Gap: %{{x}} min<br>%{{y:.1f}}% of sessions<extra></extra>",
+            ))
+        fig_gap.add_vline(x=gap_minutes, line_dash="dot", line_color=CHART_COLORS['orange'])
+        fig_gap.update_layout(
+            xaxis_title="Inactivity gap (minutes)",
+            yaxis_title="% of sessions",
+            xaxis=dict(type="log", gridcolor=BRAND_COLORS["border"]),
+            yaxis=dict(ticksuffix="%", gridcolor=BRAND_COLORS["border"]),
+            font=CHART_FONT,
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            margin=dict(l=40, r=20, t=40, b=40),
+            height=380,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        )
+        st.plotly_chart(fig_gap, use_container_width=True)
+
+        display_df = compare_df[[
+            'gap_minutes', 'sessions', 'sessions_per_user', 'median_duration_seconds',
+            'median_events', 'save_rate', 'share_rate', 'genuine_planning_rate',
+        ]].copy()
+        display_df['median_duration_seconds'] = display_df['median_duration_seconds'] / 60
+        for col in ('save_rate', 'share_rate', 'genuine_planning_rate'):
+            display_df[col] = display_df[col] * 100
+        st.dataframe(
+            display_df.rename(columns={
+                'gap_minutes': 'Gap (min)',
+                'sessions': 'Sessions',
+                'sessions_per_user': 'Sessions / User',
+                'median_duration_seconds': 'Median Duration (min)',
+                'median_events': 'Median Events',
+                'save_rate': 'SSR %',
+                'share_rate': 'SHR %',
+                'genuine_planning_rate': 'Genuine Planning %',
+            }).round(2),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption(
+            "All events in the period are sessionized by time gap alone, native and "
+            "inferred eras alike, so figures differ from stg_unified_sessions for native "
+            "sessions. App version filter does not apply."
+        )
+except Exception as e:
+    st.error(f"Error loading session definition explorer: {str(e)}")
+
 # --- Footer ---
 add_deck_footer()
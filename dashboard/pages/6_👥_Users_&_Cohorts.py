@@ -25,7 +25,9 @@ from utils.data_loader import (
     load_churned_user_profile_detail,
     load_churn_risk_distribution,
     load_planner_vs_passenger,
+    load_user_activity_bitmaps,
 )
+from utils.activity_bitmaps import ActivityBitmaps
 
 st.set_page_config(
     page_title="Users & Cohorts | DECK Analytics",
@@ -742,6 +744,118 @@ except Exception as e:
 
 st.divider()
 
+# =============================================================================
+# Section E4: Retention Explorer
+# =============================================================================
+st.subheader("Retention Explorer")
+st.caption(
+    "Slice retention by any acquisition attribute, optionally within a subset "
+    "of users. Computed in-process from per-user activity bitmaps "
+    "(fct_user_activity_bitmap), so new cuts need no new dbt model."
+)
+
+EXPLORER_ATTRIBUTES = {
+    'Cohort week': 'cohort_week',
+    'Activation type': 'activation_type',
+    'Referral source': 'referral_source',
+    'Activation trigger': 'activation_trigger',
+    'First prompt intent': 'first_prompt_intent',
+    'App version at signup': 'app_version_at_signup',
+    'Social connectivity': 'connectivity_bucket',
+}
+
+try:
+    bitmap_df = load_user_activity_bitmaps()
+    if bitmap_df.empty:
+        st.info("No activity bitmaps available yet.")
+    else:
+        bitmaps = ActivityBitmaps(bitmap_df)
+
+        col_x1, col_x2, col_x3 = st.columns(3)
+        with col_x1:
+            slice_label = st.selectbox(
+                "Slice by", list(EXPLORER_ATTRIBUTES), index=2, key="explorer_slice"
+            )
+        with col_x2:
+            filter_label = st.selectbox(
+                "Filter on", ["(none)"] + list(EXPLORER_ATTRIBUTES), key="explorer_filter"
+            )
+        with col_x3:
+            filter_values = []
+            if filter_label != "(none)":
+                filter_col = EXPLORER_ATTRIBUTES[filter_label]
+                options = sorted(bitmaps.users[filter_col].dropna().astype(str).unique())
+                filter_values = st.multiselect("Values", options, key="explorer_filter_values")
+
+        slice_col = EXPLORER_ATTRIBUTES[slice_label]
+        mask = None
+        if filter_values:
+            mask = bitmaps.users[filter_col].astype(str).isin(filter_values)
+
+        explorer_table = bitmaps.retention(by=slice_col, mask=mask)
+        explorer_table = explorer_table.sort_values('cohort_size', ascending=False)
+        if explorer_table.empty:
+            st.info("No users match the selected filter.")
+        else:
+            top_groups = explorer_table[slice_col].head(8).tolist()
+            curve = bitmaps.retention_curve(max_day=90, by=slice_col, mask=mask)
+            curve = curve[curve[slice_col].isin(top_groups)]
+
+            fig_explorer = go.Figure()
+            for group in top_groups:
+                group_curve = curve[curve[slice_col] == group]
+                size = int(explorer_table.loc[explorer_table[slice_col] == group, 'cohort_size'].iloc[0])
+                fig_explorer.add_trace(
+                    go.Scatter(
+                        x=group_curve['day'],
+                        y=group_curve['retention_rate'] * 100,
+                        mode='lines',
+                        name=f"{group} (n={size:,})",
+                        connectgaps=False,
+                        hovertemplate=f"{group}<br>D%{{x}}: %{{y:.1f}}%<extra></extra>",
+                    )
+                )
+            fig_explorer.update_layout(
+                xaxis_title="Days since activation",
+                yaxis_title="Retained by day N",
+                yaxis=dict(range=[0, 100], ticksuffix="%", gridcolor=BRAND_COLORS["border"]),
+                font=dict(family="Inter, system-ui, sans-serif", size=13),
+                plot_bgcolor='white',
+                paper_bgcolor='white',
+                margin=dict(l=40, r=20, t=20, b=40),
+                height=420,
+                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            )
+            st.plotly_chart(fig_explorer, use_container_width=True)
+
+            display_cols = [slice_col, 'cohort_size'] + [
+                f"retention_rate_d{day}" for day in (7, 30, 60, 90)
+            ]
+            st.dataframe(
+                explorer_table[display_cols],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    slice_col: slice_label,
+                    'cohort_size': st.column_config.NumberColumn("Users", format="%d"),
+                    **{
+                        f"retention_rate_d{day}": st.column_config.NumberColumn(
+                            f"D{day}", format="%.2f"
+                        )
+                        for day in (7, 30, 60, 90)
+                    },
+                },
+            )
+            st.caption(
+                "Chart shows the eight largest groups. Retained by day N = any "
+                "meaningful session on days 1..N, among users at least N days "
+                "past activation; the curve stops where no user is mature."
+            )
+except Exception as e:
+    st.error(f"Error loading retention explorer: {str(e)}")
+
+st.divider()
+
 # =============================================================================
 # Section F: Churn Analysis
 # =============================================================================
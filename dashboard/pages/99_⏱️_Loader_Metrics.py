@@ -0,0 +1,122 @@
+"""DECK Loader Metrics — per-loader latency and cache hit rates (admin only).
+
+Hidden from the sidebar; open it directly at /Loader_Metrics.
+"""
+
+import streamlit as st
+
+from utils.styling import apply_deck_branding, add_deck_footer
+from utils.loader_metrics import (
+    clear_recent_calls,
+    metrics_settings,
+    read_call_log,
+    recent_calls,
+    summarize_calls,
+)
+from utils.result_cache import get_memory_cache, memory_cache_stats
+
+st.set_page_config(
+    page_title="Loader Metrics | DECK Analytics",
+    page_icon="⏱️",
+    layout="wide",
+)
+
+apply_deck_branding()
+
+st.title("Loader Metrics")
+st.caption(
+    "Every cached loader call: where the result came from (memory, disk cache, "
+    "a stale result being revalidated, another caller's identical query, or the "
+    "database), wall time, SQL time, rows and bytes. Use p95 and miss counts "
+    "to pick what to optimize next."
+)
+
+settings = metrics_settings()
+if not settings["enabled"]:
+    st.info("Loader metrics are disabled (`[loader_metrics] enabled = false`).")
+    st.stop()
+
+sources = ["This process"]
+if settings["log_path"]:
+    sources.append("Log file (all processes)")
+
+with st.sidebar:
+    st.header("Source")
+    source = st.radio("Calls from", sources, label_visibility="collapsed")
+    if source == "This process" and st.button("Clear buffer"):
+        clear_recent_calls()
+        st.rerun()
+
+if source == "This process":
+    calls = recent_calls()
+    st.caption(f"In-memory ring buffer — last {int(settings['buffer_size']):,} calls.")
+else:
+    calls = read_call_log(settings["log_path"])
+    min_ms = float(settings["log_min_ms"])
+    note = f" (calls of {min_ms:,.0f} ms or more)" if min_ms else ""
+    st.caption(f"`{settings['log_path']}`{note}.")
+
+if calls.empty:
+    st.info("No loader calls recorded yet. Open a dashboard page and come back.")
+    st.stop()
+
+# ---------------------------------------------------------------------------
+# Headline
+# ---------------------------------------------------------------------------
+outcomes = calls["cache"].value_counts()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Calls", f"{len(calls):,}")
+col2.metric("Loaders", f"{calls['loader'].nunique():,}")
+col3.metric("Hit rate", f"{1 - outcomes.get('miss', 0) / len(calls):.0%}")
+col4.metric("Database misses", f"{outcomes.get('miss', 0):,}")
+
+# ---------------------------------------------------------------------------
+# Per-loader summary
+# ---------------------------------------------------------------------------
+st.subheader("Per loader")
+summary = summarize_calls(calls)
+st.dataframe(
+    summary,
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "hit_rate": st.column_config.NumberColumn("hit rate", format="%.2f"),
+        "p50_ms": st.column_config.NumberColumn("p50 ms", format="%.1f"),
+        "p95_ms": st.column_config.NumberColumn("p95 ms", format="%.1f"),
+        "p50_sql_ms": st.column_config.NumberColumn("p50 SQL ms", format="%.1f"),
+        "p95_sql_ms": st.column_config.NumberColumn("p95 SQL ms", format="%.1f"),
+        "max_bytes": st.column_config.NumberColumn("max bytes", format="%d"),
+    },
+)
+
+# ---------------------------------------------------------------------------
+# Memory cache
+# ---------------------------------------------------------------------------
+st.subheader("Memory cache (this process)")
+memory = get_memory_cache()
+st.caption(
+    f"{memory.resident_bytes / 2**20:,.1f} MB resident of a {memory.max_bytes / 2**20:,.0f} MB budget, "
+    f"{memory.policy.upper()} eviction. Misses include disk-cache hits."
+)
+st.dataframe(
+    memory_cache_stats(),
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "resident_bytes": st.column_config.NumberColumn("resident bytes", format="%d"),
+        "hit_ratio": st.column_config.NumberColumn("hit ratio", format="%.2f"),
+    },
+)
+
+# ---------------------------------------------------------------------------
+# Slowest calls
+# ---------------------------------------------------------------------------
+st.subheader("Slowest calls")
+slowest = calls.sort_values("total_ms", ascending=False).head(50)
+st.dataframe(
+    slowest[["ts", "loader", "cache", "total_ms", "sql_ms", "queries", "rows", "bytes", "error", "params"]],
+    use_container_width=True,
+    hide_index=True,
+)
+
+add_deck_footer()
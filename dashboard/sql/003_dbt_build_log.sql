@@ -0,0 +1,24 @@
+-- 003_dbt_build_log.sql
+--
+-- Creates analytics_ops.dbt_build_log — one row per dbt invocation that built at
+-- least one model, seed or snapshot. Written by the `record_dbt_build` on-run-end
+-- hook (macros/record_dbt_build.sql); the hook is a no-op until this table exists.
+--
+-- The dashboard polls the latest invocation_id as its "build generation": cached
+-- loader results stay valid until the next scheduled rebuild (01:00 / 13:00 UTC)
+-- lands a new row, instead of expiring on a fixed 5-minute TTL.
+--
+-- Idempotent — CREATEs use IF NOT EXISTS. Re-running is a no-op.
+
+create schema if not exists analytics_ops;
+
+create table if not exists analytics_ops.dbt_build_log (
+  invocation_id  text primary key,
+  command        text not null,
+  nodes_built    integer not null,
+  nodes_failed   integer not null,
+  finished_at    timestamptz not null default now()
+);
+
+create index if not exists dbt_build_log_finished_at_idx
+  on analytics_ops.dbt_build_log (finished_at desc);
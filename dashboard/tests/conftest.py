@@ -0,0 +1,6 @@
+"""Run from dashboard/: ``python -m pytest tests``."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
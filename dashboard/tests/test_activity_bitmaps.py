@@ -0,0 +1,82 @@
+"""ActivityBitmaps retention against per-user checks on the bit strings."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.activity_bitmaps import ActivityBitmaps
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(17)
+    n = 300
+    tracked = rng.integers(1, 120, n)
+    bits = ["".join(rng.choice(["0", "1"], size=t, p=[0.9, 0.1])) for t in tracked]
+    return pd.DataFrame({
+        "user_id": [f"u{i}" for i in range(n)],
+        "cohort_week": rng.choice(["2026-01-05", "2026-01-12", "2026-01-19"], n),
+        "referral_source": rng.choice(["organic", "invite", None], n),
+        "activity_bits": bits,
+        "tracked_days": tracked,
+    })
+
+
+def _expected(frame, day):
+    """(mature, retained) per user, read straight off the bit strings."""
+    mature = frame["tracked_days"] > day
+    retained = mature & frame["activity_bits"].map(lambda bits: "1" in bits[1 : day + 1])
+    return mature, retained
+
+
+@pytest.mark.parametrize("first_day, last_day", [(0, 0), (1, 7), (3, 17), (8, 15), (60, 500)])
+def test_days_slices_the_bit_strings(frame, first_day, last_day):
+    bitmaps = ActivityBitmaps(frame)
+    expected = frame["activity_bits"].map(lambda bits: "1" in bits[first_day : last_day + 1])
+    assert bitmaps.active_between(first_day, last_day).tolist() == expected.tolist()
+
+
+def test_overall_retention(frame):
+    result = ActivityBitmaps(frame).retention()
+    assert result["cohort_size"].iloc[0] == len(frame)
+    for day in (7, 30, 60, 90):
+        mature, retained = _expected(frame, day)
+        assert result[f"mature_d{day}"].iloc[0] == mature.sum()
+        assert result[f"retained_d{day}"].iloc[0] == retained.sum()
+
+
+def test_grouped_retention_with_mask(frame):
+    bitmaps = ActivityBitmaps(frame)
+    mask = bitmaps.users["cohort_week"] != "2026-01-19"
+    result = bitmaps.retention(by="referral_source", mask=mask)
+    result = result.set_index(result["referral_source"].fillna("none"))
+
+    subset = frame[mask]
+    mature, retained = _expected(subset, 30)
+    groups = subset["referral_source"].fillna("none")
+    assert result["cohort_size"].to_dict() == groups.value_counts().to_dict()
+    assert result["retained_d30"].to_dict() == retained.groupby(groups).sum().to_dict()
+    assert result["mature_d30"].to_dict() == mature.groupby(groups).sum().to_dict()
+    assert len(result) == 3
+
+
+def test_retention_curve_matches_retention(frame):
+    bitmaps = ActivityBitmaps(frame)
+    curve = bitmaps.retention_curve(max_day=90, by="cohort_week").set_index(["cohort_week", "day"])
+    for day in (1, 7, 30, 89, 90):
+        for week, users in frame.groupby("cohort_week"):
+            mature, retained = _expected(users, day)
+            assert curve.loc[(week, day), "mature"] == mature.sum()
+            assert curve.loc[(week, day), "retained"] == retained.sum()
+
+
+def test_never_returned_and_empty():
+    frame = pd.DataFrame({
+        "user_id": ["a", "b"], "activity_bits": ["1000000000", "1"], "tracked_days": [10, 1],
+    })
+    bitmaps = ActivityBitmaps(frame)
+    result = bitmaps.retention(days=(7,))
+    assert result[["mature_d7", "retained_d7"]].iloc[0].tolist() == [1, 0]
+    assert result["retention_rate_d7"].iloc[0] == 0
+
+    assert bitmaps.retention_curve(mask=np.zeros(2, dtype=bool)).empty
@@ -0,0 +1,53 @@
+"""read_frame dtypes, against an in-memory SQLite database."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from utils.bulk_fetch import STRING_DTYPE, compact_frame, read_frame
+
+
+@pytest.fixture
+def conn():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        pd.DataFrame({
+            "prompt_specificity": ["high", "low", None],
+            "prompt_text": ["a", "b", "c"],
+            "prompts": [1, 2, 3],
+        }).to_sql("prompts", conn, index=False)
+        yield conn
+
+
+def test_plain_read_keeps_read_sql_dtypes(conn):
+    """Non-bulk loaders return exactly what pd.read_sql does."""
+    frame = read_frame(conn, "select * from prompts where prompts >= :low", {"low": 1})
+    expected = pd.read_sql("select * from prompts", conn)
+    pd.testing.assert_frame_equal(frame, expected)
+    assert frame["prompt_specificity"].dtype == object
+    assert frame["prompt_specificity"].iloc[2] is None
+
+
+def test_expanding_params(conn):
+    frame = read_frame(
+        conn, "select prompts from prompts where prompt_text in :texts", {"texts": ["a", "c"]},
+        expanding=("texts",),
+    )
+    assert frame["prompts"].tolist() == [1, 3]
+
+
+def test_compact_frame():
+    frame = compact_frame(pd.DataFrame({
+        "prompt_specificity": ["high", "low"],
+        "event_type": ["save", "query"],
+        "note": ["x", None],
+        "count": [1, 2],
+        "big": [1, 2**40],
+        "nullable": [1.0, None],
+    }), categorical=("event_type",))
+    assert isinstance(frame["prompt_specificity"].dtype, pd.CategoricalDtype)
+    assert isinstance(frame["event_type"].dtype, pd.CategoricalDtype)
+    assert frame["note"].dtype == STRING_DTYPE
+    assert frame["count"].dtype == "int32"
+    assert frame["big"].dtype == "int64"
+    assert frame["nullable"].dtype == "float64"
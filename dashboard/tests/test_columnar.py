@@ -0,0 +1,195 @@
+"""Parquet export partitioning and read_table pruning, against a tmp_path export.
+
+The export reads through a small stand-in for the psycopg raw connection that
+serves an in-memory table: information_schema columns, min/max of the date
+column, and ``COPY (select ...) TO STDOUT`` as Postgres-style CSV.
+"""
+
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from utils import columnar, columnar_export
+from utils.columnar_export import EXPORT_DEFAULTS, export_table
+
+TODAY = date.today()
+COLUMNS = [
+    ("user_id", "text"),
+    ("event_date", "date"),
+    ("event_timestamp", "timestamp with time zone"),
+    ("is_native", "boolean"),
+    ("event_count", "integer"),
+]
+
+
+def _events(first_day, days):
+    """One event per day from first_day, plus one row without a date."""
+    dates = [first_day + timedelta(days=i) for i in range(days)]
+    return pd.DataFrame({
+        "user_id": [f"u{i % 7}" for i in range(days)] + ["u-none"],
+        "event_date": dates + [None],
+        "event_timestamp": [pd.Timestamp(d, tz="UTC") + pd.Timedelta(hours=i % 24) for i, d in enumerate(dates)] + [None],
+        "is_native": [i % 2 == 0 for i in range(days)] + [None],
+        "event_count": list(range(days)) + [-1],
+    })
+
+
+class FakeRawConnection:
+    """Serves ``tables`` ({name: DataFrame}) to export_table."""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    @contextmanager
+    def cursor(self):
+        yield FakeCursor(self.tables)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, tables):
+        self.tables = tables
+        self.result = None
+
+    def execute(self, sql, params=None):
+        if "information_schema" in sql:
+            self.result = COLUMNS if params[1] in self.tables else []
+        elif sql.startswith("select min("):
+            dates = self.tables[sql.split(".")[-1]]["event_date"].dropna()
+            self.result = [(dates.min(), dates.max())]
+
+    def fetchall(self):
+        return self.result
+
+    def fetchone(self):
+        return self.result[0]
+
+    @contextmanager
+    def copy(self, sql):
+        table = re.search(r"from \w+\.(\w+)", sql).group(1)
+        frame = self.tables[table]
+        bounds = re.search(r"where \"event_date\" >= '([\d-]+)' and \"event_date\" < '([\d-]+)'", sql)
+        if bounds:
+            low, high = (date.fromisoformat(b) for b in bounds.groups())
+            dated = frame["event_date"].notna()
+            frame = frame[dated & (frame["event_date"].where(dated, low) >= low)
+                          & (frame["event_date"].where(dated, high) < high)]
+        elif "is null" in sql:
+            frame = frame[frame["event_date"].isna()]
+
+        csv = frame.assign(
+            event_timestamp=frame["event_timestamp"].map(
+                lambda ts: "" if ts is None or pd.isna(ts) else ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            ),
+            is_native=frame["is_native"].map({True: "t", False: "f"}),
+        ).to_csv(index=False, na_rep="")
+        yield [csv.encode()]
+
+
+@pytest.fixture
+def export(monkeypatch, tmp_path):
+    """(settings, tables) with stg_unified_events covering the last ~4 months."""
+    tables = {
+        "stg_unified_events": _events(TODAY - timedelta(days=120), 121),
+        "fct_user_segments": pd.DataFrame({
+            "user_id": ["u1", "u2"], "event_date": [TODAY, None], "event_timestamp": [None, None],
+            "is_native": [True, False], "event_count": [1, 2],
+        }),
+    }
+    monkeypatch.setattr(
+        columnar_export, "get_database_connection",
+        lambda: type("Engine", (), {"raw_connection": lambda self: FakeRawConnection(tables)})(),
+    )
+    settings = dict(EXPORT_DEFAULTS, path=str(tmp_path))
+    monkeypatch.setattr(columnar, "export_settings", lambda: settings)
+    return settings, tables
+
+
+def _months(first, last):
+    months, current = [], first.replace(day=1)
+    while current <= last:
+        months.append(f"month={current:%Y-%m}")
+        current = (current + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def test_partition_naming(export, tmp_path):
+    settings, tables = export
+    written = export_table("stg_unified_events", full=True, settings=settings)
+
+    expected = _months(TODAY - timedelta(days=120), TODAY) + ["month=none"]
+    assert sorted(written) == sorted(expected)
+    assert sum(written.values()) == len(tables["stg_unified_events"])
+    assert written["month=none"] == 1
+    for partition in expected:
+        assert (tmp_path / "stg_unified_events" / partition / "data.parquet").exists()
+
+    assert export_table("fct_user_segments", settings=settings) == {"": 2}
+    assert (tmp_path / "fct_user_segments" / "data.parquet").exists()
+
+
+def test_lookback_rewrites_recent_months_only(export, tmp_path):
+    settings, _ = export
+    export_table("stg_unified_events", full=True, settings=settings)
+    root = tmp_path / "stg_unified_events"
+    all_months = _months(TODAY - timedelta(days=120), TODAY)
+
+    recent = (TODAY - timedelta(days=settings["lookback_days"])).replace(day=1)
+    expected = [m for m in all_months if m >= f"month={recent:%Y-%m}"]
+    oldest = all_months[0]
+    (root / oldest / "data.parquet").unlink()
+
+    written = export_table("stg_unified_events", settings=settings)
+    # Recent months, plus any month whose file is missing, plus the null partition
+    assert sorted(written) == sorted(set(expected) | {oldest, "month=none"})
+
+    (root / "month=1999-01").mkdir()
+    export_table("stg_unified_events", settings=settings)
+    assert (root / "month=1999-01").exists()
+
+    written = export_table("stg_unified_events", full=True, settings=settings)
+    assert sorted(written) == sorted(all_months + ["month=none"])
+    assert not (root / "month=1999-01").exists()
+
+
+def test_read_table_prunes_by_month_columns_and_dates(export, tmp_path):
+    settings, tables = export
+    export_table("stg_unified_events", full=True, settings=settings)
+    events = tables["stg_unified_events"]
+
+    everything = columnar.read_table("stg_unified_events")
+    assert len(everything) == len(events)
+    assert (everything["month"] == "none").sum() == 1
+    assert everything.loc[everything["month"] == "none", "user_id"].tolist() == ["u-none"]
+
+    # The current month is past end_date, so a scan of the range never opens it
+    start, end = TODAY - timedelta(days=70), TODAY - timedelta(days=40)
+    (tmp_path / "stg_unified_events" / f"month={TODAY:%Y-%m}" / "data.parquet").write_bytes(b"not parquet")
+
+    result = columnar.read_table(
+        "stg_unified_events", columns=["user_id", "event_date", "event_count"],
+        start_date=start.isoformat(), end_date=end.isoformat(),
+    )
+    assert list(result.columns) == ["user_id", "event_date", "event_count"]
+    dated = events[events["event_date"].notna()]
+    expected = dated[(dated["event_date"] >= start) & (dated["event_date"] <= end)]
+    assert sorted(result["event_count"]) == sorted(expected["event_count"])
+
+    types = columnar.read_table("stg_unified_events", end_date=end.isoformat(), as_arrow=True).schema
+    assert str(types.field("event_timestamp").type) == "timestamp[us, tz=UTC]"
+    assert str(types.field("is_native").type) == "bool"
+
+
+def test_read_table_rejects_unknown_tables(export):
+    with pytest.raises(ValueError):
+        columnar.read_table("fct_nothing")
+    with pytest.raises(FileNotFoundError):
+        columnar.read_table("fct_session_outcomes")
@@ -0,0 +1,139 @@
+"""FunnelEngine against a per-user walk of the documented funnel semantics."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.funnels import FunnelEngine
+
+STEPS = [
+    ("Prompt", {"event_type": "query"}),
+    ("Swipe", {"event_type": ["swipe_right", "swipe_left"]}),
+    ("Save", {"event_type": "save"}),
+    ("Share", lambda events: events["event_category"] == "Share"),
+]
+
+
+@pytest.fixture
+def events():
+    rng = np.random.default_rng(20)
+    n = 3_000
+    users = pd.DataFrame({
+        "user_id": [f"u{i}" for i in range(200)],
+        "cohort_week": rng.choice(["2026-01-05", "2026-01-12", "2026-01-19"], 200),
+    })
+    frame = pd.DataFrame({
+        "user_id": rng.choice(users["user_id"], n),
+        "event_timestamp": pd.Timestamp("2026-01-05", tz="UTC")
+        + pd.to_timedelta(rng.integers(0, 30 * 86_400 * 10, n) * 100, unit="ms"),
+        "event_type": rng.choice(["query", "swipe_right", "swipe_left", "save", "view"], n),
+        "event_category": rng.choice(["Search", "Share"], n, p=[0.8, 0.2]),
+    })
+    return frame.merge(users, on="user_id")
+
+
+def _matches(events, predicate):
+    if callable(predicate):
+        return predicate(events).to_numpy()
+    mask = np.ones(len(events), dtype=bool)
+    for column, value in predicate.items():
+        mask &= events[column].isin(value if isinstance(value, list) else [value]).to_numpy()
+    return mask
+
+
+def _brute_force(events, steps, window_seconds=None):
+    """{step_index: {user_id: seconds from entry}} walking each user's events.
+
+    Events are walked in time order (ties in extract order); each step takes
+    the first matching event after the previous step's event.
+    """
+    reached = {i: {} for i in range(1, len(steps) + 1)}
+    flags = np.column_stack([_matches(events, predicate) for _, predicate in steps])
+    ns = pd.to_datetime(events["event_timestamp"], utc=True).astype("int64").to_numpy()
+    for user_id, rows in events.groupby("user_id").indices.items():
+        rows = rows[np.argsort(ns[rows], kind="stable")]
+        times = ns[rows]
+        entry = [i for i, ok in enumerate(flags[rows, 0]) if ok]
+        if not entry:
+            continue
+        current = entry[0]
+        start = times[current]
+        deadline = start + window_seconds * 10**9 if window_seconds is not None else np.inf
+        reached[1][user_id] = 0
+        for step in range(1, len(steps)):
+            hits = [
+                i for i, ok in enumerate(flags[rows, step])
+                if ok and i > current and times[i] <= deadline
+            ]
+            if not hits:
+                break
+            current = hits[0]
+            reached[step + 1][user_id] = (times[current] - start) / 10**9
+    return reached
+
+
+@pytest.mark.parametrize("window", [None, pd.Timedelta(days=2), pd.Timedelta(days=5)])
+def test_matches_brute_force(events, window):
+    result = FunnelEngine(events).funnel(STEPS, window=window)
+    expected = _brute_force(events, STEPS, None if window is None else window.total_seconds())
+
+    assert result["users"].tolist() == [len(expected[i]) for i in range(1, len(STEPS) + 1)]
+    for row in result.itertuples():
+        elapsed = list(expected[row.step_index].values())
+        if elapsed:
+            assert row.median_seconds == pytest.approx(np.median(elapsed))
+        else:
+            assert np.isnan(row.median_seconds)
+
+
+def test_grouped_and_masked_matches_brute_force(events):
+    engine = FunnelEngine(events)
+    mask = engine.users["cohort_week"] != "2026-01-19"
+    result = engine.funnel(STEPS[:3], window=pd.Timedelta(days=7), mask=mask, by="cohort_week")
+
+    for week, week_events in events[events["cohort_week"] != "2026-01-19"].groupby("cohort_week"):
+        expected = _brute_force(week_events, STEPS[:3], pd.Timedelta(days=7).total_seconds())
+        rows = result[result["cohort_week"] == week]
+        assert rows["users"].tolist() == [len(expected[i]) for i in (1, 2, 3)]
+        assert (rows["cohort_users"] == week_events["user_id"].nunique()).all()
+    assert set(result["cohort_week"]) == {"2026-01-05", "2026-01-12"}
+
+
+def test_each_step_is_a_later_event():
+    """a: save at the same instant, after the query in the extract (counts).
+    b: save earlier within the same second (doesn't). c: save a second later (counts)."""
+    ts = pd.Timestamp("2026-01-05 10:00:00", tz="UTC")
+    events = pd.DataFrame({
+        "user_id": ["a", "a", "b", "b", "c", "c"],
+        "event_timestamp": [
+            ts, ts,
+            ts + pd.Timedelta("700ms"), ts + pd.Timedelta("300ms"),
+            ts, ts + pd.Timedelta("1s"),
+        ],
+        "event_type": ["query", "save", "query", "save", "query", "save"],
+        "event_category": ["Search"] * 6,
+    })
+    result = FunnelEngine(events).funnel(STEPS[:1] + STEPS[2:3])
+    assert result["users"].tolist() == [3, 2]
+    assert result["median_seconds"].iloc[1] == pytest.approx(0.5)
+
+
+def test_overlapping_steps_need_separate_events():
+    ts = pd.Timestamp("2026-01-05 10:00:00", tz="UTC")
+    events = pd.DataFrame({
+        "user_id": ["a", "b", "b"],
+        "event_timestamp": [ts, ts, ts + pd.Timedelta("1ms")],
+        "event_type": ["query", "query", "query"],
+        "event_category": ["Search"] * 3,
+    })
+    result = FunnelEngine(events).funnel([STEPS[0], ("Prompt again", {"event_type": "query"})])
+    assert result["users"].tolist() == [2, 1]
+
+
+@pytest.mark.parametrize("events", [pd.DataFrame(), pd.DataFrame(columns=["user_id", "event_timestamp"])])
+def test_empty_or_failed_extract(events):
+    engine = FunnelEngine(events)
+    assert len(engine) == 0
+    result = engine.funnel(STEPS[:2])
+    assert result["users"].tolist() == [0, 0]
+    assert result["cohort_users"].tolist() == [0, 0]
@@ -0,0 +1,53 @@
+"""Histogram merging and quantiles against np.percentile on the raw values."""
+
+import numpy as np
+import pytest
+
+from utils.histograms import merge_histograms, summarize_histograms, weighted_quantiles
+
+QUANTILES = (0, 0.01, 0.25, 0.5, 0.9, 0.99, 1)
+
+
+def _histograms(samples):
+    """One (values, counts) histogram per sample, as the sketch model stores them."""
+    values, counts = [], []
+    for sample in samples:
+        v, c = np.unique(sample, return_counts=True)
+        values.append(v.tolist() if len(v) else None)
+        counts.append(c.tolist() if len(c) else None)
+    return values, counts
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pooled_quantiles_match_percentile(seed):
+    rng = np.random.default_rng(seed)
+    samples = [rng.integers(0, rng.integers(1, 400), rng.integers(0, 300)) for _ in range(12)]
+    raw = np.concatenate(samples)
+
+    values, counts = merge_histograms(*_histograms(samples))
+    assert counts.sum() == len(raw)
+    np.testing.assert_allclose(
+        weighted_quantiles(values, counts, QUANTILES), np.percentile(raw, np.array(QUANTILES) * 100)
+    )
+
+
+@pytest.mark.parametrize("raw", [[5], [3, 3, 3], [1, 2], [0, 10, 10, 11]])
+def test_small_and_tied_distributions(raw):
+    values, counts = merge_histograms(*_histograms([raw]))
+    np.testing.assert_allclose(
+        weighted_quantiles(values, counts, QUANTILES), np.percentile(raw, np.array(QUANTILES) * 100)
+    )
+
+
+def test_summary_and_empty():
+    samples = [np.array([1, 2, 2, 9]), np.array([]), np.array([2, 40])]
+    summary = summarize_histograms(*_histograms(samples))
+    raw = np.concatenate(samples)
+    assert summary["sessions"] == 6
+    assert summary["mean"] == pytest.approx(raw.mean())
+    assert summary["p50"] == pytest.approx(np.percentile(raw, 50))
+    assert summary["p99"] == pytest.approx(np.percentile(raw, 99))
+
+    empty = summarize_histograms([None], [None])
+    assert empty["sessions"] == 0
+    assert np.isnan(empty["mean"]) and np.isnan(empty["p90"])
@@ -0,0 +1,68 @@
+"""HyperLogLog merging and estimates, on sketches hashed like macros/hll.sql."""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.hll import HLL_RELATIVE_ERROR, count_distinct, estimate, merge_sketches
+
+
+def _sketch(user_ids):
+    """Sparse (registers, ranks) for user_ids, using the hll_register/hll_rank macros' hash."""
+    best = {}
+    for user_id in user_ids:
+        digest = hashlib.md5(str(user_id).encode()).hexdigest()
+        register = int(digest[:3], 16)
+        bits = format(int(digest[3:16], 16), "052b")
+        rank = bits.find("1") + 1 or 53
+        best[register] = max(best.get(register, 0), rank)
+    registers = sorted(best)
+    return registers, [best[r] for r in registers]
+
+
+def _rows(days):
+    """One sketch row per (day, users) pair."""
+    sketches = [_sketch(users) for _, users in days]
+    return pd.DataFrame({
+        "metric_date": [day for day, _ in days],
+        "active_registers": [s[0] if s[0] else None for s in sketches],
+        "active_ranks": [s[1] if s[1] else None for s in sketches],
+    })
+
+
+@pytest.mark.parametrize("n", [10, 100, 1_000, 10_000, 100_000])
+def test_estimate_within_error_bound(n):
+    """Every fixed case lands within three standard errors of the exact count."""
+    registers, ranks = _sketch(f"user-{i}" for i in range(n))
+    result = estimate(merge_sketches([registers], [ranks]))[0]
+    assert abs(result - n) <= max(3 * HLL_RELATIVE_ERROR * n, 1)
+
+
+def test_merge_is_sketch_of_union():
+    rng = np.random.default_rng(18)
+    days = [(f"2026-01-0{d}", [f"user-{i}" for i in rng.choice(20_000, 3_000, replace=False)]) for d in range(1, 8)]
+    rows = _rows(days)
+
+    union = set().union(*(users for _, users in days))
+    union_registers, union_ranks = _sketch(union)
+    expected = merge_sketches([union_registers], [union_ranks])
+    merged = merge_sketches(rows["active_registers"].tolist(), rows["active_ranks"].tolist())
+    np.testing.assert_array_equal(merged, expected)
+
+    result = count_distinct(rows, "active_registers", "active_ranks")
+    assert abs(result - len(union)) <= 3 * HLL_RELATIVE_ERROR * len(union)
+
+
+def test_count_distinct_by_group_and_empty_sketches():
+    rows = _rows([
+        ("2026-01-05", [f"a{i}" for i in range(500)]),
+        ("2026-01-05", [f"a{i}" for i in range(250, 750)]),
+        ("2026-01-12", []),
+    ])
+    result = count_distinct(rows, "active_registers", "active_ranks", by="metric_date")
+    assert result["metric_date"].tolist() == ["2026-01-05", "2026-01-12"]
+    assert abs(result["estimate"].iloc[0] - 750) <= 3 * HLL_RELATIVE_ERROR * 750
+    assert result["estimate"].iloc[1] == 0
+    assert count_distinct(rows.iloc[2:], "active_registers", "active_ranks") == 0
@@ -0,0 +1,131 @@
+"""Loader call tracking, the ring buffer, the JSON-lines log and summaries."""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import loader_metrics
+from utils.loader_metrics import (
+    METRICS_DEFAULTS,
+    mark_cache,
+    record_result,
+    record_sql,
+    recent_calls,
+    summarize_calls,
+    track_call,
+)
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = dict(METRICS_DEFAULTS)
+    monkeypatch.setattr(loader_metrics, "metrics_settings", lambda: settings)
+    loader_metrics.clear_recent_calls()
+    yield settings
+    loader_metrics.clear_recent_calls()
+
+
+def test_track_call_records_outcome_sql_and_result(settings):
+    frame = pd.DataFrame({"user_id": ["a", "b", "c"]})
+    with track_call("load_users", '{"days": 7}'):
+        mark_cache("miss")
+        record_sql(0.010)
+        record_sql(0.005)
+        record_result(frame)
+
+    call = recent_calls().iloc[-1]
+    assert call["loader"] == "load_users"
+    assert call["params"] == '{"days": 7}'
+    assert call["cache"] == "miss"
+    assert call["queries"] == 2
+    assert call["sql_ms"] == pytest.approx(15, abs=0.01)
+    assert call["rows"] == 3
+    assert call["bytes"] == loader_metrics.result_bytes(frame)
+    assert call["total_ms"] >= 0
+    assert call["error"] is None
+
+
+def test_memory_hits_skip_size_measurement(settings):
+    with track_call("load_users", "{}"):
+        record_result(pd.DataFrame({"user_id": ["a"]}))
+    call = recent_calls().iloc[-1]
+    assert call["cache"] == "memory"
+    assert call["rows"] == 1
+    assert call["bytes"] is None
+
+
+def test_errors_are_recorded_and_reraised(settings):
+    with pytest.raises(ZeroDivisionError):
+        with track_call("load_broken", "{}"):
+            mark_cache("miss")
+            1 / 0
+    assert recent_calls().iloc[-1]["error"] == "ZeroDivisionError"
+
+
+def test_reports_outside_a_call_are_ignored(settings):
+    mark_cache("miss")
+    record_sql(1.0)
+    record_result([1, 2])
+    assert recent_calls().empty
+
+
+def test_disabled(settings):
+    settings["enabled"] = False
+    with track_call("load_users", "{}") as call:
+        mark_cache("miss")
+    assert call is None
+    assert recent_calls().empty
+
+
+def test_ring_buffer_keeps_the_newest_calls(settings):
+    settings["buffer_size"] = 3
+    for i in range(5):
+        with track_call(f"load_{i}", "{}"):
+            pass
+    assert recent_calls()["loader"].tolist() == ["load_2", "load_3", "load_4"]
+
+
+def test_log_keeps_only_slow_calls(settings, tmp_path):
+    settings["log_path"] = str(tmp_path / "calls.jsonl")
+    settings["log_min_ms"] = 50
+    with track_call("load_fast", "{}"):
+        pass
+    with track_call("load_slow", "{}"):
+        time.sleep(0.06)
+
+    with open(settings["log_path"]) as f:
+        logged = [json.loads(line) for line in f]
+    assert [call["loader"] for call in logged] == ["load_slow"]
+    assert logged[0]["total_ms"] >= 50
+    assert loader_metrics.read_call_log(settings["log_path"])["loader"].tolist() == ["load_slow"]
+    assert len(recent_calls()) == 2
+
+
+def test_summarize_calls():
+    rng = np.random.default_rng(10)
+    total = rng.uniform(1, 500, 40)
+    calls = pd.DataFrame({
+        "loader": ["load_a"] * 30 + ["load_b"] * 10,
+        "cache": ["memory"] * 20 + ["miss"] * 10 + ["disk"] * 5 + ["coalesced"] * 5,
+        "total_ms": total,
+        "sql_ms": rng.uniform(0, 100, 40),
+        "rows": [10] * 40,
+        "bytes": [100.0] * 40,
+        "ts": ["2026-10-17T00:00:00+00:00"] * 40,
+    })
+    summary = summarize_calls(calls).set_index("loader")
+
+    assert summary.loc["load_a", "calls"] == 30
+    assert summary.loc["load_a", "miss"] == 10
+    assert summary.loc["load_a", "hit_rate"] == pytest.approx(20 / 30)
+    assert summary.loc["load_b", "hit_rate"] == 1
+    assert summary.loc["load_a", "p50_ms"] == pytest.approx(np.percentile(total[:30], 50))
+    assert summary.loc["load_a", "p95_ms"] == pytest.approx(np.percentile(total[:30], 95))
+    assert summary.loc["load_a", "p95_sql_ms"] == pytest.approx(np.percentile(calls["sql_ms"][20:30], 95))
+    assert np.isnan(summary.loc["load_b", "p50_sql_ms"])
+    assert list(summary.index) == summary.sort_values("p95_ms", ascending=False).index.tolist()
+
+    assert summarize_calls(pd.DataFrame()).empty
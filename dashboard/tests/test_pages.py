@@ -0,0 +1,54 @@
+"""Page rendering checks with the loaders stubbed out (no database)."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+import utils.data_loader
+import utils.filters
+
+
+PAGES = Path(__file__).parent.parent / "pages"
+
+FILTERS = {"start_date": None, "end_date": None, "app_version": None, "activation_week": None}
+
+SPECIFICITY = pd.DataFrame({
+    "prompt_specificity": ["low", "high", "medium"],
+    "avg_save_rate": [0.1, 0.3, 0.2],
+    "avg_cards_generated": [5.0, 7.0, 6.0],
+})
+
+
+def _bar_x(app):
+    """x values of the first bar trace of each plotly chart on the page."""
+    charts = []
+    for chart in app.get("plotly_chart"):
+        for trace in json.loads(chart.proto.figure.spec)["data"]:
+            if trace.get("type") == "bar":
+                charts.append(list(trace["x"]))
+                break
+    return charts
+
+
+def test_prompt_specificity_order(monkeypatch):
+    """Specificity bars read high, medium, low whatever order the rows arrive in."""
+    for name in (
+        "load_prompt_headline_kpis",
+        "load_prompt_action_funnel",
+        "load_prompt_intent_performance",
+        "load_zero_save_trend",
+        "load_zero_save_prompts_detail",
+        "load_reprompting_analysis",
+        "load_pack_performance_top_bottom",
+        "load_dextr_funnel",
+    ):
+        monkeypatch.setattr(utils.data_loader, name, lambda **kwargs: pd.DataFrame())
+    monkeypatch.setattr(utils.data_loader, "load_prompt_specificity", lambda **kwargs: SPECIFICITY.copy())
+    monkeypatch.setattr(utils.filters, "render_sidebar_filters", lambda **kwargs: dict(FILTERS))
+
+    app = AppTest.from_file(str(PAGES / "7_🤖_AI_&_Prompts.py")).run()
+
+    assert not app.exception
+    assert ["high", "medium", "low"] in _bar_x(app)
@@ -0,0 +1,63 @@
+"""run_loaders / prefetch_loaders outside a Streamlit script run."""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from utils import parallel, result_cache
+from utils.result_cache import DiskResultCache, MemoryResultCache, cached_loader, report_loader_error
+
+
+@pytest.fixture(autouse=True)
+def caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(result_cache, "get_memory_cache", lambda: MemoryResultCache(64 << 20))
+    monkeypatch.setattr(result_cache, "get_result_cache", lambda: DiskResultCache(str(tmp_path), 64 << 20))
+    monkeypatch.setattr(result_cache, "current_build_generation", lambda: "build-1")
+    monkeypatch.setattr(parallel, "_pool_capacity", lambda: 4)
+
+
+def test_run_loaders_keeps_order():
+    calls = {"a": (lambda x: x, (1,)), "b": (lambda x, y=0: x + y, (1,), {"y": 2}), "c": lambda: 3}
+    assert parallel.run_loaders(calls) == {"a": 1, "b": 3, "c": 3}
+    assert parallel.run_loaders(list(calls.values())) == [1, 3, 3]
+
+
+def test_run_loaders_reraises_first_failure():
+    def fail(message):
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match="first"):
+        parallel.run_loaders([(fail, ("first",)), lambda: 1, (fail, ("second",))])
+
+
+def test_prefetch_errors_are_logged_once_and_shown_by_the_page(monkeypatch, caplog):
+    shown = []
+    monkeypatch.setattr(
+        result_cache.st, "error", lambda message: shown.append(message) if message.startswith("Error") else None
+    )
+    calls = []
+
+    @cached_loader()
+    def load_totals():
+        calls.append(1)
+        try:
+            raise RuntimeError("relation does not exist")
+        except Exception as e:
+            report_loader_error(f"Error loading totals: {str(e)}")
+            return pd.DataFrame()
+
+    @cached_loader()
+    def load_broken(user_id):
+        raise TypeError("bad signature")
+
+    with caplog.at_level(logging.WARNING):
+        parallel.prefetch_loaders([load_totals, (load_broken, ("u1",))])
+    assert shown == []
+    assert "Error loading totals" in caplog.text
+    assert "Prefetching load_broken failed" in caplog.text
+
+    # The page's own call retries the uncached failure and shows it
+    load_totals()
+    assert shown == ["Error loading totals: relation does not exist"]
+    assert len(calls) == 2
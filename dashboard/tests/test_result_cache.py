@@ -0,0 +1,174 @@
+"""cached_loader and the memory / disk result cache layers."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils import result_cache
+from utils.result_cache import (
+    DiskResultCache,
+    MemoryResultCache,
+    cached_loader,
+    report_loader_error,
+)
+
+
+@pytest.fixture
+def caches(monkeypatch, tmp_path):
+    memory = MemoryResultCache(64 << 20)
+    disk = DiskResultCache(str(tmp_path), 64 << 20)
+    monkeypatch.setattr(result_cache, "get_memory_cache", lambda: memory)
+    monkeypatch.setattr(result_cache, "get_result_cache", lambda: disk)
+    monkeypatch.setattr(result_cache, "current_build_generation", lambda: "build-1")
+    return memory, disk
+
+
+def test_empty_results_are_cached(caches):
+    calls = []
+
+    @cached_loader()
+    def load_cohort(cohort):
+        calls.append(cohort)
+        return pd.DataFrame({"user_id": pd.Series([], dtype=object)})
+
+    assert load_cohort("2026-10-12").empty
+    assert load_cohort("2026-10-12").empty
+    assert calls == ["2026-10-12"]
+
+
+def test_empty_results_survive_the_disk_layer(caches):
+    memory, _ = caches
+    calls = []
+
+    @cached_loader()
+    def load_totals():
+        calls.append(1)
+        return {}
+
+    assert load_totals() == {}
+    memory.clear()
+    assert load_totals() == {}
+    assert len(calls) == 1
+
+
+def test_failed_loads_are_not_cached(caches, monkeypatch):
+    monkeypatch.setattr(result_cache.st, "error", lambda message: None)
+    outcomes = iter([RuntimeError("connection reset"), None])
+
+    @cached_loader()
+    def load_totals():
+        error = next(outcomes)
+        try:
+            if error:
+                raise error
+            return pd.DataFrame({"total": [3]})
+        except Exception as e:
+            report_loader_error(f"Error loading totals: {str(e)}")
+            return pd.DataFrame({"total": [0]})
+
+    assert load_totals()["total"].tolist() == [0]
+    assert load_totals()["total"].tolist() == [3]
+    assert load_totals()["total"].tolist() == [3]
+
+
+def test_report_loader_error_outside_a_loader(monkeypatch):
+    shown = []
+    monkeypatch.setattr(result_cache.st, "error", shown.append)
+    report_loader_error("Error deleting places: boom")
+    assert shown == ["Error deleting places: boom"]
+
+
+def test_disk_round_trip_keeps_dtypes(tmp_path):
+    disk = DiskResultCache(str(tmp_path), 64 << 20)
+    frame = pd.DataFrame({
+        "name": ["a", None],
+        "fast": pd.Series(["x", None], dtype=result_cache.STRING_DTYPE),
+        "kind": pd.Series(["save", "query"], dtype="category"),
+        "n": pd.Series([1, 2], dtype="int32"),
+    })
+    disk.set("k", frame)
+    pd.testing.assert_frame_equal(disk.get("k", None), frame)
+
+
+def test_memory_cache_returns_copies():
+    memory = MemoryResultCache(1 << 20)
+    memory.set("load", "k", pd.DataFrame({"a": [1]}), ttl=60)
+    memory.get("load", "k")["b"] = 2
+    assert list(memory.get("load", "k").columns) == ["a"]
+
+
+@pytest.mark.parametrize("policy, evicted", [("lru", "a"), ("lfu", "b")])
+def test_memory_cache_eviction(policy, evicted):
+    frame = pd.DataFrame({"v": range(1000)})
+    size = result_cache.loader_metrics.result_bytes(frame)
+    memory = MemoryResultCache(size * 2, policy=policy)
+    memory.set("load", "a", frame, ttl=60)
+    memory.get("load", "a")
+    memory.set("load", "b", frame, ttl=60)
+    # Touch b last so LRU keeps it while LFU still ranks a higher by hits
+    memory.get("load", "a")
+    memory.get("load", "b")
+    memory.set("load", "c", frame, ttl=60)
+    kept = {key for key in "abc" if memory.get("load", key) is not result_cache._MISS}
+    assert evicted not in kept and "c" in kept
+    assert memory.resident_bytes <= size * 2
+
+
+def test_memory_cache_expiry():
+    memory = MemoryResultCache(1 << 20)
+    memory.set("load", "k", [1], ttl=0)
+    assert memory.get("load", "k") is result_cache._MISS
+
+
+def test_single_flight(caches):
+    calls = []
+    started = threading.Barrier(6)
+
+    @cached_loader()
+    def load_slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return pd.DataFrame({"a": [1]})
+
+    def call():
+        started.wait()
+        results.append(load_slow())
+
+    results = []
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(results) == 6
+
+
+def test_stale_while_revalidate(caches, monkeypatch):
+    generation = {"token": "build-1"}
+    monkeypatch.setattr(result_cache, "current_build_generation", lambda: generation["token"])
+    calls = []
+
+    @cached_loader(stale_while_revalidate=True)
+    def load_totals():
+        calls.append(generation["token"])
+        time.sleep(0.2)
+        return pd.DataFrame({"build": [generation["token"]]})
+
+    assert load_totals()["build"].tolist() == ["build-1"]
+
+    generation["token"] = "build-2"
+    # Concurrent reruns all get the previous result at once and start a
+    # single background refresh between them
+    started = time.perf_counter()
+    served = [load_totals()["build"].tolist() for _ in range(5)]
+    assert time.perf_counter() - started < 0.2
+    assert served == [["build-1"]] * 5
+
+    deadline = time.time() + 5
+    while result_cache._in_flight and time.time() < deadline:
+        time.sleep(0.01)
+    assert load_totals()["build"].tolist() == ["build-2"]
+    assert calls == ["build-1", "build-2"]
@@ -0,0 +1,87 @@
+"""SessionExtract boundaries against a row-by-row sessionizer."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.sessionize import SessionExtract
+
+
+def _events(rows):
+    return pd.DataFrame(rows, columns=["user_id", "event_timestamp", "event_type", "event_category"])
+
+
+def _brute_force(events, gap_seconds):
+    """Session sizes per user, walking each user's events in time order."""
+    sizes = []
+    events = events.assign(event_timestamp=pd.to_datetime(events["event_timestamp"], utc=True))
+    for _, user_events in events.sort_values(["user_id", "event_timestamp"]).groupby("user_id"):
+        previous = None
+        for ts in user_events["event_timestamp"]:
+            if previous is None or (ts - previous).total_seconds() > gap_seconds:
+                sizes.append(0)
+            sizes[-1] += 1
+            previous = ts
+    return sizes
+
+
+@pytest.mark.parametrize("gap, expected", [("300s", 1), ("300.4s", 2), ("300.000001s", 2)])
+def test_gap_boundary_is_strict_and_sub_second(gap, expected):
+    start = pd.Timestamp("2026-01-05 10:00:00", tz="UTC")
+    events = _events([
+        ("u1", start, "query", "Search"),
+        ("u1", start + pd.Timedelta(gap), "save", "Save"),
+    ])
+    assert len(SessionExtract(events).sessionize(gap_seconds=300)) == expected
+
+
+def test_sub_second_gaps_are_not_floored():
+    """Gaps are measured exactly, not between timestamps floored to seconds."""
+    events = _events([
+        ("u1", "2026-01-05 10:00:00.900", "query", "Search"),
+        ("u1", "2026-01-05 10:05:00.500", "query", "Search"),
+        ("u1", "2026-01-05 10:10:00.900", "query", "Search"),
+    ])
+    sessions = SessionExtract(events).sessionize(gap_seconds=300)
+    assert sessions["event_count"].tolist() == [2, 1]
+    assert sessions["session_duration_seconds"].iloc[0] == pytest.approx(299.6)
+    assert sessions["started_at"].iloc[0] == pd.Timestamp("2026-01-05 10:00:00.900", tz="UTC")
+
+
+def test_users_never_share_a_session():
+    ts = pd.Timestamp("2026-01-05 10:00:00", tz="UTC")
+    events = _events([
+        ("u2", ts, "query", "Search"),
+        ("u1", ts + pd.Timedelta("1s"), "query", "Search"),
+        ("u1", ts, "share", "Share"),
+    ])
+    sessions = SessionExtract(events).sessionize()
+    sessions = sessions.set_index("user_id")
+    assert sessions["event_count"].to_dict() == {"u1": 2, "u2": 1}
+    assert sessions["share_count"].to_dict() == {"u1": 1, "u2": 0}
+
+
+@pytest.mark.parametrize("events", [_events([]), pd.DataFrame()])
+def test_empty_or_failed_extract(events):
+    extract = SessionExtract(events)
+    assert len(extract) == 0
+    assert len(extract.sessionize()) == 0
+    assert extract.summarize()["sessions"] == 0
+
+
+@pytest.mark.parametrize("gap_seconds", [0, 1.5, 60, 300, 1800])
+def test_matches_brute_force(gap_seconds):
+    rng = np.random.default_rng(7)
+    n = 400
+    start = pd.Timestamp("2026-01-05", tz="UTC")
+    events = _events({
+        "user_id": rng.choice(["u1", "u2", "u3", "u4"], n),
+        "event_timestamp": start + pd.to_timedelta(rng.integers(0, 3 * 86_400 * 10**3, n), unit="ms"),
+        "event_type": rng.choice(["query", "swipe_right", "save", "view"], n),
+        "event_category": rng.choice(["Search", "Share"], n),
+    })
+    extract = SessionExtract(events)
+    sessions = extract.sessionize(gap_seconds=gap_seconds)
+    assert sorted(sessions["event_count"]) == sorted(_brute_force(events, gap_seconds))
+    assert sessions["event_count"].sum() == n
+    assert extract.summarize(gap_seconds)["sessions"] == len(sessions)
@@ -0,0 +1,164 @@
+"""Vectorized retention over per-user activity bitmaps.
+
+``fct_user_activity_bitmap`` stores one row per activated user with a bit per
+day since activation (bit i = meaningful activity on activation_date + i).
+``ActivityBitmaps`` unpacks those into a NumPy bit matrix once, after which
+"DN retention for this subset, grouped by that attribute" is a handful of
+array operations instead of another dbt model joining users to sessions:
+
+    bitmaps = ActivityBitmaps(load_user_activity_bitmaps())
+    bitmaps.retention(by="referral_source")
+    bitmaps.retention(by="cohort_week", mask=bitmaps.users["app_version_at_signup"] == "2.4.0")
+
+Definitions match fct_retention_by_cohort_week: retained at DN = any activity
+on days 1..N after activation; mature at DN = the bitmap covers day N.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+RETENTION_DAYS = (7, 30, 60, 90)
+
+
+class ActivityBitmaps:
+    """Bit-packed activity matrix (users x days since activation) plus user attributes.
+
+    Args:
+        frame: rows of fct_user_activity_bitmap. ``activity_bits`` is the
+            bit string ('0101...'); every other column except ``tracked_days``
+            is kept in ``users`` for slicing.
+    """
+
+    def __init__(self, frame):
+        frame = frame.reset_index(drop=True)
+        bits = frame["activity_bits"].fillna("").astype(str)
+        self.tracked_days = frame["tracked_days"].to_numpy(dtype=np.int32)
+        self.n_days = int(bits.str.len().max()) if len(bits) else 0
+
+        # '0'/'1' characters -> uint8 0/1 matrix -> one bit per day per user
+        padded = bits.str.pad(self.n_days, side="right", fillchar="0")
+        raw = np.frombuffer("".join(padded).encode("ascii"), dtype=np.uint8)
+        matrix = (raw.reshape(len(frame), self.n_days) - ord("0")).astype(bool)
+        self.packed = np.packbits(matrix, axis=1)
+
+        # First return day (>= 1) per user, or a sentinel past the matrix
+        # width when the user never came back. DN retention is then
+        # a single comparison.
+        returned = matrix[:, 1:]
+        has_return = returned.any(axis=1)
+        self.first_return_day = np.where(
+            has_return, returned.argmax(axis=1) + 1, np.iinfo(np.int32).max
+        ).astype(np.int32)
+
+        self.users = frame.drop(columns=["activity_bits", "tracked_days"])
+
+    def __len__(self):
+        return len(self.users)
+
+    def _mask(self, mask):
+        """Normalize an optional boolean Series/array subset to a NumPy mask."""
+        if mask is None:
+            return np.ones(len(self), dtype=bool)
+        return np.asarray(mask, dtype=bool)
+
+    def days(self, first_day, last_day):
+        """Unpacked bool matrix of days first_day..last_day (inclusive) for every user."""
+        last_day = min(last_day, self.n_days - 1)
+        if last_day < first_day:
+            return np.zeros((len(self), 0), dtype=bool)
+        block = self.packed[:, first_day // 8 : last_day // 8 + 1]
+        unpacked = np.unpackbits(block, axis=1).astype(bool)
+        offset = first_day - (first_day // 8) * 8
+        return unpacked[:, offset : offset + last_day - first_day + 1]
+
+    def active_between(self, first_day, last_day):
+        """True for users with any activity on days first_day..last_day after activation."""
+        return self.days(first_day, last_day).any(axis=1)
+
+    def is_mature(self, day):
+        """True for users whose bitmap already covers ``day`` days after activation."""
+        return self.tracked_days > day
+
+    def retained_within(self, day):
+        """True for users with activity on days 1..day after activation."""
+        return self.first_return_day <= day
+
+    def retention(self, by=None, mask=None, days=RETENTION_DAYS):
+        """Retention table shaped like fct_retention_by_cohort_week.
+
+        Args:
+            by: user column name, list of names, or None for one overall row.
+            mask: optional boolean Series/array selecting the users to include.
+            days: retention windows to report.
+
+        Returns:
+            DataFrame with the ``by`` columns, cohort_size, and for each N in
+            ``days``: mature_dN, retained_dN and retention_rate_dN (NaN while
+            no user is mature).
+        """
+        keep = self._mask(mask)
+        columns = {"cohort_size": np.ones(len(self), dtype=np.int64)}
+        for day in days:
+            mature = self.is_mature(day)
+            columns[f"mature_d{day}"] = mature.astype(np.int64)
+            columns[f"retained_d{day}"] = (mature & self.retained_within(day)).astype(np.int64)
+        flags = pd.DataFrame(columns)[keep]
+
+        if by is None:
+            result = flags.sum().to_frame().T
+        else:
+            keys = [by] if isinstance(by, str) else list(by)
+            result = flags.join(self.users.loc[keep, keys]).groupby(keys, dropna=False).sum().reset_index()
+
+        for day in days:
+            mature = result[f"mature_d{day}"]
+            result[f"retention_rate_d{day}"] = (result[f"retained_d{day}"] / mature).where(mature > 0)
+        return result
+
+    def retention_curve(self, max_day=90, by=None, mask=None):
+        """Cumulative DN retention for every N in 1..max_day.
+
+        A user counts as retained at every N from their first return day up to
+        the last day their bitmap covers, and as mature at every N below
+        tracked_days. Both are interval counts, so each group's whole curve is
+        two bincounts and a cumulative sum.
+
+        Returns:
+            Long DataFrame with the ``by`` columns, day, mature, retained and
+            retention_rate, one row per (group, day).
+        """
+        keep = self._mask(mask)
+        keys = [] if by is None else ([by] if isinstance(by, str) else list(by))
+        if keys:
+            groups = self.users.groupby(keys, dropna=False).indices.items()
+        else:
+            groups = [((), np.arange(len(self)))]
+
+        day_range = np.arange(1, max_day + 1)
+        width = max_day + 2
+        frames = []
+        for key, rows in groups:
+            rows = rows[keep[rows]]
+            if not len(rows):
+                continue
+            ends = np.minimum(self.tracked_days[rows], max_day + 1)
+            starts = np.minimum(self.first_return_day[rows], max_day + 1)
+            counted = starts < ends
+
+            mature = len(rows) - np.cumsum(np.bincount(ends, minlength=width))[day_range]
+            retained = np.cumsum(
+                np.bincount(starts[counted], minlength=width)
+                - np.bincount(ends[counted], minlength=width)
+            )[day_range]
+
+            frame = pd.DataFrame({"day": day_range, "mature": mature, "retained": retained})
+            for name, value in zip(keys, key if isinstance(key, tuple) else (key,)):
+                frame.insert(len(frame.columns) - 3, name, value)
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=keys + ["day", "mature", "retained", "retention_rate"])
+        curve = pd.concat(frames, ignore_index=True)
+        curve["retention_rate"] = (curve["retained"] / curve["mature"]).where(curve["mature"] > 0)
+        return curve
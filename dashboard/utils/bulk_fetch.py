@@ -0,0 +1,251 @@
+"""Compact DataFrame fetch for large loader extracts.
+
+``pd.read_sql`` pulls every value through the DBAPI cursor as a Python object
+and leaves text columns as object dtype, which is slow for the event extracts
+behind the vectorized engines and heavy to keep in the in-process loader
+cache. ``read_frame`` is the loaders' query helper:
+
+    with get_database_connection().connect() as conn:
+        df = read_frame(conn, query, params, bulk=True, categorical=("event_type",))
+
+Without ``bulk`` it is ``pd.read_sql`` and the frame is returned unchanged;
+pages format, map and sort those frames assuming object text and int64
+columns. With ``bulk=True`` the query is streamed out with ``COPY (query) TO STDOUT``
+as CSV and parsed by Arrow's multithreaded reader, the same path as
+utils.columnar_export, so no Python object is built per value. COPY needs one
+extra round trip to learn the result's column types, so small results are
+better off without it. Results with a column type CSV can't carry faithfully
+(uuid, json, intervals, non-text arrays...) fall back to ``pd.read_sql``.
+
+Bulk frames get compact dtypes, for consumers written against them
+(utils.activity_bitmaps, utils.sessionize, utils.funnels):
+
+- text columns use pandas' Arrow-backed string dtype (NaN for NULL, and
+  comparisons return plain bools, like object columns do);
+- ENUM_COLUMNS and the ``categorical`` columns are categoricals;
+- integer columns without NULLs are int32 when their values fit.
+
+Dates stay ``datetime.date`` objects, timestamps datetime64[ns], numerics
+float64 and text arrays lists, as ``pd.read_sql`` returns them.
+
+Configure with an optional [bulk_fetch] section in .streamlit/secrets.toml
+(see FETCH_DEFAULTS).
+"""
+
+import contextlib
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import psycopg
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import streamlit as st
+from sqlalchemy import bindparam, text
+from sqlalchemy.types import NullType
+
+from . import loader_metrics
+from .columnar_export import ARROW_TYPES, column_expression, csv_convert_options
+
+
+FETCH_DEFAULTS = {
+    # false sends bulk=True loaders through pd.read_sql too, e.g. behind a
+    # pooler that doesn't pass COPY through.
+    "copy": True,
+}
+
+STRING_DTYPE = pd.StringDtype("pyarrow_numpy")
+
+# Low-cardinality enum columns of the gold models, categorical wherever a
+# loader returns them.
+ENUM_COLUMNS = frozenset({
+    "user_archetype",
+    "churn_risk",
+    "intent_strength",
+    "prompt_intent",
+    "prompt_specificity",
+    "performance_category",
+    "device_type",
+    "initiation_surface",
+    "data_source",
+    "session_type",
+})
+
+# psycopg type name -> information_schema data_type (ARROW_TYPES keys) for
+# the result types the COPY path reads
+_COPY_TYPES = {
+    "int2": "smallint",
+    "int4": "integer",
+    "int8": "bigint",
+    "float4": "real",
+    "float8": "double precision",
+    "numeric": "numeric",
+    "bool": "boolean",
+    "date": "date",
+    "timestamp": "timestamp without time zone",
+    "timestamptz": "timestamp with time zone",
+    "text": "text",
+    "varchar": "character varying",
+    "bpchar": "character",
+    "name": "name",
+}
+_TEXT_ARRAY_TYPES = {"_text", "_varchar"}
+
+# Prefixes each element of a text array in COPY output
+_ELEMENT_MARK = "\x1f"
+
+_INT32 = np.iinfo(np.int32)
+
+
+def fetch_settings():
+    """Merge the [bulk_fetch] secrets section over FETCH_DEFAULTS."""
+    settings = dict(FETCH_DEFAULTS)
+    with contextlib.suppress(FileNotFoundError, KeyError):
+        settings.update(st.secrets.get("bulk_fetch", {}))
+    return settings
+
+
+def _timed(cur, sql):
+    """Execute on a raw cursor, charging the time to the current loader call."""
+    started = time.perf_counter()
+    cur.execute(sql)
+    loader_metrics.record_sql(time.perf_counter() - started)
+
+
+def _literal_sql(conn, stmt, params):
+    """``stmt`` as plain SQL with its parameters quoted in by psycopg.
+
+    COPY can't take bind parameters. Parameters stay untyped, as they are when
+    pd.read_sql binds them, so Postgres infers their types the same way.
+    """
+    binds = stmt.compile().binds
+    stmt = stmt.bindparams(*[
+        bindparam(name, params.get(name, bind.value), type_=NullType(), expanding=bind.expanding)
+        for name, bind in binds.items()
+    ])
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    with psycopg.ClientCursor(conn.connection.driver_connection) as cur:
+        return cur.mogrify(compiled.string, compiled.params)
+
+
+def _select_expression(name, type_name):
+    """COPY select-list entry for one result column of the wrapped query."""
+    column = f'bulk_fetch."{name}"'
+    if type_name in _TEXT_ARRAY_TYPES:
+        # Every element prefixed with _ELEMENT_MARK, so {} ('') and {''}
+        # stay distinct after splitting
+        element = f"chr({ord(_ELEMENT_MARK)}) || element"
+        expression = (
+            f"case when {column} is null then null"
+            f" else array_to_string(array(select {element} from unnest({column}) as element), '') end"
+        )
+    else:
+        expression = column_expression(column, _COPY_TYPES[type_name])
+    return f'{expression} as "{name}"'
+
+
+def _copy_frame(conn, stmt, params):
+    """Run ``stmt`` through COPY into a DataFrame, or None if its result can't be copied."""
+    sql = _literal_sql(conn, stmt, params).strip().rstrip(";")
+    raw = conn.connection.driver_connection
+
+    with raw.cursor() as cur:
+        _timed(cur, f"select * from ({sql}) as bulk_fetch limit 0")
+        columns = []
+        for column in cur.description:
+            # Array OIDs resolve to their element type's info
+            info = psycopg.postgres.types.get(column.type_code)
+            if info is None:
+                type_name = None
+            elif info.oid == column.type_code:
+                type_name = info.name
+            else:
+                type_name = f"_{info.name}"
+            columns.append((column.name, type_name))
+
+    names = [name for name, _ in columns]
+    if len(set(names)) < len(names):
+        return None
+    if any(type_name not in _COPY_TYPES and type_name not in _TEXT_ARRAY_TYPES for _, type_name in columns):
+        return None
+
+    select = ", ".join(_select_expression(name, type_name) for name, type_name in columns)
+    buffer = io.BytesIO()
+    started = time.perf_counter()
+    with raw.cursor() as cur, cur.copy(
+        f"COPY (select {select} from ({sql}) as bulk_fetch) TO STDOUT WITH (FORMAT csv)"
+    ) as copy:
+        for chunk in copy:
+            buffer.write(chunk)
+    loader_metrics.record_sql(time.perf_counter() - started)
+
+    schema = pa.schema([
+        (name, ARROW_TYPES.get(_COPY_TYPES.get(type_name), pa.string())) for name, type_name in columns
+    ])
+    if buffer.tell():
+        table = pa_csv.read_csv(
+            pa.BufferReader(buffer.getbuffer()),
+            read_options=pa_csv.ReadOptions(column_names=names),
+            convert_options=csv_convert_options(schema),
+        )
+    else:
+        table = schema.empty_table()
+
+    arrays = [name for name, type_name in columns if type_name in _TEXT_ARRAY_TYPES]
+    frame = table.drop_columns(arrays).to_pandas(
+        types_mapper={pa.string(): STRING_DTYPE}.get,
+        coerce_temporal_nanoseconds=True,
+    )
+    for name in arrays:
+        lists = pc.list_slice(pc.split_pattern(table.column(name), _ELEMENT_MARK), 1)
+        frame[name] = pd.Series(lists.to_pylist(), index=frame.index, dtype=object)
+    return frame[names]
+
+
+def compact_frame(frame, categorical=()):
+    """Shrink ``frame``'s dtypes in place (see the module docstring); returns it."""
+    categorical = ENUM_COLUMNS.union(categorical)
+    for position, name in enumerate(frame.columns):
+        series = frame.iloc[:, position]
+        if series.dtype == object:
+            if pd.api.types.infer_dtype(series, skipna=True) != "string":
+                continue
+            frame.isetitem(position, series.astype("category" if name in categorical else STRING_DTYPE))
+        elif series.dtype == STRING_DTYPE:
+            if name in categorical:
+                frame.isetitem(position, series.astype("category"))
+        elif series.dtype == np.int64 and len(series):
+            if _INT32.min <= series.min() and series.max() <= _INT32.max:
+                frame.isetitem(position, series.astype(np.int32))
+    return frame
+
+
+def read_frame(conn, query, params=None, expanding=(), bulk=False, categorical=()):
+    """Execute a parameterized query and return a DataFrame.
+
+    Args:
+        conn: Connection from get_database_connection().connect().
+        query: SQL string (or text() clause) using :name bind parameters.
+        params: dict of bind values. Keys the query doesn't reference are ignored.
+        expanding: names of list-valued params rendered as IN (...) lists.
+            Empty or missing lists are skipped — loaders only emit the IN
+            clause when the list is non-empty.
+        bulk: fetch through COPY and compact the dtypes; for the large
+            extracts only.
+        categorical: with bulk, text columns to return as categoricals, on
+            top of ENUM_COLUMNS.
+    """
+    params = params or {}
+    stmt = text(query) if isinstance(query, str) else query
+    bound = [bindparam(name, expanding=True) for name in expanding if params.get(name)]
+    if bound:
+        stmt = stmt.bindparams(*bound)
+
+    frame = None
+    if bulk and fetch_settings()["copy"]:
+        frame = _copy_frame(conn, stmt, params)
+    if frame is None:
+        frame = pd.read_sql(stmt, conn, params=params)
+    return compact_frame(frame, categorical) if bulk else frame
@@ -0,0 +1,97 @@
+"""Memory-mapped reader for the local Parquet export (utils.columnar_export).
+
+Heavy exploratory work — analyses/ scripts, verify_* checks, notebooks — can
+read the nightly export instead of querying production Postgres:
+
+    from utils.columnar import read_table
+    events = read_table(
+        "stg_unified_events",
+        columns=["user_id", "event_timestamp", "event_type"],
+        start_date="2026-07-01", end_date="2026-07-31",
+        filter=pc.field("event_type") == "save",
+    )
+
+Files are memory-mapped, so pages are loaded lazily and shared between
+processes through the OS page cache. Month partitions outside the date range
+are skipped without being opened, and column and row filters are pushed down
+to Parquet row groups.
+"""
+
+import json
+import os
+from datetime import date
+
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from .columnar_export import EXPORT_TABLES, MANIFEST_FILE, NULL_PARTITION, export_settings
+
+
+def export_path():
+    """Root directory of the export."""
+    return export_settings()["path"]
+
+
+def export_manifest():
+    """Last export time, partitions and row counts per table ({} before the first export)."""
+    manifest_path = os.path.join(export_path(), MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def dataset(table):
+    """pyarrow Dataset over one exported table, memory-mapped.
+
+    Partitioned tables expose the partition as a string ``month`` column
+    ('YYYY-MM', or 'none' for rows without a date).
+    """
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"table must be one of {sorted(EXPORT_TABLES)}, got {table!r}")
+    root = os.path.join(export_path(), table)
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"{root} does not exist; run python -m utils.columnar_export first")
+    return ds.dataset(
+        root,
+        format="parquet",
+        partitioning="hive" if EXPORT_TABLES[table][1] else None,
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+
+
+def _month(value):
+    return date.fromisoformat(str(value)[:10]).strftime("%Y-%m")
+
+
+def read_table(table, columns=None, start_date=None, end_date=None, filter=None, as_arrow=False):
+    """Read an exported table, optionally limited to a date range.
+
+    Args:
+        table: a key of EXPORT_TABLES.
+        columns: columns to read (default all).
+        start_date, end_date: inclusive bounds on the table's date column
+            (event_date / session_date); ignored for unpartitioned tables.
+            Rows with a null date are excluded when either bound is set.
+        filter: extra pyarrow.compute expression pushed down to the scan.
+        as_arrow: return a pyarrow Table instead of a pandas DataFrame.
+    """
+    data = dataset(table)
+    date_column = EXPORT_TABLES[table][1]
+
+    expression = filter
+    if date_column and (start_date or end_date):
+        bounds = pc.field("month") != NULL_PARTITION
+        if start_date:
+            bounds &= (pc.field("month") >= _month(start_date)) & (
+                pc.field(date_column) >= date.fromisoformat(str(start_date)[:10])
+            )
+        if end_date:
+            bounds &= (pc.field("month") <= _month(end_date)) & (
+                pc.field(date_column) <= date.fromisoformat(str(end_date)[:10])
+            )
+        expression = bounds if expression is None else expression & bounds
+
+    result = data.to_table(columns=columns, filter=expression)
+    return result if as_arrow else result.to_pandas()
@@ -0,0 +1,282 @@
+"""Nightly Parquet export of silver/gold tables for local analysis.
+
+Streams each table out of Postgres with ``COPY ... TO STDOUT`` and rewrites it
+as zstd-compressed Parquet, one file per calendar month of its date column:
+
+    <path>/stg_unified_events/month=2026-07/data.parquet
+    <path>/fct_session_outcomes/month=2026-07/data.parquet
+    <path>/fct_user_segments/data.parquet
+
+Only months that can still change are rewritten on each run: from
+``lookback_days`` before today onward (the same late-data window as the
+incremental dbt models). ``--full`` rewrites everything, e.g. after a dbt
+--full-refresh. Rows with a null date column land in ``month=none``, which is
+rewritten every run.
+
+Run it after the nightly dbt build, from the dashboard directory so
+.streamlit/secrets.toml is picked up:
+
+    python -m utils.columnar_export            # changed months
+    python -m utils.columnar_export --full     # everything
+
+Read the result with utils.columnar. Configure with an optional
+[columnar_export] section in .streamlit/secrets.toml (see EXPORT_DEFAULTS).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, datetime, timezone
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import streamlit as st
+
+from .db_connection import get_database_connection
+
+
+EXPORT_DEFAULTS = {
+    "path": os.path.join(os.path.expanduser("~"), "deck_columnar"),
+    "lookback_days": 3,
+    "compression_level": 3,
+    # CSV bytes parsed per Arrow batch; bounds memory per table.
+    "block_size_mb": 64,
+}
+
+# table -> (schema, date column that picks the monthly partition, or None for
+# a single unpartitioned snapshot)
+EXPORT_TABLES = {
+    "stg_unified_events": ("analytics_prod_silver", "event_date"),
+    "fct_session_outcomes": ("analytics_prod_gold", "session_date"),
+    "fct_user_segments": ("analytics_prod_gold", None),
+}
+
+MANIFEST_FILE = "_manifest.json"
+NULL_PARTITION = "none"
+
+# Postgres column type -> Arrow type parsed from COPY's CSV output. Anything
+# not listed (text, uuid, arrays, json...) is kept as its text form.
+ARROW_TYPES = {
+    "smallint": pa.int64(),
+    "integer": pa.int64(),
+    "bigint": pa.int64(),
+    "numeric": pa.float64(),
+    "real": pa.float64(),
+    "double precision": pa.float64(),
+    "boolean": pa.bool_(),
+    "date": pa.date32(),
+    "timestamp with time zone": pa.timestamp("us", tz="UTC"),
+    "timestamp without time zone": pa.timestamp("us"),
+}
+
+
+def export_settings():
+    """Merge the [columnar_export] secrets section over EXPORT_DEFAULTS."""
+    settings = dict(EXPORT_DEFAULTS)
+    settings.update(st.secrets.get("columnar_export", {}))
+    settings["path"] = os.path.expanduser(settings["path"])
+    return settings
+
+
+def _table_columns(raw, schema, table):
+    """(name, Postgres data type) per column, in table order."""
+    with raw.cursor() as cur:
+        cur.execute(
+            """
+            select column_name, data_type
+            from information_schema.columns
+            where table_schema = %s and table_name = %s
+            order by ordinal_position
+            """,
+            (schema, table),
+        )
+        return cur.fetchall()
+
+
+def column_expression(column, data_type):
+    """Select-list entry for one column: timestamps rendered as ISO 8601 so Arrow parses them exactly.
+
+    ``column`` is an already-quoted column reference, e.g. '"started_at"'.
+    """
+    if data_type == "timestamp with time zone":
+        return f"to_char({column} at time zone 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US\"Z\"')"
+    if data_type == "timestamp without time zone":
+        return f"to_char({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS.US')"
+    return column
+
+
+def csv_convert_options(schema):
+    """Arrow CSV options matching COPY's CSV output for ``schema``."""
+    return pa_csv.ConvertOptions(
+        column_types=schema,
+        true_values=["t"],
+        false_values=["f"],
+        # COPY writes NULL as an unquoted empty field and '' quoted; text
+        # like 'NA' or 'null' is a value, not one of Arrow's default markers
+        null_values=[""],
+        strings_can_be_null=True,
+        quoted_strings_can_be_null=False,
+    )
+
+
+def _select_list(columns):
+    """COPY select list for ``columns``, aliased back to their own names."""
+    parts = []
+    for name, data_type in columns:
+        column = f'"{name}"'
+        expression = column_expression(column, data_type)
+        parts.append(column if expression == column else f"{expression} as {column}")
+    return ", ".join(parts)
+
+
+def _next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _months(raw, schema, table, date_column):
+    """First day of every month between the table's first and last date."""
+    with raw.cursor() as cur:
+        cur.execute(f'select min("{date_column}"), max("{date_column}") from {schema}.{table}')
+        first, last = cur.fetchone()
+    if first is None:
+        return []
+    months, current = [], first.replace(day=1)
+    while current <= last:
+        months.append(current)
+        current = _next_month(current)
+    return months
+
+
+def _copy_to_parquet(raw, query, columns, target, settings):
+    """Stream ``COPY (query)`` into ``target`` as Parquet; returns the row count."""
+    schema = pa.schema([(name, ARROW_TYPES.get(data_type, pa.string())) for name, data_type in columns])
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+
+    csv_fd, csv_path = tempfile.mkstemp(dir=directory, suffix=".csv.tmp")
+    parquet_path = target + ".tmp"
+    try:
+        with os.fdopen(csv_fd, "wb") as out, raw.cursor() as cur:
+            with cur.copy(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)") as copy:
+                for chunk in copy:
+                    out.write(chunk)
+
+        reader = pa_csv.open_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=int(settings["block_size_mb"]) << 20),
+            convert_options=csv_convert_options(schema),
+        )
+        rows = 0
+        with pq.ParquetWriter(
+            parquet_path, schema,
+            compression="zstd", compression_level=int(settings["compression_level"]),
+        ) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        os.replace(parquet_path, target)
+        return rows
+    finally:
+        for path in (csv_path, parquet_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def export_table(table, full=False, settings=None):
+    """Export one table from EXPORT_TABLES; returns {partition: rows written}."""
+    settings = settings or export_settings()
+    schema, date_column = EXPORT_TABLES[table]
+    root = os.path.join(settings["path"], table)
+
+    raw = get_database_connection().raw_connection()
+    try:
+        with raw.cursor() as cur:
+            # One read transaction, so every partition comes from the same
+            # snapshot; large months can outlast the dashboard's statement
+            # timeout. Both reset when the connection goes back to the pool.
+            cur.execute("set transaction isolation level repeatable read, read only")
+            cur.execute("set local statement_timeout = 0")
+
+        columns = _table_columns(raw, schema, table)
+        if not columns:
+            raise RuntimeError(f"{schema}.{table} not found")
+        select = f"select {_select_list(columns)} from {schema}.{table}"
+
+        if date_column is None:
+            return {"": _copy_to_parquet(raw, select, columns, os.path.join(root, "data.parquet"), settings)}
+
+        recent = date.fromordinal(date.today().toordinal() - int(settings["lookback_days"])).replace(day=1)
+        written = {}
+        for month in _months(raw, schema, table, date_column):
+            partition = f"month={month:%Y-%m}"
+            target = os.path.join(root, partition, "data.parquet")
+            if not (full or month >= recent or not os.path.exists(target)):
+                continue
+            query = (
+                f"{select} where \"{date_column}\" >= '{month.isoformat()}'"
+                f" and \"{date_column}\" < '{_next_month(month).isoformat()}'"
+            )
+            written[partition] = _copy_to_parquet(raw, query, columns, target, settings)
+
+        partition = f"month={NULL_PARTITION}"
+        written[partition] = _copy_to_parquet(
+            raw, f'{select} where "{date_column}" is null', columns,
+            os.path.join(root, partition, "data.parquet"), settings,
+        )
+
+        if full:
+            # Drop months the table no longer has
+            for name in os.listdir(root):
+                if name.startswith("month=") and name not in written:
+                    shutil.rmtree(os.path.join(root, name))
+        return written
+    finally:
+        raw.rollback()
+        raw.close()
+
+
+def _write_manifest(path, table, written, seconds):
+    """Record the last export of ``table`` in the manifest next to the data."""
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    manifest[table] = {
+        "exported_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "partitions_written": sorted(written),
+        "rows_written": sum(written.values()),
+        "seconds": round(seconds, 1),
+    }
+    fd, tmp = tempfile.mkstemp(dir=path, suffix=".json.tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, manifest_path)
+
+
+def export_all(tables=None, full=False):
+    """Export every table in EXPORT_TABLES (or ``tables``)."""
+    settings = export_settings()
+    os.makedirs(settings["path"], exist_ok=True)
+    for table in tables or EXPORT_TABLES:
+        started = time.perf_counter()
+        written = export_table(table, full=full, settings=settings)
+        elapsed = time.perf_counter() - started
+        _write_manifest(settings["path"], table, written, elapsed)
+        print(f"{table}: {sum(written.values()):,} rows in {len(written)} file(s), {elapsed:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--full", action="store_true", help="rewrite every partition")
+    parser.add_argument("--tables", nargs="+", choices=sorted(EXPORT_TABLES), help="tables to export")
+    args = parser.parse_args()
+    export_all(tables=args.tables, full=args.full)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,16 @@
 import pandas as pd
 import streamlit as st
 from sqlalchemy import text, bindparam
+from .bulk_fetch import read_frame
 from .db_connection import get_database_connection
+from .result_cache import cached_loader, report_loader_error
+from .hll import HLL_RELATIVE_ERROR, count_distinct
+from .histograms import summarize_histograms
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_executive_summary():
     """Load executive summary metrics"""
-    engine = get_database_connection()
 
     query = """
     SELECT *
@@ -18,22 +21,21 @@ def load_executive_summary():
     LIMIT 1
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_headline_metrics(days=None):
     """Load headline metrics, optionally filtered by days"""
-    engine = get_database_connection()
 
     if days:
-        query = f"""
+        query = """
         SELECT *
         FROM analytics_prod_gold.vis_headline_metrics
-        WHERE metric_date >= current_date - interval '{days} days'
+        WHERE metric_date >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
         ORDER BY metric_date DESC
         """
     else:
@@ -43,103 +45,104 @@ def load_headline_metrics(days=None):
         ORDER BY metric_date DESC
         """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    params = {"days": days}
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query, params)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_active_users(days=90):
     """Load daily active users data"""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT *
     FROM analytics_prod_gold.vis_daily_active_users
-    WHERE activity_date >= current_date - interval '{days} days'
+    WHERE activity_date >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     ORDER BY activity_date DESC
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    params = {"days": days}
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query, params)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_active_users(weeks=12):
     """Load weekly active users data"""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT *
     FROM analytics_prod_gold.vis_weekly_active_users
-    WHERE activity_week >= current_date - interval '{weeks} weeks'
+    WHERE activity_week >= current_date - CAST(:weeks AS integer) * INTERVAL '1 week'
     ORDER BY activity_week DESC
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    params = {"weeks": weeks}
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query, params)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_active_users(months=12):
     """Load monthly active users data"""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT *
     FROM analytics_prod_gold.vis_monthly_active_users
-    WHERE activity_month >= current_date - interval '{months} months'
+    WHERE activity_month >= current_date - CAST(:months AS integer) * INTERVAL '1 month'
     ORDER BY activity_month DESC
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    params = {"months": months}
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query, params)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_user_acquisition_funnel(days=90):
     """Load user acquisition funnel data"""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT *
     FROM analytics_prod_gold.vis_user_acquisition_funnel
-    WHERE signup_date >= current_date - interval '{days} days'
+    WHERE signup_date >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     ORDER BY signup_date DESC
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    params = {"days": days}
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query, params)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_dextr_performance(days=90):
     """Load Dextr AI performance data"""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT *
     FROM analytics_prod_gold.vis_dextr_performance
-    WHERE query_date >= current_date - interval '{days} days'
+    WHERE query_date >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     ORDER BY query_date DESC
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    params = {"days": days}
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query, params)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_supplier_performance():
     """Load supplier performance data.
 
@@ -149,10 +152,9 @@ def load_supplier_performance():
     return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_content_performance():
     """Load content performance data"""
-    engine = get_database_connection()
 
     query = """
     SELECT *
@@ -162,16 +164,15 @@ def load_content_performance():
     LIMIT 100
     """
 
-    with engine.connect() as conn:
-        df = pd.read_sql(text(query), conn)
+    with get_database_connection().connect() as conn:
+        df = _read_sql(conn, query)
 
     return df
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_latest_mau():
     """Load the latest Monthly Active Users (MAU) metric"""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -183,18 +184,17 @@ def load_latest_mau():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading MAU data: {str(e)}")
+        report_loader_error(f"Error loading MAU data: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_latest_wau():
     """Load the latest Weekly Active Users (WAU) metric with growth data"""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -207,18 +207,17 @@ def load_latest_wau():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading WAU data: {str(e)}")
+        report_loader_error(f"Error loading WAU data: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_total_multiplayer_sessions():
     """Load total multiplayer sessions to date from gold layer."""
-    engine = get_database_connection()
 
     query = """
     SELECT total_multiplayer_sessions
@@ -227,18 +226,17 @@ def load_total_multiplayer_sessions():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading multiplayer sessions data: {str(e)}")
+        report_loader_error(f"Error loading multiplayer sessions data: {str(e)}")
         return pd.DataFrame({'total_multiplayer_sessions': [0]})
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_total_decks_created():
     """Load total number of decks (boards) created that are not default"""
-    engine = get_database_connection()
 
     query = """
     SELECT COUNT(*) as total_decks_created
@@ -247,18 +245,17 @@ def load_total_decks_created():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading decks created data: {str(e)}")
+        report_loader_error(f"Error loading decks created data: {str(e)}")
         return pd.DataFrame({'total_decks_created': [0]})
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_referral_metrics():
     """Load referral metrics for Home page from gold layer."""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -267,17 +264,16 @@ def load_referral_metrics():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading referral metrics: {str(e)}")
+        report_loader_error(f"Error loading referral metrics: {str(e)}")
         return pd.DataFrame({'total_referrals_given': [0], 'total_referrals_claimed': [0]})
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_giveaway_metrics():
     """Load giveaway metrics for Home page"""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -286,15 +282,15 @@ def load_giveaway_metrics():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading giveaway metrics: {str(e)}")
+        report_loader_error(f"Error loading giveaway metrics: {str(e)}")
         return pd.DataFrame({'giveaways_claimed': [0]})
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_cohort_retention_monthly(months=12):
     """Load monthly user cohort retention data.
 
@@ -305,28 +301,27 @@ def load_cohort_retention_monthly(months=12):
     return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_north_star_daily(data_source='all', session_type='all', start_date=None, end_date=None, app_version=None):
     """Load daily North Star metrics."""
-    engine = get_database_connection()
 
     conditions = ["1=1"]
     if data_source != 'all':
-        conditions.append(f"data_source = '{data_source}'")
+        conditions.append("data_source = :data_source")
     else:
         conditions.append("data_source = 'all'")
     if session_type != 'all':
-        conditions.append(f"session_type = '{session_type}'")
+        conditions.append("session_type = :session_type")
     else:
         conditions.append("session_type = 'all'")
     if app_version:
-        conditions.append(f"app_version = '{app_version}'")
+        conditions.append("app_version = :app_version")
     else:
         conditions.append("app_version = 'all'")
     if start_date:
-        conditions.append(f"metric_date >= '{start_date}'")
+        conditions.append("metric_date >= :start_date")
     if end_date:
-        conditions.append(f"metric_date <= '{end_date}'")
+        conditions.append("metric_date <= :end_date")
 
     where_clause = " AND ".join(conditions)
     query = f"""
@@ -335,47 +330,94 @@ def load_north_star_daily(data_source='all', session_type='all', start_date=None
     ORDER BY metric_date DESC
     """
 
+    params = {
+        "data_source": data_source,
+        "session_type": session_type,
+        "app_version": app_version,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading North Star daily data: {str(e)}")
+        report_loader_error(f"Error loading North Star daily data: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_north_star_weekly(data_source='all', session_type='all', app_version=None):
     """Load weekly North Star metrics."""
-    engine = get_database_connection()
 
-    av_filter = f"'{app_version}'" if app_version else "'all'"
+    av_filter = ":app_version" if app_version else "'all'"
     query = f"""
     SELECT * FROM analytics_prod_gold.fct_north_star_weekly
-    WHERE data_source = '{data_source}'
-      AND session_type = '{session_type}'
+    WHERE data_source = :data_source
+      AND session_type = :session_type
       AND app_version = {av_filter}
     ORDER BY metric_week DESC
     """
 
+    params = {"app_version": app_version, "data_source": data_source, "session_type": session_type}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading North Star weekly data: {str(e)}")
+        report_loader_error(f"Error loading North Star weekly data: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
-def load_north_star_headline(data_source='all', session_type='all', app_version=None, start_date=None, end_date=None):
-    """Load aggregate headline metrics for the selected period and filters."""
-    engine = get_database_connection()
+def _session_user_conditions(data_source, session_type, app_version, start_date, end_date):
+    """WHERE conditions on fct_session_outcomes for the North Star filters."""
+    conditions = ["1=1"]
+    if data_source != 'all':
+        conditions.append("data_source = :data_source")
+    if session_type == 'prompt':
+        conditions.append("is_prompt_session = true")
+    elif session_type == 'non_prompt':
+        conditions.append("is_prompt_session = false")
+    if app_version:
+        conditions.append("effective_app_version = :app_version")
+    if start_date:
+        conditions.append("session_date >= :start_date")
+    if end_date:
+        conditions.append("session_date <= :end_date")
+    return " AND ".join(conditions)
+
+
+def _base_grain_conditions(data_source, session_type, app_version, start_date, end_date):
+    """The same filters as _session_user_conditions, on the base-grain sketch tables."""
+    conditions = ["1=1"]
+    if data_source != 'all':
+        conditions.append("data_source = :data_source")
+    if session_type != 'all':
+        conditions.append("session_type = :session_type")
+    if app_version:
+        conditions.append("app_version = :app_version")
+    if start_date:
+        conditions.append("metric_date >= :start_date")
+    if end_date:
+        conditions.append("metric_date <= :end_date")
+    return " AND ".join(conditions)
 
-    av_filter = f"'{app_version}'" if app_version else "'all'"
+
+@cached_loader()
+def load_north_star_headline(data_source='all', session_type='all', app_version=None, start_date=None, end_date=None,
+                             exact_unique_users=False):
+    """Load aggregate headline metrics for the selected period and filters.
+
+    Unique active planners is estimated by merging the daily HyperLogLog
+    sketches in fct_active_users_daily_sketch (relative standard error
+    ``unique_active_planners_error``); pass exact_unique_users=True for a
+    COUNT(DISTINCT) over fct_session_outcomes instead.
+    """
+
+    av_filter = ":app_version" if app_version else "'all'"
     date_conditions = ""
     if start_date and end_date:
-        date_conditions = f"AND metric_date >= '{start_date}' AND metric_date <= '{end_date}'"
+        date_conditions = "AND metric_date >= :start_date AND metric_date <= :end_date"
 
     query = f"""
     SELECT
@@ -386,43 +428,46 @@ def load_north_star_headline(data_source='all', session_type='all', app_version=
         COALESCE(SUM(no_value_sessions), 0) as no_value_sessions,
         COALESCE(SUM(genuine_planning_sessions), 0) as genuine_planning_sessions
     FROM analytics_prod_gold.fct_north_star_daily
-    WHERE data_source = '{data_source}'
-      AND session_type = '{session_type}'
+    WHERE data_source = :data_source
+      AND session_type = :session_type
       AND app_version = {av_filter}
       {date_conditions}
     """
 
     # Unique active planners — distinct users with save/share/prompt in the filtered period
-    # Uses fct_session_outcomes so date, data_source, session_type, and app_version filters apply
-    session_conditions = ["1=1"]
-    if data_source != 'all':
-        session_conditions.append(f"data_source = '{data_source}'")
-    if session_type == 'prompt':
-        session_conditions.append("is_prompt_session = true")
-    elif session_type == 'non_prompt':
-        session_conditions.append("is_prompt_session = false")
-    if app_version:
-        session_conditions.append(f"effective_app_version = '{app_version}'")
-    if start_date:
-        session_conditions.append(f"session_date >= '{start_date}'")
-    if end_date:
-        session_conditions.append(f"session_date <= '{end_date}'")
-
-    uap_where = " AND ".join(session_conditions)
-    uap_query = f"""
-    SELECT COUNT(DISTINCT user_id) as unique_active_planners
-    FROM analytics_prod_gold.fct_session_outcomes
-    WHERE {uap_where}
-      AND (has_save OR has_share OR is_prompt_session)
-    """
+    if exact_unique_users:
+        uap_query = f"""
+        SELECT COUNT(DISTINCT user_id) as unique_active_planners
+        FROM analytics_prod_gold.fct_session_outcomes
+        WHERE {_session_user_conditions(data_source, session_type, app_version, start_date, end_date)}
+          AND (has_save OR has_share OR is_prompt_session)
+        """
+    else:
+        uap_query = f"""
+        SELECT planner_registers, planner_ranks
+        FROM analytics_prod_gold.fct_active_users_daily_sketch
+        WHERE {_base_grain_conditions(data_source, session_type, app_version, start_date, end_date)}
+        """
 
+    params = {
+        "app_version": app_version,
+        "start_date": start_date,
+        "end_date": end_date,
+        "data_source": data_source,
+        "session_type": session_type,
+    }
     try:
-        with engine.connect() as conn:
-            agg_df = pd.read_sql(text(query), conn)
-            uap_df = pd.read_sql(text(uap_query), conn)
+        with get_database_connection().connect() as conn:
+            agg_df = _read_sql(conn, query, params)
+            uap_df = _read_sql(conn, uap_query, params)
 
         result = agg_df.iloc[0].to_dict()
-        result['unique_active_planners'] = int(uap_df.iloc[0]['unique_active_planners'])
+        if exact_unique_users:
+            result['unique_active_planners'] = int(uap_df.iloc[0]['unique_active_planners'])
+            result['unique_active_planners_error'] = 0.0
+        else:
+            result['unique_active_planners'] = count_distinct(uap_df, 'planner_registers', 'planner_ranks')
+            result['unique_active_planners_error'] = HLL_RELATIVE_ERROR
 
         total = result['total_sessions']
         result['ssr'] = result['sessions_with_save'] / total if total > 0 else 0
@@ -432,20 +477,130 @@ def load_north_star_headline(data_source='all', session_type='all', app_version=
 
         return result
     except Exception as e:
-        st.error(f"Error loading headline metrics: {str(e)}")
+        report_loader_error(f"Error loading headline metrics: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
+def load_active_users_over_time(grain='week', data_source='all', session_type='all', app_version=None,
+                                start_date=None, end_date=None, exact=False):
+    """Load active users and active planners per day, week or month.
+
+    Counts are estimated by merging fct_active_users_daily_sketch within each
+    period (relative standard error HLL_RELATIVE_ERROR), so any filter
+    combination works without another dbt model. exact=True counts distinct
+    users in fct_session_outcomes instead.
+    """
+
+    if grain not in ('day', 'week', 'month'):
+        raise ValueError(f"grain must be 'day', 'week' or 'month', got {grain!r}")
+
+    if exact:
+        query = f"""
+        SELECT
+            date_trunc(:grain, session_date)::date AS period_start,
+            COUNT(DISTINCT user_id) AS active_users,
+            COUNT(DISTINCT user_id) FILTER (WHERE has_save OR has_share OR is_prompt_session) AS active_planners
+        FROM analytics_prod_gold.fct_session_outcomes
+        WHERE {_session_user_conditions(data_source, session_type, app_version, start_date, end_date)}
+          AND session_date IS NOT NULL
+          AND user_id IS NOT NULL
+        GROUP BY 1
+        ORDER BY 1
+        """
+    else:
+        query = f"""
+        SELECT
+            date_trunc(:grain, metric_date)::date AS period_start,
+            active_registers,
+            active_ranks,
+            planner_registers,
+            planner_ranks
+        FROM analytics_prod_gold.fct_active_users_daily_sketch
+        WHERE {_base_grain_conditions(data_source, session_type, app_version, start_date, end_date)}
+        """
+
+    params = {
+        "grain": grain,
+        "app_version": app_version,
+        "start_date": start_date,
+        "end_date": end_date,
+        "data_source": data_source,
+        "session_type": session_type,
+    }
+    try:
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
+        if exact or df.empty:
+            return df if exact else pd.DataFrame(columns=['period_start', 'active_users', 'active_planners'])
+
+        active = count_distinct(df, 'active_registers', 'active_ranks', by='period_start')
+        planners = count_distinct(df, 'planner_registers', 'planner_ranks', by='period_start')
+        return (
+            active.rename(columns={'estimate': 'active_users'})
+            .merge(planners.rename(columns={'estimate': 'active_planners'}), on='period_start')
+            .sort_values('period_start')
+            .reset_index(drop=True)
+        )
+    except Exception as e:
+        report_loader_error(f"Error loading active users: {str(e)}")
+        return pd.DataFrame()
+
+
+NORTH_STAR_DISTRIBUTIONS = {
+    'ttfs': 'Time to first save (s)',
+    'tts': 'Time to first share (s)',
+    'save_count': 'Saves per session',
+}
+
+
+@cached_loader()
+def load_north_star_distributions(data_source='all', session_type='all', app_version=None, start_date=None,
+                                  end_date=None):
+    """Load p50/p90/p99 of the per-session distributions for the selected period and filters.
+
+    Pools the exact histograms in fct_north_star_daily_sketch, so the
+    quantiles equal percentile_cont over the matching sessions for any date
+    range, without rescanning fct_session_outcomes.
+    """
+
+    columns = ", ".join(f"{m}_values, {m}_counts" for m in NORTH_STAR_DISTRIBUTIONS)
+    query = f"""
+    SELECT {columns}
+    FROM analytics_prod_gold.fct_north_star_daily_sketch
+    WHERE {_base_grain_conditions(data_source, session_type, app_version, start_date, end_date)}
+    """
+
+    params = {
+        "app_version": app_version,
+        "start_date": start_date,
+        "end_date": end_date,
+        "data_source": data_source,
+        "session_type": session_type,
+    }
+    try:
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
+
+        rows = []
+        for metric, label in NORTH_STAR_DISTRIBUTIONS.items():
+            summary = summarize_histograms(df[f"{metric}_values"], df[f"{metric}_counts"])
+            rows.append({'metric': metric, 'label': label, **summary})
+        return pd.DataFrame(rows)
+    except Exception as e:
+        report_loader_error(f"Error loading session distributions: {str(e)}")
+        return pd.DataFrame()
+
+
+@cached_loader()
 def load_psr_ladder_current(data_source='all', session_type='all', days=30, app_version=None, start_date=None, end_date=None):
     """Load current PSR ladder metrics for funnel visualization."""
-    engine = get_database_connection()
 
-    av_filter = f"'{app_version}'" if app_version else "'all'"
+    av_filter = ":app_version" if app_version else "'all'"
     if start_date and end_date:
-        date_filter = f"metric_date >= '{start_date}' AND metric_date <= '{end_date}'"
+        date_filter = "metric_date >= :start_date AND metric_date <= :end_date"
     else:
-        date_filter = f"metric_date >= current_date - interval '{days} days'"
+        date_filter = "metric_date >= current_date - CAST(:days AS integer) * INTERVAL '1 day'"
     query = f"""
     SELECT
         COALESCE(SUM(total_sessions), 0) as total_sessions,
@@ -457,8 +612,8 @@ def load_psr_ladder_current(data_source='all', session_type='all', days=30, app_
         COALESCE(SUM(no_value_sessions), 0) as no_value_sessions,
         COALESCE(SUM(genuine_planning_sessions), 0) as genuine_planning_sessions
     FROM analytics_prod_gold.fct_north_star_daily
-    WHERE data_source = '{data_source}'
-      AND session_type = '{session_type}'
+    WHERE data_source = :data_source
+      AND session_type = :session_type
       AND app_version = {av_filter}
       AND {date_filter}
     """
@@ -472,36 +627,43 @@ def load_psr_ladder_current(data_source='all', session_type='all', days=30, app_
         prompt_query = f"""
         SELECT COALESCE(SUM(total_sessions), 0) as sessions_with_prompt
         FROM analytics_prod_gold.fct_north_star_daily
-        WHERE data_source = '{data_source}'
+        WHERE data_source = :data_source
           AND session_type = 'prompt'
           AND app_version = {av_filter}
           AND {date_filter}
         """
 
+    params = {
+        "app_version": app_version,
+        "start_date": start_date,
+        "end_date": end_date,
+        "days": days,
+        "data_source": data_source,
+        "session_type": session_type,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
             if session_type == 'prompt':
                 df['sessions_with_prompt'] = df['total_sessions']
             elif session_type == 'non_prompt':
                 df['sessions_with_prompt'] = 0
             else:
-                prompt_df = pd.read_sql(text(prompt_query), conn)
+                prompt_df = _read_sql(conn, prompt_query, params)
                 df['sessions_with_prompt'] = int(prompt_df.iloc[0]['sessions_with_prompt']) if not prompt_df.empty else 0
         return df
     except Exception as e:
-        st.error(f"Error loading PSR ladder: {str(e)}")
+        report_loader_error(f"Error loading PSR ladder: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_activation_funnel_data(data_source='all', session_type='all', start_date=None, end_date=None):
     """Load activation funnel data, filtered by signup date range and session filters."""
-    engine = get_database_connection()
 
     session_conditions = []
     if data_source != 'all':
-        session_conditions.append(f"s.data_source = '{data_source}'")
+        session_conditions.append("s.data_source = :data_source")
     if session_type == 'prompt':
         session_conditions.append("s.is_prompt_session = true")
     elif session_type == 'non_prompt':
@@ -513,11 +675,11 @@ def load_activation_funnel_data(data_source='all', session_type='all', start_dat
 
     user_date_filter = ""
     if start_date and end_date:
-        user_date_filter = f"WHERE u.signup_date >= '{start_date}' AND u.signup_date <= '{end_date}'"
+        user_date_filter = "WHERE u.signup_date >= :start_date AND u.signup_date <= :end_date"
     elif start_date:
-        user_date_filter = f"WHERE u.signup_date >= '{start_date}'"
+        user_date_filter = "WHERE u.signup_date >= :start_date"
     elif end_date:
-        user_date_filter = f"WHERE u.signup_date <= '{end_date}'"
+        user_date_filter = "WHERE u.signup_date <= :end_date"
 
     # Always use the filtered query approach so we can apply both session and date filters
     query = f"""
@@ -571,27 +733,27 @@ def load_activation_funnel_data(data_source='all', session_type='all', start_dat
     FROM user_activity
     """
 
+    params = {"data_source": data_source, "start_date": start_date, "end_date": end_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading activation funnel: {str(e)}")
+        report_loader_error(f"Error loading activation funnel: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_signup_to_activation_funnel(start_date=None, end_date=None):
     """Load signup-to-activation funnel from fct_signup_to_activation_funnel."""
-    engine = get_database_connection()
 
     date_filter = "1=1"
     if start_date and end_date:
-        date_filter = f"signup_week >= '{start_date}' AND signup_week <= '{end_date}'"
+        date_filter = "signup_week >= :start_date AND signup_week <= :end_date"
     elif start_date:
-        date_filter = f"signup_week >= '{start_date}'"
+        date_filter = "signup_week >= :start_date"
     elif end_date:
-        date_filter = f"signup_week <= '{end_date}'"
+        date_filter = "signup_week <= :end_date"
 
     query = f"""
     SELECT
@@ -604,19 +766,19 @@ def load_signup_to_activation_funnel(start_date=None, end_date=None):
     WHERE {date_filter}
     """
 
+    params = {"start_date": start_date, "end_date": end_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading signup-to-activation funnel: {str(e)}")
+        report_loader_error(f"Error loading signup-to-activation funnel: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_retention_activated_summary():
     """Load retention summary for activated users."""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -630,18 +792,17 @@ def load_retention_activated_summary():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading retention data: {str(e)}")
+        report_loader_error(f"Error loading retention data: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_active_planners_trend():
     """Load WAP/MAP trend data."""
-    engine = get_database_connection()
 
     query = """
     SELECT * FROM analytics_prod_gold.fct_active_planners
@@ -649,18 +810,17 @@ def load_active_planners_trend():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading active planners: {str(e)}")
+        report_loader_error(f"Error loading active planners: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_available_app_versions():
     """Get list of app versions from the release schedule seed, descending."""
-    engine = get_database_connection()
 
     query = """
     SELECT app_version
@@ -669,8 +829,8 @@ def load_available_app_versions():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df['app_version'].tolist()
     except Exception:
         # Fallback: return known versions if seed table not available
@@ -678,14 +838,13 @@ def load_available_app_versions():
                 '1.9', '1.8', '1.7', '1.6', '1.5', '1.4', '1.3', '1.2', '1.1', '1.0']
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_app_versions_with_dates():
     """Get app versions with release dates for display in filters.
 
     Returns:
         dict: Mapping of display label (e.g., "2.6 (Jan 27, 2026)") to version (e.g., "2.6")
     """
-    engine = get_database_connection()
 
     query = """
     SELECT app_version, release_date
@@ -694,8 +853,8 @@ def load_app_versions_with_dates():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
 
         # Create display labels with release date
         version_map = {}
@@ -712,7 +871,7 @@ def load_app_versions_with_dates():
         return {v: v for v in fallback_versions}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_retention_summary_metrics():
     """Load summary metrics for monthly retention performance.
 
@@ -727,10 +886,9 @@ def load_monthly_retention_summary_metrics():
 # Activation & Retention Dashboard Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_user_activation():
     """Load user-level activation data from fct_user_activation."""
-    engine = get_database_connection()
 
     query = """
     SELECT *
@@ -739,15 +897,15 @@ def load_user_activation():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading user activation data: {str(e)}")
+        report_loader_error(f"Error loading user activation data: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_retention_by_cohort_week(start_date=None, end_date=None):
     """Load weekly cohort retention summary from fct_retention_by_cohort_week.
 
@@ -755,13 +913,12 @@ def load_retention_by_cohort_week(start_date=None, end_date=None):
         start_date: Optional start date filter (inclusive)
         end_date: Optional end date filter (inclusive)
     """
-    engine = get_database_connection()
 
     where_clauses = []
     if start_date:
-        where_clauses.append(f"cohort_week >= '{start_date}'")
+        where_clauses.append("cohort_week >= :start_date")
     if end_date:
-        where_clauses.append(f"cohort_week <= '{end_date}'")
+        where_clauses.append("cohort_week <= :end_date")
 
     where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
@@ -772,16 +929,17 @@ def load_retention_by_cohort_week(start_date=None, end_date=None):
     ORDER BY cohort_week DESC
     """
 
+    params = {"start_date": start_date, "end_date": end_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading retention by cohort week: {str(e)}")
+        report_loader_error(f"Error loading retention by cohort week: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_signup_activation_funnel(start_date=None, end_date=None):
     """Load signup to activation funnel data from fct_signup_to_activation_funnel.
 
@@ -789,13 +947,12 @@ def load_signup_activation_funnel(start_date=None, end_date=None):
         start_date: Optional start date filter (inclusive)
         end_date: Optional end date filter (inclusive)
     """
-    engine = get_database_connection()
 
     where_clauses = []
     if start_date:
-        where_clauses.append(f"signup_week >= '{start_date}'")
+        where_clauses.append("signup_week >= :start_date")
     if end_date:
-        where_clauses.append(f"signup_week <= '{end_date}'")
+        where_clauses.append("signup_week <= :end_date")
 
     where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
@@ -806,34 +963,34 @@ def load_signup_activation_funnel(start_date=None, end_date=None):
     ORDER BY signup_week DESC
     """
 
+    params = {"start_date": start_date, "end_date": end_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading signup activation funnel: {str(e)}")
+        report_loader_error(f"Error loading signup activation funnel: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_activation_summary_metrics(start_date=None, end_date=None):
     """Load activation and retention summary metrics, optionally filtered by date range."""
-    engine = get_database_connection()
 
     # Build WHERE clauses for activation (by signup_date)
     activation_where_clauses = []
     if start_date:
-        activation_where_clauses.append(f"signup_date >= '{start_date}'")
+        activation_where_clauses.append("signup_date >= :start_date")
     if end_date:
-        activation_where_clauses.append(f"signup_date <= '{end_date}'")
+        activation_where_clauses.append("signup_date <= :end_date")
     activation_where = f"WHERE {' AND '.join(activation_where_clauses)}" if activation_where_clauses else ""
 
     # Build WHERE clauses for retention (by cohort_week)
     retention_where_clauses = []
     if start_date:
-        retention_where_clauses.append(f"cohort_week >= '{start_date}'")
+        retention_where_clauses.append("cohort_week >= :start_date")
     if end_date:
-        retention_where_clauses.append(f"cohort_week <= '{end_date}'")
+        retention_where_clauses.append("cohort_week <= :end_date")
     retention_where = f"WHERE {' AND '.join(retention_where_clauses)}" if retention_where_clauses else ""
 
     query = f"""
@@ -894,19 +1051,19 @@ def load_activation_summary_metrics(start_date=None, end_date=None):
     CROSS JOIN retention_metrics r
     """
 
+    params = {"start_date": start_date, "end_date": end_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading activation summary metrics: {str(e)}")
+        report_loader_error(f"Error loading activation summary metrics: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_activation_type_distribution():
     """Load distribution of activation types."""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -920,18 +1077,17 @@ def load_activation_type_distribution():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading activation type distribution: {str(e)}")
+        report_loader_error(f"Error loading activation type distribution: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_time_to_activation_distribution():
     """Load time to activation distribution for histogram."""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -946,18 +1102,17 @@ def load_time_to_activation_distribution():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading time to activation distribution: {str(e)}")
+        report_loader_error(f"Error loading time to activation distribution: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_retention_by_activation_type():
     """Load retention rates broken down by activation type."""
-    engine = get_database_connection()
 
     query = """
     WITH user_retention AS (
@@ -999,20 +1154,19 @@ def load_retention_by_activation_type():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading retention by activation type: {str(e)}")
+        report_loader_error(f"Error loading retention by activation type: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_worst_performing_cohorts(limit=10):
     """Load worst performing cohorts for investigation."""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT
         cohort_week,
         cohort_size,
@@ -1026,22 +1180,22 @@ def load_worst_performing_cohorts(limit=10):
     WHERE mature_d7 >= 5  -- Only cohorts with enough users
       AND retention_rate_d7 IS NOT NULL
     ORDER BY retention_rate_d7 ASC
-    LIMIT {limit}
+    LIMIT :limit
     """
 
+    params = {"limit": limit}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading worst performing cohorts: {str(e)}")
+        report_loader_error(f"Error loading worst performing cohorts: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_homepage_totals():
     """Load all homepage metrics from gold_homepage_totals (single row)."""
-    engine = get_database_connection()
 
     query = """
     SELECT *
@@ -1050,11 +1204,11 @@ def load_homepage_totals():
     """
 
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading homepage totals: {str(e)}")
+        report_loader_error(f"Error loading homepage totals: {str(e)}")
         return pd.DataFrame()
 
 
@@ -1062,10 +1216,9 @@ def load_homepage_totals():
 # Onboarding Analytics Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_onboarding_funnel_summary():
     """Load daily onboarding summary from onboarding_daily_summary."""
-    engine = get_database_connection()
 
     query = """
     SELECT *
@@ -1074,15 +1227,15 @@ def load_onboarding_funnel_summary():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading onboarding funnel summary: {str(e)}")
+        report_loader_error(f"Error loading onboarding funnel summary: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_onboarding_funnel_current(start_date=None, end_date=None, app_version=None):
     """Load current overall funnel totals for headline metrics.
 
@@ -1091,15 +1244,14 @@ def load_onboarding_funnel_current(start_date=None, end_date=None, app_version=N
         end_date: Optional end date filter (inclusive)
         app_version: Optional app version filter
     """
-    engine = get_database_connection()
 
     conditions = ["1=1"]
     if start_date:
-        conditions.append(f"onboarding_date >= '{start_date}'::date")
+        conditions.append("onboarding_date >= CAST(:start_date AS date)")
     if end_date:
-        conditions.append(f"onboarding_date <= '{end_date}'::date")
+        conditions.append("onboarding_date <= CAST(:end_date AS date)")
     if app_version:
-        conditions.append(f"app_version = '{app_version}'")
+        conditions.append("app_version = :app_version")
 
     where_clause = " AND ".join(conditions)
 
@@ -1140,21 +1292,21 @@ def load_onboarding_funnel_current(start_date=None, end_date=None, app_version=N
     WHERE {where_clause}
     """
 
+    params = {"start_date": start_date, "end_date": end_date, "app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading onboarding funnel current: {str(e)}")
+        report_loader_error(f"Error loading onboarding funnel current: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_onboarding_user_journeys(limit=100):
     """Load individual user onboarding journeys."""
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT
         user_id,
         signup_date,
@@ -1175,22 +1327,22 @@ def load_onboarding_user_journeys(limit=100):
         feature_selected
     FROM analytics_prod_gold.fct_onboarding_funnel
     ORDER BY onboarding_date DESC
-    LIMIT {limit}
+    LIMIT :limit
     """
 
+    params = {"limit": limit}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading onboarding user journeys: {str(e)}")
+        report_loader_error(f"Error loading onboarding user journeys: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_onboarding_feature_distribution():
     """Load distribution of feature selections during onboarding."""
-    engine = get_database_connection()
 
     query = """
     SELECT
@@ -1203,15 +1355,15 @@ def load_onboarding_feature_distribution():
     """
 
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading feature distribution: {str(e)}")
+        report_loader_error(f"Error loading feature distribution: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_onboarding_time_distribution(start_date=None, end_date=None, app_version=None):
     """Load time to complete distribution for histogram.
 
@@ -1220,7 +1372,6 @@ def load_onboarding_time_distribution(start_date=None, end_date=None, app_versio
         end_date: Optional end date filter (inclusive)
         app_version: Optional app version filter
     """
-    engine = get_database_connection()
 
     conditions = [
         "completed_onboarding = true",
@@ -1229,11 +1380,11 @@ def load_onboarding_time_distribution(start_date=None, end_date=None, app_versio
         "time_to_complete_seconds <= 3600"  # Cap at 1 hour
     ]
     if start_date:
-        conditions.append(f"onboarding_date >= '{start_date}'::date")
+        conditions.append("onboarding_date >= CAST(:start_date AS date)")
     if end_date:
-        conditions.append(f"onboarding_date <= '{end_date}'::date")
+        conditions.append("onboarding_date <= CAST(:end_date AS date)")
     if app_version:
-        conditions.append(f"app_version = '{app_version}'")
+        conditions.append("app_version = :app_version")
 
     where_clause = " AND ".join(conditions)
 
@@ -1244,25 +1395,25 @@ def load_onboarding_time_distribution(start_date=None, end_date=None, app_versio
     WHERE {where_clause}
     """
 
+    params = {"start_date": start_date, "end_date": end_date, "app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading time distribution: {str(e)}")
+        report_loader_error(f"Error loading time distribution: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_onboarding_completion_rate_prior_7d(app_version=None):
     """Load completion rate for the prior 7-day period for delta comparison.
 
     Args:
         app_version: Optional app version filter
     """
-    engine = get_database_connection()
 
-    app_version_filter = f"AND app_version = '{app_version}'" if app_version else ""
+    app_version_filter = "AND app_version = :app_version" if app_version else ""
 
     query = f"""
     WITH recent_period AS (
@@ -1293,61 +1444,81 @@ def load_onboarding_completion_rate_prior_7d(app_version=None):
     FROM recent_period r, prior_period p
     """
 
+    params = {"app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading prior period completion rate: {str(e)}")
+        report_loader_error(f"Error loading prior period completion rate: {str(e)}")
         return pd.DataFrame()
 
 
 # ============================================================================
 # SQL Filter Helpers
+#
+# Filter values are never inlined into SQL text. Clauses reference bound
+# parameters (:start_date, :end_date, :app_version, :activation_week, ...) and
+# each loader passes the matching params dict to _read_sql. The query text then
+# only varies with which filters are set, so psycopg can reuse its server-side
+# prepared statement across reruns and sidebar values can't inject SQL.
+# (bulk=True loaders are the exception: COPY takes no parameters, so psycopg
+# quotes the values into the statement client-side.)
 # ============================================================================
 
+def _read_sql(conn, query, params=None, expanding=(), bulk=False, categorical=()):
+    """Execute a parameterized query and return a DataFrame.
+
+    See utils.bulk_fetch.read_frame for the arguments. bulk=True is for the
+    large extracts feeding the vectorized engines (utils.activity_bitmaps,
+    utils.sessionize, utils.funnels): they come back through COPY with compact
+    dtypes. Every other loader gets pd.read_sql's frame unchanged.
+    """
+    return read_frame(conn, query, params, expanding=expanding, bulk=bulk, categorical=categorical)
+
+
 def _build_date_clause(column, start_date, end_date):
-    """Build date range WHERE clause."""
+    """Build date range WHERE clause bound to :start_date / :end_date."""
     parts = []
     if start_date:
-        parts.append(f"{column} >= '{start_date}'")
+        parts.append(f"{column} >= :start_date")
     if end_date:
-        parts.append(f"{column} <= '{end_date}'")
+        parts.append(f"{column} <= :end_date")
     return " AND ".join(parts) if parts else "1=1"
 
 
 def _build_app_version_clause(column, app_version):
-    """Build app version WHERE clause."""
+    """Build app version WHERE clause bound to :app_version."""
     if app_version:
-        return f"{column} = '{app_version}'"
+        return f"{column} = :app_version"
     return "1=1"
 
 
 def _build_activation_week_clause(column, activation_week):
-    """Build activation cohort week WHERE clause."""
+    """Build activation cohort week WHERE clause bound to :activation_week."""
     if activation_week:
-        return f"{column} = '{activation_week}'"
+        return f"{column} = :activation_week"
     return "1=1"
 
 
 def _build_data_source_clause(data_source):
     """Build data source WHERE clause for fct_north_star_daily."""
     if data_source and data_source != 'all':
-        return f"data_source = '{data_source}'"
+        return "data_source = :data_source"
     return "data_source = 'all'"
 
 
 def _build_session_type_clause(session_type):
     """Build session type WHERE clause for fct_north_star_daily."""
     if session_type and session_type != 'all':
-        return f"session_type = '{session_type}'"
+        return "session_type = :session_type"
     return "session_type = 'all'"
 
 
 def _build_ns_app_version_clause(app_version):
     """Build app version clause for fct_north_star_daily (uses 'all' default)."""
     if app_version:
-        return f"app_version = '{app_version}'"
+        return "app_version = :app_version"
     return "app_version = 'all'"
 
 
@@ -1355,10 +1526,9 @@ def _build_ns_app_version_clause(app_version):
 # Home Page — New Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_growth_snapshot():
     """Load DAU/WAU/MAU with growth deltas for Home page."""
-    engine = get_database_connection()
     query = """
     SELECT 'dau' as metric,
            daily_active_users as value,
@@ -1381,39 +1551,38 @@ def load_growth_snapshot():
     ORDER BY activity_month DESC LIMIT 1
     """
     try:
-        with engine.connect() as conn:
-            dau = pd.read_sql(text(query), conn)
-            wau = pd.read_sql(text(query_wau), conn)
-            mau = pd.read_sql(text(query_mau), conn)
+        with get_database_connection().connect() as conn:
+            dau = _read_sql(conn, query)
+            wau = _read_sql(conn, query_wau)
+            mau = _read_sql(conn, query_mau)
         return pd.concat([dau, wau, mau], ignore_index=True)
     except Exception as e:
-        st.error(f"Error loading growth snapshot: {str(e)}")
+        report_loader_error(f"Error loading growth snapshot: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_dau_sparkline(days=30):
     """Load last N days of DAU for sparkline on Home page."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     SELECT activity_date, daily_active_users
     FROM analytics_prod_gold.vis_daily_active_users
-    WHERE activity_date >= current_date - {days}
+    WHERE activity_date >= current_date - CAST(:days AS integer)
     ORDER BY activity_date
     """
+    params = {"days": days}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading DAU sparkline: {str(e)}")
+        report_loader_error(f"Error loading DAU sparkline: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_weekly_health_comparison():
     """Load this week vs last week PSR ladder metrics for Home page."""
-    engine = get_database_connection()
     query = """
     WITH this_week AS (
         SELECT
@@ -1449,18 +1618,17 @@ def load_weekly_health_comparison():
     FROM this_week tw, last_week lw
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly health comparison: {str(e)}")
+        report_loader_error(f"Error loading weekly health comparison: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader(stale_while_revalidate=True)
 def load_top_places_this_week():
     """Load top 5 places saved this week for Home page."""
-    engine = get_database_connection()
     query = """
     SELECT place_name, category, saves_last_7d,
            ROUND(save_rate * 100, 1) as save_rate_pct
@@ -1470,11 +1638,11 @@ def load_top_places_this_week():
     LIMIT 5
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading top places: {str(e)}")
+        report_loader_error(f"Error loading top places: {str(e)}")
         return pd.DataFrame()
 
 
@@ -1482,10 +1650,9 @@ def load_top_places_this_week():
 # Page 1: North Star — Session Diagnostics Loader
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_session_diagnostics(start_date=None, end_date=None, app_version=None):
     """Load session diagnostics aggregated by week."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('session_date', start_date, end_date)
     av_clause = _build_app_version_clause('effective_app_version', app_version)
 
@@ -1505,12 +1672,13 @@ def load_session_diagnostics(start_date=None, end_date=None, app_version=None):
     GROUP BY session_week
     ORDER BY session_week
     """
+    params = {"start_date": start_date, "end_date": end_date, "app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading session diagnostics: {str(e)}")
+        report_loader_error(f"Error loading session diagnostics: {str(e)}")
         return pd.DataFrame()
 
 
@@ -1518,10 +1686,9 @@ def load_session_diagnostics(start_date=None, end_date=None, app_version=None):
 # Page 2: Engagement — Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_engagement_trajectory_weekly(start_date=None, end_date=None, activation_week=None):
     """Load weekly engagement trajectory aggregated across users."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('activity_week', start_date, end_date)
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
@@ -1539,19 +1706,19 @@ def load_engagement_trajectory_weekly(start_date=None, end_date=None, activation
     GROUP BY activity_week
     ORDER BY activity_week
     """
+    params = {"start_date": start_date, "end_date": end_date, "activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading engagement trajectory: {str(e)}")
+        report_loader_error(f"Error loading engagement trajectory: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_session_depth_weekly(start_date=None, end_date=None, activation_week=None):
     """Load weekly session depth metrics."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('activity_week', start_date, end_date)
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
@@ -1567,19 +1734,19 @@ def load_session_depth_weekly(start_date=None, end_date=None, activation_week=No
     GROUP BY activity_week
     ORDER BY activity_week
     """
+    params = {"start_date": start_date, "end_date": end_date, "activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading session depth: {str(e)}")
+        report_loader_error(f"Error loading session depth: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_engagement_quality_weekly(start_date=None, end_date=None, activation_week=None):
     """Load session quality composition per week."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('activity_week', start_date, end_date)
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
@@ -1596,19 +1763,19 @@ def load_engagement_quality_weekly(start_date=None, end_date=None, activation_we
     GROUP BY activity_week
     ORDER BY activity_week
     """
+    params = {"start_date": start_date, "end_date": end_date, "activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading engagement quality: {str(e)}")
+        report_loader_error(f"Error loading engagement quality: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_swipe_to_save_weekly(start_date=None, end_date=None, activation_week=None):
     """Load swipe-to-save conversion rate by week."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('activity_week', start_date, end_date)
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
@@ -1623,19 +1790,19 @@ def load_swipe_to_save_weekly(start_date=None, end_date=None, activation_week=No
     GROUP BY activity_week
     ORDER BY activity_week
     """
+    params = {"start_date": start_date, "end_date": end_date, "activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading swipe-to-save: {str(e)}")
+        report_loader_error(f"Error loading swipe-to-save: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_engagement_cohort_heatmap():
     """Load engagement by cohort heatmap data."""
-    engine = get_database_connection()
     query = """
     SELECT
         activation_week,
@@ -1649,11 +1816,11 @@ def load_engagement_cohort_heatmap():
     ORDER BY activation_week, weeks_since_activation
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading engagement cohort heatmap: {str(e)}")
+        report_loader_error(f"Error loading engagement cohort heatmap: {str(e)}")
         return pd.DataFrame()
 
 
@@ -1661,10 +1828,9 @@ def load_engagement_cohort_heatmap():
 # Page 3: Users & Cohorts — Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_archetype_distribution(activation_week=None):
     """Load user archetype distribution."""
-    engine = get_database_connection()
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
     query = f"""
@@ -1678,19 +1844,19 @@ def load_archetype_distribution(activation_week=None):
     GROUP BY user_archetype
     ORDER BY user_count DESC
     """
+    params = {"activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading archetype distribution: {str(e)}")
+        report_loader_error(f"Error loading archetype distribution: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_top_users(sort_by='total_saves', activation_week=None, limit=15):
     """Load top users by a specified metric."""
-    engine = get_database_connection()
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
     allowed_sorts = {'total_saves', 'total_sessions', 'total_shares'}
     sort_col = sort_by if sort_by in allowed_sorts else 'total_saves'
@@ -1703,21 +1869,21 @@ def load_top_users(sort_by='total_saves', activation_week=None, limit=15):
     WHERE is_activated = true
       AND {aw_clause}
     ORDER BY {sort_col} DESC
-    LIMIT {limit}
+    LIMIT :limit
     """
+    params = {"limit": limit, "activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading top users: {str(e)}")
+        report_loader_error(f"Error loading top users: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_activation_summary(activation_week=None):
     """Load activation analysis summary."""
-    engine = get_database_connection()
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
     query = f"""
@@ -1733,40 +1899,39 @@ def load_activation_summary(activation_week=None):
     WHERE is_activated = true
       AND {aw_clause}
     """
+    params = {"activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading activation summary: {str(e)}")
+        report_loader_error(f"Error loading activation summary: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_cohort_quality_table():
     """Load full cohort quality table."""
-    engine = get_database_connection()
     query = """
     SELECT * FROM analytics_prod_gold.fct_cohort_quality
     ORDER BY activation_week DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading cohort quality: {str(e)}")
+        report_loader_error(f"Error loading cohort quality: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_churned_user_profile_summary():
     """Aggregate distributions of churned users.
 
     Returns three dataframes in one call is overkill; we return the raw
     per-user table and aggregate in the dashboard. Keeps the SQL simple.
     """
-    engine = get_database_connection()
     query = """
     SELECT
         user_id,
@@ -1782,18 +1947,17 @@ def load_churned_user_profile_summary():
     FROM analytics_prod_gold.fct_churned_user_profile
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading churned user profile summary: {str(e)}")
+        report_loader_error(f"Error loading churned user profile summary: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_churned_user_profile_detail(limit: int = 50):
     """Top N most-recently-churned users with their profile."""
-    engine = get_database_connection()
     query = """
     SELECT
         user_id,
@@ -1812,18 +1976,17 @@ def load_churned_user_profile_detail(limit: int = 50):
     LIMIT :limit
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn, params={"limit": int(limit)})
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, {"limit": int(limit)})
         return df
     except Exception as e:
-        st.error(f"Error loading churned user profile detail: {str(e)}")
+        report_loader_error(f"Error loading churned user profile detail: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_cohort_retention_floor():
     """Per-cohort fitted retention floor + tau."""
-    engine = get_database_connection()
     query = """
     SELECT
         f.cohort_week,
@@ -1843,22 +2006,21 @@ def load_cohort_retention_floor():
     ORDER BY f.cohort_week ASC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading cohort retention floor: {str(e)}")
+        report_loader_error(f"Error loading cohort retention floor: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_retention_by_connectivity():
     """Retention curves by group-membership bucket at acquisition.
 
     Aggregates across all mature cohorts to produce one row per
     connectivity_bucket with summary counts and rates.
     """
-    engine = get_database_connection()
     query = """
     SELECT
         connectivity_bucket,
@@ -1885,15 +2047,46 @@ def load_retention_by_connectivity():
     END
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading retention by connectivity: {str(e)}")
+        report_loader_error(f"Error loading retention by connectivity: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
+def load_user_activity_bitmaps():
+    """Per-user activity bitmaps and slicing attributes for utils.activity_bitmaps.
+
+    One row per activated user; activity_bits is returned as a '0101...'
+    string (bit i = meaningful activity on activation_date + i).
+    """
+    query = """
+    SELECT
+        user_id::text AS user_id,
+        activation_date,
+        cohort_week,
+        activation_type,
+        referral_source,
+        activation_trigger,
+        first_prompt_intent,
+        app_version_at_signup,
+        connectivity_bucket,
+        tracked_days,
+        activity_bits::text AS activity_bits
+    FROM analytics_prod_gold.fct_user_activity_bitmap
+    """
+    try:
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, bulk=True)
+        return df
+    except Exception as e:
+        report_loader_error(f"Error loading user activity bitmaps: {str(e)}")
+        return pd.DataFrame()
+
+
+@cached_loader()
 def load_engagement_frequency_distribution(snapshot_months: list | None = None):
     """Days-active-in-week distribution per calendar month.
 
@@ -1901,17 +2094,8 @@ def load_engagement_frequency_distribution(snapshot_months: list | None = None):
     return all months. The model emits one row per (snapshot_month,
     days_active_bucket) with bucket in 0..7.
     """
-    engine = get_database_connection()
-    if snapshot_months:
-        # Cast to strings so pandas sends them as dates
-        placeholders = ", ".join(
-            f":m{i}" for i in range(len(snapshot_months))
-        )
-        params = {f"m{i}": m for i, m in enumerate(snapshot_months)}
-        where = f"WHERE snapshot_month IN ({placeholders})"
-    else:
-        params = {}
-        where = ""
+    where = "WHERE snapshot_month IN :snapshot_months" if snapshot_months else ""
+    params = {"snapshot_months": snapshot_months}
     query = f"""
     SELECT
         snapshot_month,
@@ -1925,15 +2109,53 @@ def load_engagement_frequency_distribution(snapshot_months: list | None = None):
     ORDER BY snapshot_month DESC, days_active_bucket ASC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn, params=params)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params, expanding=("snapshot_months",))
+        return df
+    except Exception as e:
+        report_loader_error(f"Error loading engagement frequency distribution: {str(e)}")
+        return pd.DataFrame()
+
+
+@cached_loader()
+def load_session_event_extract(start_date=None, end_date=None):
+    """Per-event extract for utils.sessionize.SessionExtract.
+
+    user_id, event_timestamp, event_type and event_category from
+    stg_unified_events in [start_date, end_date] (default: last 30 days),
+    the inputs stg_unified_sessions sessionizes. Text columns are returned
+    as categoricals to keep multi-million-row extracts small.
+    """
+    conditions = ["user_id IS NOT NULL"]
+    if start_date:
+        conditions.append("event_date >= :start_date")
+    else:
+        conditions.append("event_date >= current_date - 30")
+    if end_date:
+        conditions.append("event_date <= :end_date")
+
+    query = f"""
+    SELECT
+        user_id::text AS user_id,
+        event_timestamp,
+        event_type,
+        event_category
+    FROM analytics_prod_silver.stg_unified_events
+    WHERE {" AND ".join(conditions)}
+    """
+    params = {"start_date": start_date, "end_date": end_date}
+    try:
+        with get_database_connection().connect() as conn:
+            df = _read_sql(
+                conn, query, params, bulk=True, categorical=('user_id', 'event_type', 'event_category')
+            )
         return df
     except Exception as e:
-        st.error(f"Error loading engagement frequency distribution: {str(e)}")
+        report_loader_error(f"Error loading session event extract: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_retention_by_acquisition_attribute(attribute_name: str, min_cohort_size: int = 10):
     """Retention curves split by a single acquisition attribute.
 
@@ -1941,7 +2163,6 @@ def load_retention_by_acquisition_attribute(attribute_name: str, min_cohort_size
                       'first_prompt_intent', 'app_version_at_signup'}.
     The min_cohort_size gate filters out noisy tiny slices at read time.
     """
-    engine = get_database_connection()
     query = """
     SELECT
         cohort_week,
@@ -1958,19 +2179,19 @@ def load_retention_by_acquisition_attribute(attribute_name: str, min_cohort_size
     ORDER BY cohort_week DESC, attribute_value
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(
-                text(query),
+        with get_database_connection().connect() as conn:
+            df = _read_sql(
                 conn,
-                params={"attribute_name": attribute_name, "min_cohort_size": min_cohort_size},
+                query,
+                {"attribute_name": attribute_name, "min_cohort_size": min_cohort_size},
             )
         return df
     except Exception as e:
-        st.error(f"Error loading retention by acquisition attribute: {str(e)}")
+        report_loader_error(f"Error loading retention by acquisition attribute: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_organic_vs_referred_weekly():
     """Weekly organic-vs-referred acquisition mix and D30 retention.
 
@@ -1978,7 +2199,6 @@ def load_organic_vs_referred_weekly():
     Used by the Conversion & Viral page to show the network-effect signals
     called out in the EQT coverage audit.
     """
-    engine = get_database_connection()
     query = """
     SELECT
         activation_week,
@@ -1990,18 +2210,17 @@ def load_organic_vs_referred_weekly():
     ORDER BY activation_week ASC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading organic-vs-referred weekly: {str(e)}")
+        report_loader_error(f"Error loading organic-vs-referred weekly: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_retention_heatmap_data():
     """Load retention data for heatmap."""
-    engine = get_database_connection()
     query = """
     SELECT
         cohort_week,
@@ -2023,18 +2242,17 @@ def load_retention_heatmap_data():
     ORDER BY cohort_week DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading retention heatmap: {str(e)}")
+        report_loader_error(f"Error loading retention heatmap: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_churn_analysis(activation_week=None):
     """Load churn analysis metrics."""
-    engine = get_database_connection()
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
     query = f"""
@@ -2047,19 +2265,19 @@ def load_churn_analysis(activation_week=None):
     WHERE is_churned = true
       AND {aw_clause}
     """
+    params = {"activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading churn analysis: {str(e)}")
+        report_loader_error(f"Error loading churn analysis: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_churn_risk_distribution(activation_week=None):
     """Load churn risk distribution."""
-    engine = get_database_connection()
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
     query = f"""
@@ -2069,19 +2287,19 @@ def load_churn_risk_distribution(activation_week=None):
     GROUP BY churn_risk
     ORDER BY CASE churn_risk WHEN 'high' THEN 1 WHEN 'medium' THEN 2 WHEN 'low' THEN 3 ELSE 4 END
     """
+    params = {"activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading churn risk distribution: {str(e)}")
+        report_loader_error(f"Error loading churn risk distribution: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_planner_vs_passenger(activation_week=None):
     """Load planner vs passenger comparison."""
-    engine = get_database_connection()
     aw_clause = _build_activation_week_clause('activation_week', activation_week)
 
     query = f"""
@@ -2098,12 +2316,13 @@ def load_planner_vs_passenger(activation_week=None):
       AND {aw_clause}
     GROUP BY CASE WHEN is_planner THEN 'Planner' ELSE 'Passenger' END
     """
+    params = {"activation_week": activation_week}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading planner vs passenger: {str(e)}")
+        report_loader_error(f"Error loading planner vs passenger: {str(e)}")
         return pd.DataFrame()
 
 
@@ -2111,10 +2330,9 @@ def load_planner_vs_passenger(activation_week=None):
 # Page 4: AI & Prompts — Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_prompt_headline_kpis(start_date=None, end_date=None, app_version=None, activation_week=None):
     """Load prompt headline KPIs."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
     aw_clause = _build_activation_week_clause('user_activation_week', activation_week)
@@ -2132,19 +2350,24 @@ def load_prompt_headline_kpis(start_date=None, end_date=None, app_version=None,
       AND {av_clause}
       AND {aw_clause}
     """
+    params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "app_version": app_version,
+        "activation_week": activation_week,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading prompt KPIs: {str(e)}")
+        report_loader_error(f"Error loading prompt KPIs: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_prompt_action_funnel(start_date=None, end_date=None, app_version=None, activation_week=None):
     """Load prompt-to-action funnel."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
     aw_clause = _build_activation_week_clause('user_activation_week', activation_week)
@@ -2161,19 +2384,24 @@ def load_prompt_action_funnel(start_date=None, end_date=None, app_version=None,
       AND {av_clause}
       AND {aw_clause}
     """
+    params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "app_version": app_version,
+        "activation_week": activation_week,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading prompt funnel: {str(e)}")
+        report_loader_error(f"Error loading prompt funnel: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_prompt_intent_performance(start_date=None, end_date=None, app_version=None, activation_week=None):
     """Load prompt performance by intent."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
     aw_clause = _build_activation_week_clause('user_activation_week', activation_week)
@@ -2193,19 +2421,24 @@ def load_prompt_intent_performance(start_date=None, end_date=None, app_version=N
     GROUP BY COALESCE(prompt_intent, 'unknown')
     ORDER BY prompt_count DESC
     """
+    params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "app_version": app_version,
+        "activation_week": activation_week,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading prompt intent performance: {str(e)}")
+        report_loader_error(f"Error loading prompt intent performance: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_prompt_specificity(start_date=None, end_date=None, app_version=None, activation_week=None):
     """Load prompt specificity analysis."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
     aw_clause = _build_activation_week_clause('user_activation_week', activation_week)
@@ -2224,19 +2457,24 @@ def load_prompt_specificity(start_date=None, end_date=None, app_version=None, ac
       AND {aw_clause}
     GROUP BY prompt_specificity
     """
+    params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "app_version": app_version,
+        "activation_week": activation_week,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading prompt specificity: {str(e)}")
+        report_loader_error(f"Error loading prompt specificity: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_zero_save_trend(start_date=None, end_date=None, app_version=None):
     """Load zero-save prompt trend by week."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
 
@@ -2252,19 +2490,19 @@ def load_zero_save_trend(start_date=None, end_date=None, app_version=None):
     GROUP BY DATE_TRUNC('week', query_date)::date
     ORDER BY prompt_week
     """
+    params = {"start_date": start_date, "end_date": end_date, "app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading zero-save trend: {str(e)}")
+        report_loader_error(f"Error loading zero-save trend: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_zero_save_prompts_detail(start_date=None, end_date=None, app_version=None, limit=20):
     """Load most common zero-save prompts."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
 
@@ -2280,21 +2518,26 @@ def load_zero_save_prompts_detail(start_date=None, end_date=None, app_version=No
       AND {av_clause}
     GROUP BY query_text
     ORDER BY occurrences DESC
-    LIMIT {limit}
+    LIMIT :limit
     """
+    params = {
+        "limit": limit,
+        "start_date": start_date,
+        "end_date": end_date,
+        "app_version": app_version,
+    }
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading zero-save prompts: {str(e)}")
+        report_loader_error(f"Error loading zero-save prompts: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_reprompting_analysis(start_date=None, end_date=None, app_version=None):
     """Load re-prompting analysis."""
-    engine = get_database_connection()
     date_clause = _build_date_clause('query_date', start_date, end_date)
     av_clause = _build_app_version_clause('app_version', app_version)
 
@@ -2310,30 +2553,30 @@ def load_reprompting_analysis(start_date=None, end_date=None, app_version=None):
       AND {av_clause}
     GROUP BY CASE WHEN total_prompts_in_session > 1 THEN '2+ prompts' ELSE '1 prompt' END
     """
+    params = {"start_date": start_date, "end_date": end_date, "app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading re-prompting analysis: {str(e)}")
+        report_loader_error(f"Error loading re-prompting analysis: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_pack_performance_top_bottom():
     """Load top and bottom packs by save rate."""
-    engine = get_database_connection()
     query = """
     SELECT * FROM analytics_prod_gold.fct_pack_performance
     WHERE total_cards_generated >= 3
     ORDER BY save_rate DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading pack performance: {str(e)}")
+        report_loader_error(f"Error loading pack performance: {str(e)}")
         return pd.DataFrame()
 
 
@@ -2341,10 +2584,9 @@ def load_pack_performance_top_bottom():
 # Page 5: Content & Places — Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_distinct_categories():
     """Get distinct categories from fct_place_performance."""
-    engine = get_database_connection()
     query = """
     SELECT DISTINCT category
     FROM analytics_prod_gold.fct_place_performance
@@ -2352,18 +2594,17 @@ def load_distinct_categories():
     ORDER BY category
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df['category'].tolist()
     except Exception:
         return []
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_content_overview_kpis(categories=None):
     """Load content overview KPIs."""
-    engine = get_database_connection()
-    cat_filter = f"AND category = ANY(ARRAY{categories})" if categories else ""
+    cat_filter = "AND category IN :categories" if categories else ""
 
     query = f"""
     SELECT
@@ -2375,22 +2616,23 @@ def load_content_overview_kpis(categories=None):
     FROM analytics_prod_gold.fct_place_performance
     WHERE 1=1 {cat_filter}
     """
+    params = {"categories": categories}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params, expanding=("categories",))
         return df
     except Exception as e:
-        st.error(f"Error loading content KPIs: {str(e)}")
+        report_loader_error(f"Error loading content KPIs: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_top_places(categories=None, min_impressions=1, limit=20, sort_by='save_rate', sort_order='DESC'):
     """Load top performing places."""
-    engine = get_database_connection()
-    cat_filter = f"AND category = ANY(ARRAY{categories})" if categories else ""
+    cat_filter = "AND category IN :categories" if categories else ""
     allowed_sorts = {'save_rate', 'total_impressions', 'total_saves', 'right_swipe_rate'}
     sort_col = sort_by if sort_by in allowed_sorts else 'save_rate'
+    sort_dir = 'ASC' if str(sort_order).upper() == 'ASC' else 'DESC'
 
     query = f"""
     SELECT place_name, category, neighborhood, total_impressions,
@@ -2398,25 +2640,25 @@ def load_top_places(categories=None, min_impressions=1, limit=20, sort_by='save_
            ROUND(right_swipe_rate * 100, 1) as swipe_rate_pct,
            total_saves, viral_score, rating
     FROM analytics_prod_gold.fct_place_performance
-    WHERE total_impressions >= {min_impressions}
+    WHERE total_impressions >= :min_impressions
       {cat_filter}
-    ORDER BY {sort_col} {sort_order}
-    LIMIT {limit}
+    ORDER BY {sort_col} {sort_dir}
+    LIMIT :limit
     """
+    params = {"categories": categories, "min_impressions": min_impressions, "limit": limit}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params, expanding=("categories",))
         return df
     except Exception as e:
-        st.error(f"Error loading top places: {str(e)}")
+        report_loader_error(f"Error loading top places: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_bad_recommendations(categories=None):
     """Load places with high impressions but low saves."""
-    engine = get_database_connection()
-    cat_filter = f"AND category = ANY(ARRAY{categories})" if categories else ""
+    cat_filter = "AND category IN :categories" if categories else ""
 
     query = f"""
     SELECT place_name, category, neighborhood, total_impressions,
@@ -2427,19 +2669,19 @@ def load_bad_recommendations(categories=None):
     ORDER BY total_impressions DESC
     LIMIT 20
     """
+    params = {"categories": categories}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params, expanding=("categories",))
         return df
     except Exception as e:
-        st.error(f"Error loading bad recommendations: {str(e)}")
+        report_loader_error(f"Error loading bad recommendations: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_category_performance():
     """Load category-level performance."""
-    engine = get_database_connection()
     query = """
     SELECT
         category,
@@ -2455,18 +2697,17 @@ def load_category_performance():
     ORDER BY total_impressions DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading category performance: {str(e)}")
+        report_loader_error(f"Error loading category performance: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_neighborhood_performance():
     """Load neighborhood-level performance."""
-    engine = get_database_connection()
     query = """
     SELECT
         neighborhood,
@@ -2483,18 +2724,17 @@ def load_neighborhood_performance():
     ORDER BY total_impressions DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading neighborhood performance: {str(e)}")
+        report_loader_error(f"Error loading neighborhood performance: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_price_level_performance():
     """Load price level performance."""
-    engine = get_database_connection()
     query = """
     SELECT
         price_level,
@@ -2508,18 +2748,17 @@ def load_price_level_performance():
     ORDER BY price_level
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading price level performance: {str(e)}")
+        report_loader_error(f"Error loading price level performance: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_viral_content():
     """Load top viral content."""
-    engine = get_database_connection()
     query = """
     SELECT place_name, category, viral_score, total_saves, total_shares,
            ROUND(save_rate * 100, 1) as save_rate_pct
@@ -2529,19 +2768,18 @@ def load_viral_content():
     LIMIT 10
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading viral content: {str(e)}")
+        report_loader_error(f"Error loading viral content: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_scatter_data(categories=None):
     """Load data for impressions vs saves scatter plot."""
-    engine = get_database_connection()
-    cat_filter = f"AND category = ANY(ARRAY{categories})" if categories else ""
+    cat_filter = "AND category IN :categories" if categories else ""
 
     query = f"""
     SELECT place_name, category, neighborhood, rating,
@@ -2550,12 +2788,13 @@ def load_scatter_data(categories=None):
     WHERE total_impressions >= 3
       {cat_filter}
     """
+    params = {"categories": categories}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params, expanding=("categories",))
         return df
     except Exception as e:
-        st.error(f"Error loading scatter data: {str(e)}")
+        report_loader_error(f"Error loading scatter data: {str(e)}")
         return pd.DataFrame()
 
 
@@ -2563,10 +2802,9 @@ def load_scatter_data(categories=None):
 # Page 6: Conversion & Viral — Data Loaders
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_conversion_overview():
     """Load conversion signals overview."""
-    engine = get_database_connection()
     query = """
     SELECT
         COUNT(*) as total_conversions,
@@ -2577,18 +2815,17 @@ def load_conversion_overview():
     FROM analytics_prod_gold.fct_conversion_signals
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading conversion overview: {str(e)}")
+        report_loader_error(f"Error loading conversion overview: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_conversion_context():
     """Load conversion context metrics."""
-    engine = get_database_connection()
     query = """
     SELECT
         COUNT(*) as total,
@@ -2598,18 +2835,17 @@ def load_conversion_context():
     FROM analytics_prod_gold.fct_conversion_signals
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading conversion context: {str(e)}")
+        report_loader_error(f"Error loading conversion context: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_conversion_by_category():
     """Load conversions by place category."""
-    engine = get_database_connection()
     query = """
     SELECT
         COALESCE(place_category, 'Unknown') as place_category,
@@ -2619,18 +2855,17 @@ def load_conversion_by_category():
     ORDER BY conversion_count DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading conversion by category: {str(e)}")
+        report_loader_error(f"Error loading conversion by category: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_viral_loop_summary():
     """Load viral loop summary metrics."""
-    engine = get_database_connection()
     query = """
     SELECT
         COUNT(*) as total_shares,
@@ -2641,18 +2876,17 @@ def load_viral_loop_summary():
     FROM analytics_prod_gold.fct_viral_loop
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading viral loop summary: {str(e)}")
+        report_loader_error(f"Error loading viral loop summary: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_viral_loop_detail():
     """Load viral loop detail table."""
-    engine = get_database_connection()
     query = """
     SELECT share_link_id, share_type, sharer_archetype,
            unique_viewers, viewers_who_signed_up,
@@ -2662,14 +2896,55 @@ def load_viral_loop_detail():
     ORDER BY unique_viewers DESC
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading viral loop detail: {str(e)}")
+        report_loader_error(f"Error loading viral loop detail: {str(e)}")
         return pd.DataFrame()
 
 
+# ============================================================================
+# Report Cube
+# ============================================================================
+#
+# Event metrics for the Daily / Weekly / Monthly Report page read
+# analytics_prod_gold.fct_report_event_cube: event counts pre-aggregated to
+# (event_date, user, event_type, event_category, place, card categories) with
+# test users already excluded. A day, week or month is an event_date range, so
+# every cadence filters the same indexed column instead of scanning
+# stg_unified_events with DATE(event_timestamp). The Daily, Weekly and
+# Monthly loaders below all roll the cube up through _report_rollup_sql.
+
+REPORT_GRAINS = ("day", "week", "month")
+
+
+def _report_rollup_sql(grain, range_start, range_end):
+    """SELECT rolling the report cube up to one row per grain bucket.
+
+    range_start / range_end are SQL date expressions (typically bound params)
+    bounding event_date inclusively. Output columns: period_start,
+    active_users, total_events, saves, prompts, total_swipes, right_swipes,
+    shares.
+    """
+    if grain not in REPORT_GRAINS:
+        raise ValueError(f"grain must be one of {REPORT_GRAINS}, got {grain!r}")
+    return f"""
+        SELECT
+            date_trunc('{grain}', e.event_date)::date AS period_start,
+            COUNT(DISTINCT e.user_id)::bigint AS active_users,
+            SUM(e.event_count)::bigint AS total_events,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left')), 0)::bigint AS total_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS right_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_category = 'Share'), 0)::bigint AS shares
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date BETWEEN {range_start} AND {range_end}
+        GROUP BY 1
+    """
+
+
 # ============================================================================
 # Daily Page Loaders (CEO Daily Report)
 # ============================================================================
@@ -2678,10 +2953,11 @@ def load_viral_loop_detail():
 # single day (with the exception of the 7-day trend and weekly intensity
 # loaders, which return a rolling window ending on report_date).
 #
-# Test users are excluded in every loader via join to stg_users.is_test_user = 0.
+# Event metrics come from the report cube, which already excludes test users;
+# signup and onboarding counts join stg_users.is_test_user = 0 directly.
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_topline_kpis(report_date):
     """Load the 8 top-line KPI tiles for the Daily page.
 
@@ -2689,33 +2965,30 @@ def load_daily_topline_kpis(report_date):
       new_signups, dau, total_swipes, total_right_swipes, like_rate,
       saves, prompts, onboarding_completed, total_events
     """
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH signups AS (
         SELECT COUNT(*)::bigint AS new_signups
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) = DATE '{report_date}'
+          AND DATE(created_at) = CAST(:report_date AS date)
     ),
     event_tallies AS (
         SELECT
             COUNT(DISTINCT e.user_id)::bigint AS dau,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS total_swipes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS total_right_swipes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*)::bigint AS total_events
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) = DATE '{report_date}'
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left')), 0)::bigint AS total_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS total_right_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count), 0)::bigint AS total_events
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date = CAST(:report_date AS date)
     ),
     onboarding AS (
         SELECT COUNT(*)::bigint AS onboarding_completed
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
           AND onboarding_completed = true
-          AND DATE(created_at) = DATE '{report_date}'
+          AND DATE(created_at) = CAST(:report_date AS date)
     )
     SELECT
         s.new_signups,
@@ -2733,26 +3006,26 @@ def load_daily_topline_kpis(report_date):
     CROSS JOIN event_tallies e
     CROSS JOIN onboarding o
     """
+    params = {"report_date": report_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         if df.empty:
             return {}
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading daily topline KPIs: {str(e)}")
+        report_loader_error(f"Error loading daily topline KPIs: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_7day_trend(report_date):
     """Return the 7 days ending on report_date with DAU, new_signups, total_events, saves, prompts, swipes."""
-    engine = get_database_connection()
     query = f"""
     WITH days AS (
         SELECT generate_series(
-            DATE '{report_date}' - INTERVAL '6 days',
-            DATE '{report_date}',
+            CAST(:report_date AS date) - INTERVAL '6 days',
+            CAST(:report_date AS date),
             INTERVAL '1 day'
         )::date AS day
     ),
@@ -2760,28 +3033,14 @@ def load_daily_7day_trend(report_date):
         SELECT DATE(created_at) AS day, COUNT(*)::bigint AS new_signups
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) BETWEEN DATE '{report_date}' - 6 AND DATE '{report_date}'
+          AND DATE(created_at) BETWEEN CAST(:report_date AS date) - 6 AND CAST(:report_date AS date)
         GROUP BY DATE(created_at)
     ),
-    events AS (
-        SELECT
-            DATE(e.event_timestamp) AS day,
-            COUNT(DISTINCT e.user_id)::bigint AS dau,
-            COUNT(*)::bigint AS total_events,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS total_swipes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS right_swipes
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{report_date}' - 6 AND DATE '{report_date}'
-        GROUP BY DATE(e.event_timestamp)
-    )
+    events AS ({_report_rollup_sql("day", "CAST(:report_date AS date) - 6", "CAST(:report_date AS date)")})
     SELECT
         d.day,
         COALESCE(s.new_signups, 0) AS new_signups,
-        COALESCE(e.dau, 0) AS dau,
+        COALESCE(e.active_users, 0) AS dau,
         COALESCE(e.total_events, 0) AS total_events,
         COALESCE(e.saves, 0) AS saves,
         COALESCE(e.prompts, 0) AS prompts,
@@ -2791,19 +3050,20 @@ def load_daily_7day_trend(report_date):
              ELSE NULL END AS like_rate
     FROM days d
     LEFT JOIN signups s ON s.day = d.day
-    LEFT JOIN events e ON e.day = d.day
+    LEFT JOIN events e ON e.period_start = d.day
     ORDER BY d.day
     """
+    params = {"report_date": report_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading 7-day trend: {str(e)}")
+        report_loader_error(f"Error loading 7-day trend: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_activation_checklist(report_date):
     """Activation checklist funnel for the cohort of users who signed up on report_date.
 
@@ -2821,13 +3081,12 @@ def load_daily_activation_checklist(report_date):
         new_signups, deck_created, places_saved, multiplayer_started, all_three,
         stuck_no_deck, stuck_at_saves, stuck_at_mp
     """
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH cohort AS (
         SELECT user_id
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) = DATE '{report_date}'
+          AND DATE(created_at) = CAST(:report_date AS date)
     ),
     task_events AS (
         SELECT
@@ -2860,27 +3119,27 @@ def load_daily_activation_checklist(report_date):
         )::bigint AS stuck_at_mp
     FROM task_events
     """
+    params = {"report_date": report_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         if df.empty:
             return {}
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading daily activation checklist: {str(e)}")
+        report_loader_error(f"Error loading daily activation checklist: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_new_signups_status(report_date):
     """Per-user onboarding & checklist status for users who signed up on report_date."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH cohort AS (
         SELECT user_id, email, username, full_name, onboarding_completed
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) = DATE '{report_date}'
+          AND DATE(created_at) = CAST(:report_date AS date)
     ),
     task_events AS (
         SELECT
@@ -2906,16 +3165,17 @@ def load_daily_new_signups_status(report_date):
     LEFT JOIN task_events te ON c.user_id = te.user_id
     ORDER BY all_three DESC, deck_created DESC, places_saved DESC, display_name
     """
+    params = {"report_date": report_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading new signups status: {str(e)}")
+        report_loader_error(f"Error loading new signups status: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_category_popularity(report_date):
     """Category-level likes/dislikes for swipes on report_date.
 
@@ -2923,84 +3183,62 @@ def load_daily_category_popularity(report_date):
     to multiple categories, so a single swipe can count in multiple rows —
     this matches how category-level reporting is done elsewhere in the app.
     """
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH swipes AS (
         SELECT
-            e.card_id,
-            e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) = DATE '{report_date}'
+            e.drinks_card_rows, e.dining_card_rows, e.entertainment_card_rows,
+            e.culture_card_rows, e.adventure_card_rows, e.health_card_rows,
+            e.event_type,
+            e.event_count
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date = CAST(:report_date AS date)
           AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    joined AS (
-        SELECT
-            c.is_drinks, c.is_dining, c.is_entertainment,
-            c.is_culture, c.is_adventure, c.is_health,
-            s.event_type
-        FROM swipes s
-        INNER JOIN analytics_prod_silver.stg_cards c ON c.card_id = s.card_id
     ),
     unpivoted AS (
-        SELECT 'Drinks' AS category, event_type FROM joined WHERE is_drinks
-        UNION ALL SELECT 'Dining', event_type FROM joined WHERE is_dining
-        UNION ALL SELECT 'Entertainment', event_type FROM joined WHERE is_entertainment
-        UNION ALL SELECT 'Culture', event_type FROM joined WHERE is_culture
-        UNION ALL SELECT 'Adventure', event_type FROM joined WHERE is_adventure
-        UNION ALL SELECT 'Health', event_type FROM joined WHERE is_health
+        SELECT 'Drinks' AS category, event_type, event_count * drinks_card_rows AS event_count FROM swipes WHERE drinks_card_rows > 0
+        UNION ALL SELECT 'Dining', event_type, event_count * dining_card_rows FROM swipes WHERE dining_card_rows > 0
+        UNION ALL SELECT 'Entertainment', event_type, event_count * entertainment_card_rows FROM swipes WHERE entertainment_card_rows > 0
+        UNION ALL SELECT 'Culture', event_type, event_count * culture_card_rows FROM swipes WHERE culture_card_rows > 0
+        UNION ALL SELECT 'Adventure', event_type, event_count * adventure_card_rows FROM swipes WHERE adventure_card_rows > 0
+        UNION ALL SELECT 'Health', event_type, event_count * health_card_rows FROM swipes WHERE health_card_rows > 0
     )
     SELECT
         category,
-        COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-        COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes,
-        COUNT(*)::bigint AS total,
-        CASE WHEN COUNT(*) > 0
-             THEN COUNT(*) FILTER (WHERE event_type = 'swipe_right')::numeric / COUNT(*)
+        COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_right'), 0)::bigint AS likes,
+        COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_left'), 0)::bigint AS dislikes,
+        SUM(event_count)::bigint AS total,
+        CASE WHEN SUM(event_count) > 0
+             THEN COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_right'), 0)::numeric / SUM(event_count)
              ELSE NULL END AS like_pct
     FROM unpivoted
     GROUP BY category
     ORDER BY total DESC
     """
+    params = {"report_date": report_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading category popularity: {str(e)}")
+        report_loader_error(f"Error loading category popularity: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_places_flagged(report_date, min_swipes=4):
     """Places with more dislikes than likes on report_date, with min swipe count."""
-    engine = get_database_connection()
     query = f"""
-    WITH swipes AS (
+    WITH agg AS (
         SELECT
-            e.card_id,
-            pr.resolved_place_id,
-            e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        LEFT JOIN analytics_prod_silver.int_place_resolver pr
-            ON e.card_id = pr.original_card_id
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) = DATE '{report_date}'
+            e.resolved_place_id,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            SUM(e.event_count)::bigint AS total_swipes
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date = CAST(:report_date AS date)
           AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    agg AS (
-        SELECT
-            resolved_place_id,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes,
-            COUNT(*)::bigint AS total_swipes
-        FROM swipes
-        WHERE resolved_place_id IS NOT NULL
-        GROUP BY resolved_place_id
+          AND e.resolved_place_id IS NOT NULL
+        GROUP BY e.resolved_place_id
     )
     SELECT
         p.place_id AS id,
@@ -3012,47 +3250,36 @@ def load_daily_places_flagged(report_date, min_swipes=4):
         a.dislikes::numeric / NULLIF(a.total_swipes, 0) AS dislike_pct
     FROM agg a
     INNER JOIN analytics_prod_bronze.src_places p ON a.resolved_place_id = p.place_id
-    WHERE a.total_swipes >= {int(min_swipes)}
+    WHERE a.total_swipes >= :min_swipes
       AND a.dislikes > a.likes
     ORDER BY dislike_pct DESC, a.total_swipes DESC
     LIMIT 20
     """
+    params = {"report_date": report_date, "min_swipes": int(min_swipes)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading places flagged: {str(e)}")
+        report_loader_error(f"Error loading places flagged: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_top_liked_places(report_date, limit=10):
     """Top liked places on report_date (ordered by likes desc, then like ratio)."""
-    engine = get_database_connection()
     query = f"""
-    WITH swipes AS (
+    WITH agg AS (
         SELECT
-            e.card_id,
-            pr.resolved_place_id,
-            e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        LEFT JOIN analytics_prod_silver.int_place_resolver pr
-            ON e.card_id = pr.original_card_id
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) = DATE '{report_date}'
+            e.resolved_place_id,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            SUM(e.event_count)::bigint AS total_swipes
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date = CAST(:report_date AS date)
           AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    agg AS (
-        SELECT
-            resolved_place_id,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes
-        FROM swipes
-        WHERE resolved_place_id IS NOT NULL
-        GROUP BY resolved_place_id
+          AND e.resolved_place_id IS NOT NULL
+        GROUP BY e.resolved_place_id
     )
     SELECT
         p.place_id AS id,
@@ -3064,47 +3291,45 @@ def load_daily_top_liked_places(report_date, limit=10):
     INNER JOIN analytics_prod_bronze.src_places p ON a.resolved_place_id = p.place_id
     WHERE a.likes > 0
     ORDER BY a.likes DESC, (a.likes::numeric / NULLIF(a.likes + a.dislikes, 0)) DESC
-    LIMIT {int(limit)}
+    LIMIT :limit
     """
+    params = {"report_date": report_date, "limit": int(limit)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading top liked places: {str(e)}")
+        report_loader_error(f"Error loading top liked places: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_weekly_intensity(report_date, weeks=12):
     """Per-week avg activity per active activated user, for N weeks ending in report_date's week.
 
     Denominator: activated users who were active in the week.
     Metrics: avg swipes, avg saves, avg shares per such user.
     """
-    engine = get_database_connection()
     query = f"""
     WITH weeks AS (
         SELECT generate_series(
-            date_trunc('week', DATE '{report_date}')::date - ({int(weeks) - 1} * 7),
-            date_trunc('week', DATE '{report_date}')::date,
+            date_trunc('week', CAST(:report_date AS date))::date - ((CAST(:weeks AS integer) - 1) * 7),
+            date_trunc('week', CAST(:report_date AS date))::date,
             INTERVAL '1 week'
         )::date AS week_start
     ),
     activated_user_activity AS (
         SELECT
-            date_trunc('week', e.event_timestamp)::date AS week_start,
+            date_trunc('week', e.event_date)::date AS week_start,
             e.user_id,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS swipes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_category = 'Share')::bigint AS shares
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left')), 0)::bigint AS swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_category = 'Share'), 0)::bigint AS shares
+        FROM analytics_prod_gold.fct_report_event_cube e
         INNER JOIN analytics_prod_gold.fct_user_activation fua ON e.user_id = fua.user_id
-        WHERE u.is_test_user = 0
-          AND fua.is_activated = true
-          AND e.event_timestamp >= (date_trunc('week', DATE '{report_date}')::date - ({int(weeks) - 1} * 7))
-          AND e.event_timestamp <  (date_trunc('week', DATE '{report_date}')::date + INTERVAL '7 days')
+        WHERE fua.is_activated = true
+          AND e.event_date >= (date_trunc('week', CAST(:report_date AS date))::date - ((CAST(:weeks AS integer) - 1) * 7))
+          AND e.event_date <  (date_trunc('week', CAST(:report_date AS date))::date + 7)
         GROUP BY 1, 2
     ),
     weekly_avgs AS (
@@ -3127,38 +3352,36 @@ def load_daily_weekly_intensity(report_date, weeks=12):
     LEFT JOIN weekly_avgs wa ON wa.week_start = w.week_start
     ORDER BY w.week_start
     """
+    params = {"report_date": report_date, "weeks": int(weeks)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly intensity: {str(e)}")
+        report_loader_error(f"Error loading weekly intensity: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_daily_user_activity(report_date):
     """Per-user activity on report_date. Includes a 'new' flag if the user signed up on report_date."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH event_agg AS (
         SELECT
             e.user_id,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_left')::bigint AS dislikes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*)::bigint AS total_events
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) = DATE '{report_date}'
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count), 0)::bigint AS total_events
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date = CAST(:report_date AS date)
         GROUP BY e.user_id
     ),
     boards_agg AS (
         SELECT user_id, COUNT(*)::bigint AS boards_created
         FROM analytics_prod_bronze.src_boards
-        WHERE DATE(created_at) = DATE '{report_date}'
+        WHERE DATE(created_at) = CAST(:report_date AS date)
           AND (is_default = false OR is_default IS NULL)
         GROUP BY user_id
     )
@@ -3173,19 +3396,20 @@ def load_daily_user_activity(report_date):
         COALESCE(ba.boards_created, 0) AS boards_created,
         ea.prompts,
         ea.total_events,
-        (DATE(u.created_at) = DATE '{report_date}') AS is_new
+        (DATE(u.created_at) = CAST(:report_date AS date)) AS is_new
     FROM event_agg ea
     INNER JOIN analytics_prod_silver.stg_users u ON ea.user_id = u.user_id
     LEFT JOIN boards_agg ba ON ba.user_id = u.user_id
     WHERE u.is_test_user = 0
     ORDER BY ea.total_events DESC
     """
+    params = {"report_date": report_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading daily user activity: {str(e)}")
+        report_loader_error(f"Error loading daily user activity: {str(e)}")
         return pd.DataFrame()
 
 
@@ -3196,36 +3420,33 @@ def load_daily_user_activity(report_date):
 # week_start is a date string for the Monday of the target week.
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_topline_kpis(week_start):
     """Top-line KPIs aggregated over a Mon–Sun week. Returns dict with WAU instead of DAU."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH signups AS (
         SELECT COUNT(*)::bigint AS new_signups
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+          AND DATE(created_at) BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
     ),
     event_tallies AS (
         SELECT
             COUNT(DISTINCT e.user_id)::bigint AS wau,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS total_swipes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS total_right_swipes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*)::bigint AS total_events
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left')), 0)::bigint AS total_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS total_right_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count), 0)::bigint AS total_events
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
     ),
     onboarding AS (
         SELECT COUNT(*)::bigint AS onboarding_completed
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
           AND onboarding_completed = true
-          AND DATE(created_at) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+          AND DATE(created_at) BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
     )
     SELECT
         s.new_signups,
@@ -3243,26 +3464,26 @@ def load_weekly_topline_kpis(week_start):
     CROSS JOIN event_tallies e
     CROSS JOIN onboarding o
     """
+    params = {"week_start": week_start}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         if df.empty:
             return {}
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading weekly topline KPIs: {str(e)}")
+        report_loader_error(f"Error loading weekly topline KPIs: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_multiweek_trend(week_start, num_weeks=8):
     """Return num_weeks weeks ending on week_start's week with WAU, new_signups, etc."""
-    engine = get_database_connection()
     query = f"""
     WITH weeks AS (
         SELECT generate_series(
-            DATE '{week_start}' - ({int(num_weeks) - 1} * 7),
-            DATE '{week_start}',
+            CAST(:week_start AS date) - ((CAST(:num_weeks AS integer) - 1) * 7),
+            CAST(:week_start AS date),
             INTERVAL '1 week'
         )::date AS week_start
     ),
@@ -3272,30 +3493,19 @@ def load_weekly_multiweek_trend(week_start, num_weeks=8):
             COUNT(*)::bigint AS new_signups
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) BETWEEN DATE '{week_start}' - ({int(num_weeks) - 1} * 7)
-                                    AND DATE '{week_start}' + 6
+          AND DATE(created_at) BETWEEN CAST(:week_start AS date) - ((CAST(:num_weeks AS integer) - 1) * 7)
+                                    AND CAST(:week_start AS date) + 6
         GROUP BY 1
     ),
-    events AS (
-        SELECT
-            date_trunc('week', e.event_timestamp)::date AS week_start,
-            COUNT(DISTINCT e.user_id)::bigint AS wau,
-            COUNT(*)::bigint AS total_events,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS total_swipes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS right_swipes
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{week_start}' - ({int(num_weeks) - 1} * 7)
-                                           AND DATE '{week_start}' + 6
-        GROUP BY 1
-    )
+    events AS ({_report_rollup_sql(
+        "week",
+        "CAST(:week_start AS date) - ((CAST(:num_weeks AS integer) - 1) * 7)",
+        "CAST(:week_start AS date) + 6",
+    )})
     SELECT
         w.week_start,
         COALESCE(s.new_signups, 0) AS new_signups,
-        COALESCE(e.wau, 0) AS wau,
+        COALESCE(e.active_users, 0) AS wau,
         COALESCE(e.total_events, 0) AS total_events,
         COALESCE(e.saves, 0) AS saves,
         COALESCE(e.prompts, 0) AS prompts,
@@ -3305,28 +3515,28 @@ def load_weekly_multiweek_trend(week_start, num_weeks=8):
              ELSE NULL END AS like_rate
     FROM weeks w
     LEFT JOIN signups s ON s.week_start = w.week_start
-    LEFT JOIN events e ON e.week_start = w.week_start
+    LEFT JOIN events e ON e.period_start = w.week_start
     ORDER BY w.week_start
     """
+    params = {"week_start": week_start, "num_weeks": num_weeks}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading multi-week trend: {str(e)}")
+        report_loader_error(f"Error loading multi-week trend: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_activation_checklist(week_start):
     """Activation checklist funnel for users who signed up during the week."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH cohort AS (
         SELECT user_id
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+          AND DATE(created_at) BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
     ),
     task_events AS (
         SELECT
@@ -3359,27 +3569,27 @@ def load_weekly_activation_checklist(week_start):
         )::bigint AS stuck_at_mp
     FROM task_events
     """
+    params = {"week_start": week_start}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         if df.empty:
             return {}
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading weekly activation checklist: {str(e)}")
+        report_loader_error(f"Error loading weekly activation checklist: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_new_signups_status(week_start):
     """Per-user onboarding & checklist status for users who signed up during the week."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH cohort AS (
         SELECT user_id, email, username, full_name, onboarding_completed, created_at
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND DATE(created_at) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+          AND DATE(created_at) BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
     ),
     task_events AS (
         SELECT
@@ -3406,91 +3616,75 @@ def load_weekly_new_signups_status(week_start):
     LEFT JOIN task_events te ON c.user_id = te.user_id
     ORDER BY all_three DESC, deck_created DESC, places_saved DESC, display_name
     """
+    params = {"week_start": week_start}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly new signups status: {str(e)}")
+        report_loader_error(f"Error loading weekly new signups status: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_category_popularity(week_start):
     """Category-level likes/dislikes for swipes during the week."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH swipes AS (
-        SELECT e.card_id, e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
-          AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    joined AS (
         SELECT
-            c.is_drinks, c.is_dining, c.is_entertainment,
-            c.is_culture, c.is_adventure, c.is_health,
-            s.event_type
-        FROM swipes s
-        INNER JOIN analytics_prod_silver.stg_cards c ON c.card_id = s.card_id
+            e.drinks_card_rows, e.dining_card_rows, e.entertainment_card_rows,
+            e.culture_card_rows, e.adventure_card_rows, e.health_card_rows,
+            e.event_type,
+            e.event_count
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
+          AND e.event_type IN ('swipe_right', 'swipe_left')
     ),
     unpivoted AS (
-        SELECT 'Drinks' AS category, event_type FROM joined WHERE is_drinks
-        UNION ALL SELECT 'Dining', event_type FROM joined WHERE is_dining
-        UNION ALL SELECT 'Entertainment', event_type FROM joined WHERE is_entertainment
-        UNION ALL SELECT 'Culture', event_type FROM joined WHERE is_culture
-        UNION ALL SELECT 'Adventure', event_type FROM joined WHERE is_adventure
-        UNION ALL SELECT 'Health', event_type FROM joined WHERE is_health
+        SELECT 'Drinks' AS category, event_type, event_count * drinks_card_rows AS event_count FROM swipes WHERE drinks_card_rows > 0
+        UNION ALL SELECT 'Dining', event_type, event_count * dining_card_rows FROM swipes WHERE dining_card_rows > 0
+        UNION ALL SELECT 'Entertainment', event_type, event_count * entertainment_card_rows FROM swipes WHERE entertainment_card_rows > 0
+        UNION ALL SELECT 'Culture', event_type, event_count * culture_card_rows FROM swipes WHERE culture_card_rows > 0
+        UNION ALL SELECT 'Adventure', event_type, event_count * adventure_card_rows FROM swipes WHERE adventure_card_rows > 0
+        UNION ALL SELECT 'Health', event_type, event_count * health_card_rows FROM swipes WHERE health_card_rows > 0
     )
     SELECT
         category,
-        COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-        COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes,
-        COUNT(*)::bigint AS total,
-        CASE WHEN COUNT(*) > 0
-             THEN COUNT(*) FILTER (WHERE event_type = 'swipe_right')::numeric / COUNT(*)
+        COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_right'), 0)::bigint AS likes,
+        COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_left'), 0)::bigint AS dislikes,
+        SUM(event_count)::bigint AS total,
+        CASE WHEN SUM(event_count) > 0
+             THEN COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_right'), 0)::numeric / SUM(event_count)
              ELSE NULL END AS like_pct
     FROM unpivoted
     GROUP BY category
     ORDER BY total DESC
     """
+    params = {"week_start": week_start}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly category popularity: {str(e)}")
+        report_loader_error(f"Error loading weekly category popularity: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_places_flagged(week_start, min_swipes=10):
     """Places with more dislikes than likes during the week."""
-    engine = get_database_connection()
     query = f"""
-    WITH swipes AS (
-        SELECT e.card_id, pr.resolved_place_id, e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        LEFT JOIN analytics_prod_silver.int_place_resolver pr
-            ON e.card_id = pr.original_card_id
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
-          AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    agg AS (
+    WITH agg AS (
         SELECT
-            resolved_place_id,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes,
-            COUNT(*)::bigint AS total_swipes
-        FROM swipes
-        WHERE resolved_place_id IS NOT NULL
-        GROUP BY resolved_place_id
+            e.resolved_place_id,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            SUM(e.event_count)::bigint AS total_swipes
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
+          AND e.event_type IN ('swipe_right', 'swipe_left')
+          AND e.resolved_place_id IS NOT NULL
+        GROUP BY e.resolved_place_id
     )
     SELECT
         p.place_id AS id, p.name,
@@ -3499,44 +3693,36 @@ def load_weekly_places_flagged(week_start, min_swipes=10):
         a.dislikes::numeric / NULLIF(a.total_swipes, 0) AS dislike_pct
     FROM agg a
     INNER JOIN analytics_prod_bronze.src_places p ON a.resolved_place_id = p.place_id
-    WHERE a.total_swipes >= {int(min_swipes)}
+    WHERE a.total_swipes >= :min_swipes
       AND a.dislikes > a.likes
     ORDER BY dislike_pct DESC, a.total_swipes DESC
     LIMIT 20
     """
+    params = {"week_start": week_start, "min_swipes": int(min_swipes)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly places flagged: {str(e)}")
+        report_loader_error(f"Error loading weekly places flagged: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_top_liked_places(week_start, limit=10):
     """Top liked places during the week."""
-    engine = get_database_connection()
     query = f"""
-    WITH swipes AS (
-        SELECT e.card_id, pr.resolved_place_id, e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        LEFT JOIN analytics_prod_silver.int_place_resolver pr
-            ON e.card_id = pr.original_card_id
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
-          AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    agg AS (
+    WITH agg AS (
         SELECT
-            resolved_place_id,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes
-        FROM swipes
-        WHERE resolved_place_id IS NOT NULL
-        GROUP BY resolved_place_id
+            e.resolved_place_id,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            SUM(e.event_count)::bigint AS total_swipes
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
+          AND e.event_type IN ('swipe_right', 'swipe_left')
+          AND e.resolved_place_id IS NOT NULL
+        GROUP BY e.resolved_place_id
     )
     SELECT
         p.place_id AS id, p.name,
@@ -3546,40 +3732,38 @@ def load_weekly_top_liked_places(week_start, limit=10):
     INNER JOIN analytics_prod_bronze.src_places p ON a.resolved_place_id = p.place_id
     WHERE a.likes > 0
     ORDER BY a.likes DESC, (a.likes::numeric / NULLIF(a.likes + a.dislikes, 0)) DESC
-    LIMIT {int(limit)}
+    LIMIT :limit
     """
+    params = {"week_start": week_start, "limit": int(limit)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly top liked places: {str(e)}")
+        report_loader_error(f"Error loading weekly top liked places: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_weekly_user_activity(week_start):
     """Per-user activity during the week. is_new = signed up that week."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH event_agg AS (
         SELECT
             e.user_id,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_left')::bigint AS dislikes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*)::bigint AS total_events
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND DATE(e.event_timestamp) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count), 0)::bigint AS total_events
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
         GROUP BY e.user_id
     ),
     boards_agg AS (
         SELECT user_id, COUNT(*)::bigint AS boards_created
         FROM analytics_prod_bronze.src_boards
-        WHERE DATE(created_at) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6
+        WHERE DATE(created_at) BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6
           AND (is_default = false OR is_default IS NULL)
         GROUP BY user_id
     )
@@ -3592,19 +3776,20 @@ def load_weekly_user_activity(week_start):
         ea.saves,
         COALESCE(ba.boards_created, 0) AS boards_created,
         ea.prompts, ea.total_events,
-        (DATE(u.created_at) BETWEEN DATE '{week_start}' AND DATE '{week_start}' + 6) AS is_new
+        (DATE(u.created_at) BETWEEN CAST(:week_start AS date) AND CAST(:week_start AS date) + 6) AS is_new
     FROM event_agg ea
     INNER JOIN analytics_prod_silver.stg_users u ON ea.user_id = u.user_id
     LEFT JOIN boards_agg ba ON ba.user_id = u.user_id
     WHERE u.is_test_user = 0
     ORDER BY ea.total_events DESC
     """
+    params = {"week_start": week_start}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading weekly user activity: {str(e)}")
+        report_loader_error(f"Error loading weekly user activity: {str(e)}")
         return pd.DataFrame()
 
 
@@ -3615,36 +3800,34 @@ def load_weekly_user_activity(week_start):
 # year and month are integers (e.g. 2026, 3 for March 2026).
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_topline_kpis(year, month):
     """Top-line KPIs aggregated over a calendar month. Returns dict with MAU instead of DAU."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH signups AS (
         SELECT COUNT(*)::bigint AS new_signups
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND date_trunc('month', created_at) = '{year}-{month:02d}-01'::date
+          AND date_trunc('month', created_at) = CAST(:month_start AS date)
     ),
     event_tallies AS (
         SELECT
             COUNT(DISTINCT e.user_id)::bigint AS mau,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS total_swipes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS total_right_swipes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*)::bigint AS total_events
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND date_trunc('month', e.event_timestamp) = '{year}-{month:02d}-01'::date
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left')), 0)::bigint AS total_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS total_right_swipes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count), 0)::bigint AS total_events
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date >= CAST(:month_start AS date)
+          AND e.event_date < CAST(:month_start AS date) + INTERVAL '1 month'
     ),
     onboarding AS (
         SELECT COUNT(*)::bigint AS onboarding_completed
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
           AND onboarding_completed = true
-          AND date_trunc('month', created_at) = '{year}-{month:02d}-01'::date
+          AND date_trunc('month', created_at) = CAST(:month_start AS date)
     )
     SELECT
         s.new_signups,
@@ -3662,26 +3845,26 @@ def load_monthly_topline_kpis(year, month):
     CROSS JOIN event_tallies e
     CROSS JOIN onboarding o
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01"}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         if df.empty:
             return {}
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading monthly topline KPIs: {str(e)}")
+        report_loader_error(f"Error loading monthly topline KPIs: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_multimonth_trend(year, month, num_months=6):
     """Return num_months months ending on the target month with MAU, new_signups, etc."""
-    engine = get_database_connection()
     query = f"""
     WITH months AS (
         SELECT generate_series(
-            ('{year}-{month:02d}-01'::date - INTERVAL '{int(num_months) - 1} months')::date,
-            '{year}-{month:02d}-01'::date,
+            (CAST(:month_start AS date) - (CAST(:num_months AS integer) - 1) * INTERVAL '1 month')::date,
+            CAST(:month_start AS date),
             INTERVAL '1 month'
         )::date AS month_start
     ),
@@ -3691,30 +3874,19 @@ def load_monthly_multimonth_trend(year, month, num_months=6):
             COUNT(*)::bigint AS new_signups
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND created_at >= ('{year}-{month:02d}-01'::date - INTERVAL '{int(num_months) - 1} months')
-          AND date_trunc('month', created_at) <= '{year}-{month:02d}-01'::date
+          AND created_at >= (CAST(:month_start AS date) - (CAST(:num_months AS integer) - 1) * INTERVAL '1 month')
+          AND date_trunc('month', created_at) <= CAST(:month_start AS date)
         GROUP BY 1
     ),
-    events AS (
-        SELECT
-            date_trunc('month', e.event_timestamp)::date AS month_start,
-            COUNT(DISTINCT e.user_id)::bigint AS mau,
-            COUNT(*)::bigint AS total_events,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*) FILTER (WHERE e.event_type IN ('swipe_right', 'swipe_left'))::bigint AS total_swipes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS right_swipes
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND e.event_timestamp >= ('{year}-{month:02d}-01'::date - INTERVAL '{int(num_months) - 1} months')
-          AND date_trunc('month', e.event_timestamp) <= '{year}-{month:02d}-01'::date
-        GROUP BY 1
-    )
+    events AS ({_report_rollup_sql(
+        "month",
+        "(CAST(:month_start AS date) - (CAST(:num_months AS integer) - 1) * INTERVAL '1 month')::date",
+        "(CAST(:month_start AS date) + INTERVAL '1 month' - INTERVAL '1 day')::date",
+    )})
     SELECT
         m.month_start,
         COALESCE(s.new_signups, 0) AS new_signups,
-        COALESCE(e.mau, 0) AS mau,
+        COALESCE(e.active_users, 0) AS mau,
         COALESCE(e.total_events, 0) AS total_events,
         COALESCE(e.saves, 0) AS saves,
         COALESCE(e.prompts, 0) AS prompts,
@@ -3724,28 +3896,28 @@ def load_monthly_multimonth_trend(year, month, num_months=6):
              ELSE NULL END AS like_rate
     FROM months m
     LEFT JOIN signups s ON s.month_start = m.month_start
-    LEFT JOIN events e ON e.month_start = m.month_start
+    LEFT JOIN events e ON e.period_start = m.month_start
     ORDER BY m.month_start
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01", "num_months": num_months}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading multi-month trend: {str(e)}")
+        report_loader_error(f"Error loading multi-month trend: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_activation_checklist(year, month):
     """Activation checklist funnel for users who signed up during the month."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH cohort AS (
         SELECT user_id
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND date_trunc('month', created_at) = '{year}-{month:02d}-01'::date
+          AND date_trunc('month', created_at) = CAST(:month_start AS date)
     ),
     task_events AS (
         SELECT
@@ -3778,27 +3950,27 @@ def load_monthly_activation_checklist(year, month):
         )::bigint AS stuck_at_mp
     FROM task_events
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01"}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         if df.empty:
             return {}
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading monthly activation checklist: {str(e)}")
+        report_loader_error(f"Error loading monthly activation checklist: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_new_signups_status(year, month):
     """Per-user onboarding & checklist status for users who signed up during the month."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH cohort AS (
         SELECT user_id, email, username, full_name, onboarding_completed, created_at
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-          AND date_trunc('month', created_at) = '{year}-{month:02d}-01'::date
+          AND date_trunc('month', created_at) = CAST(:month_start AS date)
     ),
     task_events AS (
         SELECT
@@ -3825,91 +3997,77 @@ def load_monthly_new_signups_status(year, month):
     LEFT JOIN task_events te ON c.user_id = te.user_id
     ORDER BY all_three DESC, deck_created DESC, places_saved DESC, display_name
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01"}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading monthly new signups status: {str(e)}")
+        report_loader_error(f"Error loading monthly new signups status: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_category_popularity(year, month):
     """Category-level likes/dislikes for swipes during the month."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH swipes AS (
-        SELECT e.card_id, e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND date_trunc('month', e.event_timestamp) = '{year}-{month:02d}-01'::date
-          AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    joined AS (
         SELECT
-            c.is_drinks, c.is_dining, c.is_entertainment,
-            c.is_culture, c.is_adventure, c.is_health,
-            s.event_type
-        FROM swipes s
-        INNER JOIN analytics_prod_silver.stg_cards c ON c.card_id = s.card_id
+            e.drinks_card_rows, e.dining_card_rows, e.entertainment_card_rows,
+            e.culture_card_rows, e.adventure_card_rows, e.health_card_rows,
+            e.event_type,
+            e.event_count
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date >= CAST(:month_start AS date)
+          AND e.event_date < CAST(:month_start AS date) + INTERVAL '1 month'
+          AND e.event_type IN ('swipe_right', 'swipe_left')
     ),
     unpivoted AS (
-        SELECT 'Drinks' AS category, event_type FROM joined WHERE is_drinks
-        UNION ALL SELECT 'Dining', event_type FROM joined WHERE is_dining
-        UNION ALL SELECT 'Entertainment', event_type FROM joined WHERE is_entertainment
-        UNION ALL SELECT 'Culture', event_type FROM joined WHERE is_culture
-        UNION ALL SELECT 'Adventure', event_type FROM joined WHERE is_adventure
-        UNION ALL SELECT 'Health', event_type FROM joined WHERE is_health
+        SELECT 'Drinks' AS category, event_type, event_count * drinks_card_rows AS event_count FROM swipes WHERE drinks_card_rows > 0
+        UNION ALL SELECT 'Dining', event_type, event_count * dining_card_rows FROM swipes WHERE dining_card_rows > 0
+        UNION ALL SELECT 'Entertainment', event_type, event_count * entertainment_card_rows FROM swipes WHERE entertainment_card_rows > 0
+        UNION ALL SELECT 'Culture', event_type, event_count * culture_card_rows FROM swipes WHERE culture_card_rows > 0
+        UNION ALL SELECT 'Adventure', event_type, event_count * adventure_card_rows FROM swipes WHERE adventure_card_rows > 0
+        UNION ALL SELECT 'Health', event_type, event_count * health_card_rows FROM swipes WHERE health_card_rows > 0
     )
     SELECT
         category,
-        COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-        COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes,
-        COUNT(*)::bigint AS total,
-        CASE WHEN COUNT(*) > 0
-             THEN COUNT(*) FILTER (WHERE event_type = 'swipe_right')::numeric / COUNT(*)
+        COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_right'), 0)::bigint AS likes,
+        COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_left'), 0)::bigint AS dislikes,
+        SUM(event_count)::bigint AS total,
+        CASE WHEN SUM(event_count) > 0
+             THEN COALESCE(SUM(event_count) FILTER (WHERE event_type = 'swipe_right'), 0)::numeric / SUM(event_count)
              ELSE NULL END AS like_pct
     FROM unpivoted
     GROUP BY category
     ORDER BY total DESC
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01"}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading monthly category popularity: {str(e)}")
+        report_loader_error(f"Error loading monthly category popularity: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_places_flagged(year, month, min_swipes=20):
     """Places with more dislikes than likes during the month."""
-    engine = get_database_connection()
     query = f"""
-    WITH swipes AS (
-        SELECT e.card_id, pr.resolved_place_id, e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        LEFT JOIN analytics_prod_silver.int_place_resolver pr
-            ON e.card_id = pr.original_card_id
-        WHERE u.is_test_user = 0
-          AND date_trunc('month', e.event_timestamp) = '{year}-{month:02d}-01'::date
-          AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    agg AS (
+    WITH agg AS (
         SELECT
-            resolved_place_id,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes,
-            COUNT(*)::bigint AS total_swipes
-        FROM swipes
-        WHERE resolved_place_id IS NOT NULL
-        GROUP BY resolved_place_id
+            e.resolved_place_id,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            SUM(e.event_count)::bigint AS total_swipes
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date >= CAST(:month_start AS date)
+          AND e.event_date < CAST(:month_start AS date) + INTERVAL '1 month'
+          AND e.event_type IN ('swipe_right', 'swipe_left')
+          AND e.resolved_place_id IS NOT NULL
+        GROUP BY e.resolved_place_id
     )
     SELECT
         p.place_id AS id, p.name,
@@ -3918,44 +4076,37 @@ def load_monthly_places_flagged(year, month, min_swipes=20):
         a.dislikes::numeric / NULLIF(a.total_swipes, 0) AS dislike_pct
     FROM agg a
     INNER JOIN analytics_prod_bronze.src_places p ON a.resolved_place_id = p.place_id
-    WHERE a.total_swipes >= {int(min_swipes)}
+    WHERE a.total_swipes >= :min_swipes
       AND a.dislikes > a.likes
     ORDER BY dislike_pct DESC, a.total_swipes DESC
     LIMIT 20
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01", "min_swipes": int(min_swipes)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading monthly places flagged: {str(e)}")
+        report_loader_error(f"Error loading monthly places flagged: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_top_liked_places(year, month, limit=10):
     """Top liked places during the month."""
-    engine = get_database_connection()
     query = f"""
-    WITH swipes AS (
-        SELECT e.card_id, pr.resolved_place_id, e.event_type
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        LEFT JOIN analytics_prod_silver.int_place_resolver pr
-            ON e.card_id = pr.original_card_id
-        WHERE u.is_test_user = 0
-          AND date_trunc('month', e.event_timestamp) = '{year}-{month:02d}-01'::date
-          AND e.event_type IN ('swipe_right', 'swipe_left')
-          AND e.card_id IS NOT NULL
-    ),
-    agg AS (
+    WITH agg AS (
         SELECT
-            resolved_place_id,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE event_type = 'swipe_left')::bigint AS dislikes
-        FROM swipes
-        WHERE resolved_place_id IS NOT NULL
-        GROUP BY resolved_place_id
+            e.resolved_place_id,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            SUM(e.event_count)::bigint AS total_swipes
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date >= CAST(:month_start AS date)
+          AND e.event_date < CAST(:month_start AS date) + INTERVAL '1 month'
+          AND e.event_type IN ('swipe_right', 'swipe_left')
+          AND e.resolved_place_id IS NOT NULL
+        GROUP BY e.resolved_place_id
     )
     SELECT
         p.place_id AS id, p.name,
@@ -3965,40 +4116,39 @@ def load_monthly_top_liked_places(year, month, limit=10):
     INNER JOIN analytics_prod_bronze.src_places p ON a.resolved_place_id = p.place_id
     WHERE a.likes > 0
     ORDER BY a.likes DESC, (a.likes::numeric / NULLIF(a.likes + a.dislikes, 0)) DESC
-    LIMIT {int(limit)}
+    LIMIT :limit
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01", "limit": int(limit)}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading monthly top liked places: {str(e)}")
+        report_loader_error(f"Error loading monthly top liked places: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_monthly_user_activity(year, month):
     """Per-user activity during the month. is_new = signed up that month."""
-    engine = get_database_connection()
-    query = f"""
+    query = """
     WITH event_agg AS (
         SELECT
             e.user_id,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_right')::bigint AS likes,
-            COUNT(*) FILTER (WHERE e.event_type = 'swipe_left')::bigint AS dislikes,
-            COUNT(*) FILTER (WHERE e.event_type IN ('save', 'saved'))::bigint AS saves,
-            COUNT(*) FILTER (WHERE e.event_type = 'query')::bigint AS prompts,
-            COUNT(*)::bigint AS total_events
-        FROM analytics_prod_silver.stg_unified_events e
-        INNER JOIN analytics_prod_silver.stg_users u USING (user_id)
-        WHERE u.is_test_user = 0
-          AND date_trunc('month', e.event_timestamp) = '{year}-{month:02d}-01'::date
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_right'), 0)::bigint AS likes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'swipe_left'), 0)::bigint AS dislikes,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type IN ('save', 'saved')), 0)::bigint AS saves,
+            COALESCE(SUM(e.event_count) FILTER (WHERE e.event_type = 'query'), 0)::bigint AS prompts,
+            COALESCE(SUM(e.event_count), 0)::bigint AS total_events
+        FROM analytics_prod_gold.fct_report_event_cube e
+        WHERE e.event_date >= CAST(:month_start AS date)
+          AND e.event_date < CAST(:month_start AS date) + INTERVAL '1 month'
         GROUP BY e.user_id
     ),
     boards_agg AS (
         SELECT user_id, COUNT(*)::bigint AS boards_created
         FROM analytics_prod_bronze.src_boards
-        WHERE date_trunc('month', created_at) = '{year}-{month:02d}-01'::date
+        WHERE date_trunc('month', created_at) = CAST(:month_start AS date)
           AND (is_default = false OR is_default IS NULL)
         GROUP BY user_id
     )
@@ -4011,19 +4161,20 @@ def load_monthly_user_activity(year, month):
         ea.saves,
         COALESCE(ba.boards_created, 0) AS boards_created,
         ea.prompts, ea.total_events,
-        (date_trunc('month', u.created_at) = '{year}-{month:02d}-01'::date) AS is_new
+        (date_trunc('month', u.created_at) = CAST(:month_start AS date)) AS is_new
     FROM event_agg ea
     INNER JOIN analytics_prod_silver.stg_users u ON ea.user_id = u.user_id
     LEFT JOIN boards_agg ba ON ba.user_id = u.user_id
     WHERE u.is_test_user = 0
     ORDER BY ea.total_events DESC
     """
+    params = {"month_start": f"{int(year)}-{int(month):02d}-01"}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading monthly user activity: {str(e)}")
+        report_loader_error(f"Error loading monthly user activity: {str(e)}")
         return pd.DataFrame()
 
 
@@ -4032,19 +4183,18 @@ def load_monthly_user_activity(year, month):
 # ============================================================================
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_surface_performance(start_date=None, end_date=None):
     """Load surface attribution data from fct_surface_performance.
 
     Aggregates rates over the filtered date range at the surface grain.
     """
-    engine = get_database_connection()
 
     conditions = ["origin_surface IS NOT NULL"]
     if start_date:
-        conditions.append(f"metric_date >= '{start_date}'")
+        conditions.append("metric_date >= :start_date")
     if end_date:
-        conditions.append(f"metric_date <= '{end_date}'")
+        conditions.append("metric_date <= :end_date")
     where = "WHERE " + " AND ".join(conditions)
 
     query = f"""
@@ -4077,27 +4227,27 @@ def load_surface_performance(start_date=None, end_date=None):
     GROUP BY origin_surface
     ORDER BY total_events DESC
     """
+    params = {"start_date": start_date, "end_date": end_date}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading surface performance: {str(e)}")
+        report_loader_error(f"Error loading surface performance: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_dextr_funnel(start_date=None, end_date=None, app_version=None):
     """Load Dextr query → results funnel from fct_dextr_funnel (telemetry era only)."""
-    engine = get_database_connection()
 
     conditions = ["1=1"]
     if start_date:
-        conditions.append(f"metric_date >= '{start_date}'")
+        conditions.append("metric_date >= :start_date")
     if end_date:
-        conditions.append(f"metric_date <= '{end_date}'")
+        conditions.append("metric_date <= :end_date")
     if app_version:
-        conditions.append(f"app_version = '{app_version}'")
+        conditions.append("app_version = :app_version")
     where = " AND ".join(conditions)
 
     query = f"""
@@ -4118,19 +4268,19 @@ def load_dextr_funnel(start_date=None, end_date=None, app_version=None):
     FROM analytics_prod_gold.fct_dextr_funnel
     WHERE {where}
     """
+    params = {"start_date": start_date, "end_date": end_date, "app_version": app_version}
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading Dextr funnel: {str(e)}")
+        report_loader_error(f"Error loading Dextr funnel: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_first_session_experience():
     """Aggregate counts across the first-session experience funnel."""
-    engine = get_database_connection()
     query = """
     SELECT
         COUNT(*)::bigint AS entered,
@@ -4146,11 +4296,11 @@ def load_first_session_experience():
     FROM analytics_prod_gold.fct_first_session_experience
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading first-session experience: {str(e)}")
+        report_loader_error(f"Error loading first-session experience: {str(e)}")
         return pd.DataFrame()
 
 
@@ -4163,7 +4313,6 @@ def load_places_for_curation():
 
     NOT cached — must reflect live state immediately after deletes.
     """
-    engine = get_database_connection()
     query = """
     SELECT
         p.id,
@@ -4189,17 +4338,16 @@ def load_places_for_curation():
         ON perf.place_id = p.id
     """
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query)
         return df
     except Exception as e:
-        st.error(f"Error loading places for curation: {str(e)}")
+        report_loader_error(f"Error loading places for curation: {str(e)}")
         return pd.DataFrame()
 
 
 def load_place_media(place_ids: list[int]) -> pd.DataFrame:
     """Load media URLs for given place IDs, ordered by display_order."""
-    engine = get_database_connection()
     query = text("""
         SELECT place_id, media_url, display_order
         FROM public.place_media
@@ -4207,11 +4355,11 @@ def load_place_media(place_ids: list[int]) -> pd.DataFrame:
         ORDER BY place_id, display_order
     """)
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(query, conn, params={"place_ids": place_ids})
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, {"place_ids": place_ids})
         return df
     except Exception as e:
-        st.error(f"Error loading place media: {str(e)}")
+        report_loader_error(f"Error loading place media: {str(e)}")
         return pd.DataFrame()
 
 
@@ -4248,7 +4396,7 @@ def delete_places(place_ids: list[int]) -> int:
 # CVP FUNNEL ANALYSIS DATA LOADERS
 # ============================================================================
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_cvp_funnel_metrics(days=90):
     """
     Load CVP funnel conversion metrics
@@ -4260,14 +4408,13 @@ def load_cvp_funnel_metrics(days=90):
     - validated: Users who shared OR created multiplayer
     - decided: Users whose shares were clicked OR multiplayer had 2+ participants
     """
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     WITH user_base AS (
         SELECT user_id, created_at
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-        AND created_at >= current_date - interval '{days} days'
+        AND created_at >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     ),
 
     initiated AS (
@@ -4319,23 +4466,23 @@ def load_cvp_funnel_metrics(days=90):
         (SELECT COUNT(*) FROM decided) as decided
     """
 
+    params = {"days": days}
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading CVP funnel metrics: {str(e)}")
+        report_loader_error(f"Error loading CVP funnel metrics: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_funnel_by_cohort(days=90):
     """
     Load funnel metrics broken down by signup week cohort
     """
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     WITH user_base AS (
         SELECT
             user_id,
@@ -4343,7 +4490,7 @@ def load_funnel_by_cohort(days=90):
             DATE_TRUNC('week', created_at) as cohort_week
         FROM analytics_prod_silver.stg_users
         WHERE is_test_user = 0
-        AND created_at >= current_date - interval '{days} days'
+        AND created_at >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     ),
 
     initiated AS (
@@ -4397,16 +4544,54 @@ def load_funnel_by_cohort(days=90):
     ORDER BY ub.cohort_week DESC
     """
 
+    params = {"days": days}
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
+        return df
+    except Exception as e:
+        report_loader_error(f"Error loading funnel by cohort: {str(e)}")
+        return pd.DataFrame()
+
+
+@cached_loader()
+def load_funnel_event_extract(days=90):
+    """
+    Per-user event extract for utils.funnels.FunnelEngine
+
+    One row per stg_unified_events event of a non-test user in the last
+    `days` days, with the user's signup date and signup week for cohort
+    filters. Low-cardinality text columns are returned as categoricals.
+    """
+
+    query = """
+    SELECT
+        e.user_id::text AS user_id,
+        e.event_timestamp,
+        e.event_type,
+        e.event_category,
+        e.origin_surface,
+        u.created_at::date AS signup_date,
+        DATE_TRUNC('week', u.created_at)::date AS cohort_week
+    FROM analytics_prod_silver.stg_unified_events e
+    INNER JOIN analytics_prod_silver.stg_users u ON e.user_id = u.user_id
+    WHERE u.is_test_user = 0
+      AND e.event_date >= current_date - CAST(:days AS integer)
+    """
+
+    params = {"days": days}
+    try:
+        with get_database_connection().connect() as conn:
+            df = _read_sql(
+                conn, query, params, bulk=True, categorical=('event_type', 'event_category', 'origin_surface')
+            )
         return df
     except Exception as e:
-        st.error(f"Error loading funnel by cohort: {str(e)}")
+        report_loader_error(f"Error loading funnel event extract: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_prompt_to_save_analysis(days=90):
     """
     Detailed analysis of the Initiated → Considered conversion
@@ -4420,9 +4605,8 @@ def load_prompt_to_save_analysis(days=90):
     - Avg cards liked per prompt
     - Avg cards saved per prompt
     """
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     WITH prompt_sessions AS (
         SELECT
             dq.user_id,
@@ -4432,7 +4616,7 @@ def load_prompt_to_save_analysis(days=90):
         FROM analytics_prod_bronze.src_dextr_queries dq
         INNER JOIN analytics_prod_silver.stg_users u ON dq.user_id = u.user_id
         WHERE u.is_test_user = 0
-        AND dq.query_timestamp >= current_date - interval '{days} days'
+        AND dq.query_timestamp >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     ),
 
     pack_engagement AS (
@@ -4485,23 +4669,23 @@ def load_prompt_to_save_analysis(days=90):
     LEFT JOIN saves_per_session ss ON pe.query_id = ss.query_id
     """
 
+    params = {"days": days}
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading prompt-to-save analysis: {str(e)}")
+        report_loader_error(f"Error loading prompt-to-save analysis: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_save_to_share_analysis(days=90):
     """
     Detailed analysis of Considered → Validated conversion
     """
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     WITH users_who_saved AS (
         SELECT DISTINCT
             cca.user_id,
@@ -4510,7 +4694,7 @@ def load_save_to_share_analysis(days=90):
         INNER JOIN analytics_prod_silver.stg_users u ON cca.user_id = u.user_id
         WHERE u.is_test_user = 0
         AND cca.action_type = 'saved'
-        AND cca.action_timestamp >= current_date - interval '{days} days'
+        AND cca.action_timestamp >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
         GROUP BY cca.user_id
     ),
 
@@ -4565,23 +4749,23 @@ def load_save_to_share_analysis(days=90):
     LEFT JOIN users_who_created_multiplayer uwmp ON uws.user_id = uwmp.user_id
     """
 
+    params = {"days": days}
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading save-to-share analysis: {str(e)}")
+        report_loader_error(f"Error loading save-to-share analysis: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def load_like_rate_by_position(days=90):
     """
     Analyze like rate by card position in pack (validates refinement hypothesis)
     """
-    engine = get_database_connection()
 
-    query = f"""
+    query = """
     SELECT
         dpc.card_order as position,
         COUNT(*) as total_cards,
@@ -4593,18 +4777,19 @@ def load_like_rate_by_position(days=90):
     INNER JOIN analytics_prod_bronze.src_dextr_queries dq ON dpc.pack_id = dq.response_pack_id
     INNER JOIN analytics_prod_silver.stg_users u ON dq.user_id = u.user_id
     WHERE u.is_test_user = 0
-    AND dq.query_timestamp >= current_date - interval '{days} days'
+    AND dq.query_timestamp >= current_date - CAST(:days AS integer) * INTERVAL '1 day'
     AND dpc.card_order IS NOT NULL
     GROUP BY dpc.card_order
     ORDER BY dpc.card_order
     """
 
+    params = {"days": days}
     try:
-        with engine.begin() as conn:
-            df = pd.read_sql(text(query), conn)
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, params)
         return df
     except Exception as e:
-        st.error(f"Error loading like rate by position: {str(e)}")
+        report_loader_error(f"Error loading like rate by position: {str(e)}")
         return pd.DataFrame()
 
 
@@ -4627,14 +4812,13 @@ on conflict (win_user_id, win_place_id, win_created_at) do nothing
 """
 
 
-@st.cache_data(ttl=60)
+@cached_loader(ttl=60)
 def load_spin_wheel_metrics(start_date, end_date):
     """Mechanism metrics for the spin-wheel winners page.
 
     Returns dict: total_spins, total_wins, win_rate, fulfillment_rate,
                   unique_winners, pending_contact, sent_count, redeemed_count.
     """
-    engine = get_database_connection()
     query = text("""
         with spins as (
             select count(*)::bigint as n
@@ -4677,18 +4861,17 @@ def load_spin_wheel_metrics(start_date, end_date):
         from spins, wins, outreach
     """)
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(query, conn, params={"start_date": start_date, "end_date": end_date})
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, {"start_date": start_date, "end_date": end_date})
         return df.iloc[0].to_dict() if not df.empty else {}
     except Exception as e:
-        st.error(f"Error loading spin wheel metrics: {str(e)}")
+        report_loader_error(f"Error loading spin wheel metrics: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=60)
+@cached_loader(ttl=60)
 def load_spin_wheel_daily_trend(start_date, end_date):
     """Daily spins vs wins in the selected range. Returns df[day, spins, wins]."""
-    engine = get_database_connection()
     query = text("""
         with days as (
             select generate_series(cast(:start_date as date), cast(:end_date as date), interval '1 day')::date as day
@@ -4719,17 +4902,16 @@ def load_spin_wheel_daily_trend(start_date, end_date):
         order by d.day
     """)
     try:
-        with engine.connect() as conn:
-            return pd.read_sql(query, conn, params={"start_date": start_date, "end_date": end_date})
+        with get_database_connection().connect() as conn:
+            return _read_sql(conn, query, {"start_date": start_date, "end_date": end_date})
     except Exception as e:
-        st.error(f"Error loading spin wheel daily trend: {str(e)}")
+        report_loader_error(f"Error loading spin wheel daily trend: {str(e)}")
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=60)
+@cached_loader(ttl=60)
 def load_spin_wheel_top_places(start_date, end_date, limit=10):
     """Top places by win count in the selected range."""
-    engine = get_database_connection()
     query = text("""
         select w.place_name, count(*)::bigint as win_count
         from public.spin_wheel_wins w
@@ -4741,13 +4923,13 @@ def load_spin_wheel_top_places(start_date, end_date, limit=10):
         limit :lim
     """)
     try:
-        with engine.connect() as conn:
-            return pd.read_sql(
-                query, conn,
-                params={"start_date": start_date, "end_date": end_date, "lim": limit},
+        with get_database_connection().connect() as conn:
+            return _read_sql(
+                conn, query,
+                {"start_date": start_date, "end_date": end_date, "lim": limit},
             )
     except Exception as e:
-        st.error(f"Error loading top win places: {str(e)}")
+        report_loader_error(f"Error loading top win places: {str(e)}")
         return pd.DataFrame()
 
 
@@ -4816,13 +4998,12 @@ def load_spin_wheel_winners_board(start_date, end_date, search_term=None, includ
             )
         return df
     except Exception as e:
-        st.error(f"Error loading spin wheel winners board: {str(e)}")
+        report_loader_error(f"Error loading spin wheel winners board: {str(e)}")
         return pd.DataFrame()
 
 
 def load_spin_wheel_audit_log(limit=20):
     """Recent outreach updates, most recent first. MVP treats updated_at as audit."""
-    engine = get_database_connection()
     query = text("""
         select
             o.updated_at,
@@ -4847,10 +5028,10 @@ def load_spin_wheel_audit_log(limit=20):
         limit :lim
     """)
     try:
-        with engine.connect() as conn:
-            return pd.read_sql(query, conn, params={"lim": limit})
+        with get_database_connection().connect() as conn:
+            return _read_sql(conn, query, {"lim": limit})
     except Exception as e:
-        st.error(f"Error loading spin wheel audit log: {str(e)}")
+        report_loader_error(f"Error loading spin wheel audit log: {str(e)}")
         return pd.DataFrame()
 
 
@@ -4941,7 +5122,7 @@ def update_winner_outreach_notes(outreach_id, notes):
         return False
 
 
-@st.cache_data(ttl=300)
+@cached_loader(ttl=300)
 def load_latest_eqt_memo(page, period_key):
     """Return the latest EQT insight memo for (page, period_key), or None.
 
@@ -4952,7 +5133,6 @@ def load_latest_eqt_memo(page, period_key):
     Returns dict with memo_markdown, scorecard_json, model_version, generated_at
     or None if no memo has been generated yet for this period.
     """
-    engine = get_database_connection()
     query = text("""
         select memo_markdown, scorecard_json, model_version, generated_at
         from analytics_ops.eqt_insight_memos
@@ -4961,11 +5141,11 @@ def load_latest_eqt_memo(page, period_key):
         limit 1
     """)
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(query, conn, params={"page": page, "period_key": period_key})
+        with get_database_connection().connect() as conn:
+            df = _read_sql(conn, query, {"page": page, "period_key": period_key})
         if df.empty:
             return None
         return df.iloc[0].to_dict()
     except Exception as e:
-        st.error(f"Error loading EQT memo: {str(e)}")
+        report_loader_error(f"Error loading EQT memo: {str(e)}")
         return None
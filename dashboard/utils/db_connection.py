@@ -1,18 +1,69 @@
 """Database connection utilities for DECK Analytics Dashboard"""
 
+import time
+
 import streamlit as st
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+
+from . import loader_metrics
+
+
+# Pool defaults — override any key in an optional [database_pool] section of
+# .streamlit/secrets.toml.
+POOL_DEFAULTS = {
+    "pool_size": 5,
+    "max_overflow": 5,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+    "statement_timeout_ms": 120000,
+    # psycopg prepares a statement server-side after this many executions of
+    # the same query text. Set to 0 to disable (e.g. behind a transaction-mode
+    # pooler that can't hold prepared statements).
+    "prepare_threshold": 5,
+}
+
+
+def _pool_settings():
+    """Merge the [database_pool] secrets section over POOL_DEFAULTS."""
+    settings = dict(POOL_DEFAULTS)
+    settings.update(st.secrets.get("database_pool", {}))
+    return settings
 
 
 @st.cache_resource
 def get_database_connection():
-    """Create database connection using Supabase credentials from secrets"""
+    """Create pooled database engine using Supabase credentials from secrets"""
     db_host = st.secrets["supabase"]["host"]
     db_port = st.secrets["supabase"]["port"]
     db_name = st.secrets["supabase"]["database"]
     db_user = st.secrets["supabase"]["user"]
     db_password = st.secrets["supabase"]["password"]
 
+    pool = _pool_settings()
+    connect_args = {"prepare_threshold": int(pool["prepare_threshold"]) or None}
+    if pool["statement_timeout_ms"]:
+        connect_args["options"] = f"-c statement_timeout={int(pool['statement_timeout_ms'])}"
+
     connection_string = f"postgresql+psycopg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-    engine = create_engine(connection_string)
+    engine = create_engine(
+        connection_string,
+        pool_size=int(pool["pool_size"]),
+        max_overflow=int(pool["max_overflow"]),
+        pool_timeout=int(pool["pool_timeout"]),
+        pool_recycle=int(pool["pool_recycle"]),
+        pool_pre_ping=bool(pool["pool_pre_ping"]),
+        connect_args=connect_args,
+    )
+    event.listen(engine, "before_cursor_execute", _start_query_timer)
+    event.listen(engine, "after_cursor_execute", _stop_query_timer)
     return engine
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info["deck_query_started"] = time.perf_counter()
+
+
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    """Charge the statement's execution time to the loader call running it."""
+    loader_metrics.record_sql(time.perf_counter() - conn.info["deck_query_started"])
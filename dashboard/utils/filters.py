@@ -3,6 +3,7 @@
 import streamlit as st
 from datetime import date, timedelta
 from utils.data_loader import load_app_versions_with_dates
+from utils.result_cache import cached_loader
 
 
 def render_sidebar_filters(
@@ -92,14 +93,13 @@ def render_sidebar_filters(
     return filters
 
 
-@st.cache_data(ttl=300)
+@cached_loader()
 def _get_activation_cohort_weeks():
     """Get distinct activation weeks from fct_user_segments."""
     from utils.db_connection import get_database_connection
     from sqlalchemy import text
     import pandas as pd
 
-    engine = get_database_connection()
     query = """
     SELECT DISTINCT activation_week
     FROM analytics_prod_gold.fct_user_segments
@@ -107,7 +107,7 @@ def _get_activation_cohort_weeks():
     ORDER BY activation_week DESC
     """
     try:
-        with engine.connect() as conn:
+        with get_database_connection().connect() as conn:
             df = pd.read_sql(text(query), conn)
         return [str(w) for w in df['activation_week'].tolist()]
     except Exception:
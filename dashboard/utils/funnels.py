@@ -0,0 +1,158 @@
+"""Vectorized ordered funnels over a per-user event extract.
+
+Funnels on the dashboard used to be one hand-written multi-CTE query each.
+``FunnelEngine`` instead sorts an event extract (see
+``load_funnel_event_extract``) by user and time once; any funnel is then a
+few ``searchsorted`` calls over that sorted array, one per step:
+
+    engine = FunnelEngine(load_funnel_event_extract(days=90))
+    engine.funnel(
+        [("Prompt", {"event_type": "query"}),
+         ("Save", {"event_type": "save"}),
+         ("Share", {"event_category": "Share"})],
+        window=pd.Timedelta(days=7),
+        mask=engine.users["signup_date"] >= cutoff,
+        by="cohort_week",
+    )
+
+A step is a (name, predicate) pair. The predicate is either a dict of
+column -> value (or list of values), all of which must match, or a callable
+taking the events DataFrame and returning a boolean mask.
+
+Semantics: a user enters at their first event matching step 1. Each later
+step is the user's first matching event after the previous step's event
+(a different event; events at the same instant count in extract order) and
+within ``window`` of entry.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class FunnelEngine:
+    """Event extract indexed by (user, time) plus one row of attributes per user.
+
+    Args:
+        events: extract with user_id, event_timestamp, and any columns the
+            step predicates use.
+        user_columns: per-user attributes (constant within a user) copied to
+            ``users`` for cohort masks and ``by`` groupings.
+    """
+
+    def __init__(self, events, user_columns=("signup_date", "cohort_week")):
+        # A failed extract load is a column-less frame; treat it as no events
+        if not {"user_id", "event_timestamp"} <= set(events.columns):
+            events = pd.DataFrame(columns=["user_id", "event_timestamp"])
+        events = events.dropna(subset=["user_id", "event_timestamp"])
+        codes, _ = pd.factorize(events["user_id"])
+        ns = pd.to_datetime(events["event_timestamp"], utc=True).astype("int64").to_numpy()
+
+        # Sort user-major then time, at full nanosecond precision; same-instant
+        # events keep extract order. "First event of user u after position p"
+        # is then a searchsorted over the sorted positions matching a step.
+        # Events stay in extract order; _order maps sorted position -> row, so
+        # predicates are evaluated on the extract and permuted once.
+        self.events = events.reset_index(drop=True)
+        self._order = np.lexsort((ns, codes))
+        self._user = codes[self._order].astype(np.int64)
+        self._ts = ns[self._order]
+
+        first = np.unique(self._user, return_index=True)[1]
+        columns = ["user_id"] + [c for c in user_columns if c in self.events.columns]
+        self.users = self.events.iloc[self._order[first]][columns].reset_index(drop=True)
+
+    def __len__(self):
+        return len(self.users)
+
+    def _step_mask(self, predicate):
+        """Boolean mask over the (user, time)-sorted events for one step predicate."""
+        if not len(self.events):
+            return np.zeros(0, dtype=bool)
+        if callable(predicate):
+            mask = np.asarray(predicate(self.events), dtype=bool)
+        else:
+            mask = np.ones(len(self.events), dtype=bool)
+            for column, value in predicate.items():
+                values = value if isinstance(value, (list, tuple, set)) else [value]
+                mask &= self.events[column].isin(values).to_numpy()
+        return mask[self._order]
+
+    def funnel(self, steps, window=None, mask=None, by=None):
+        """Evaluate an ordered funnel.
+
+        Args:
+            steps: ordered list of (name, predicate).
+            window: max time from entry to any later step (Timedelta or
+                seconds); None for no limit.
+            mask: optional boolean Series/array over ``users`` (cohort filter).
+            by: optional ``users`` column (or list) to split the funnel by.
+
+        Returns:
+            DataFrame with the ``by`` columns, cohort_users, step_index, step,
+            users, conversion_rate (vs step 1), step_conversion (vs the
+            previous step) and median_seconds (entry to reaching the step).
+        """
+        if isinstance(window, pd.Timedelta):
+            window = window.total_seconds()
+        keep = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+
+        keys = [] if by is None else ([by] if isinstance(by, str) else list(by))
+        if keys:
+            group = self.users[keys].groupby(keys, sort=True, dropna=False).ngroup().to_numpy()
+            labels = self.users[keys].assign(_group=group).drop_duplicates("_group").set_index("_group").sort_index()
+        else:
+            group = np.zeros(len(self), dtype=np.int64)
+            labels = pd.DataFrame(index=pd.RangeIndex(1))
+        n_groups = len(labels)
+        cohort_users = np.bincount(group[keep], minlength=n_groups)
+
+        # Entry: first matching event per kept user (events are time-sorted
+        # within each user, so np.unique's first index is the earliest)
+        entry = np.flatnonzero(self._step_mask(steps[0][1]) & keep[self._user])
+        users, first = np.unique(self._user[entry], return_index=True)
+        current = entry[first]
+        entered_at = self._ts[current]
+        deadline = entered_at + int(window * 10**9) if window is not None else np.full(len(users), np.iinfo(np.int64).max)
+
+        reached = [(users, np.zeros(len(users), dtype=np.int64))]
+        for _, predicate in steps[1:]:
+            step_positions = np.flatnonzero(self._step_mask(predicate))
+            if not len(step_positions) or not len(users):
+                users, current = users[:0], current[:0]
+                entered_at, deadline = entered_at[:0], deadline[:0]
+                reached.append((users, entered_at))
+                continue
+
+            # Each step needs a different, later event: search past the
+            # previous step's position
+            index = np.searchsorted(step_positions, current + 1)
+            hit = step_positions[np.minimum(index, len(step_positions) - 1)]
+            ok = (index < len(step_positions)) & (self._user[hit] == users) & (self._ts[hit] <= deadline)
+
+            users, current = users[ok], hit[ok]
+            entered_at, deadline = entered_at[ok], deadline[ok]
+            reached.append((users, self._ts[current] - entered_at))
+
+        frames = []
+        for index, ((name, _), (step_users, elapsed)) in enumerate(zip(steps, reached), start=1):
+            counts = np.bincount(group[step_users], minlength=n_groups)
+            medians = (pd.Series(elapsed, dtype="float64") / 10**9).groupby(group[step_users]).median()
+            frame = labels.reset_index(drop=True)
+            frame["_group"] = np.arange(n_groups)
+            frame["cohort_users"] = cohort_users
+            frame["step_index"] = index
+            frame["step"] = name
+            frame["users"] = counts
+            frame["median_seconds"] = medians.reindex(range(n_groups)).to_numpy()
+            frames.append(frame)
+
+        result = pd.concat(frames, ignore_index=True)
+        by_group = result.groupby("_group", sort=False)["users"]
+        base = by_group.transform("first")
+        previous = by_group.shift(1)
+        result["conversion_rate"] = (result["users"] / base).where(base > 0)
+        result["step_conversion"] = (result["users"] / previous).where(previous > 0)
+        if mask is not None:
+            result = result[result["cohort_users"] > 0]
+        return result.reset_index(drop=True)[keys + ["cohort_users", "step_index", "step", "users",
+                              "conversion_rate", "step_conversion", "median_seconds"]]
@@ -0,0 +1,73 @@
+"""Merging exact value histograms and reading quantiles from them.
+
+``fct_north_star_daily_sketch`` keeps each per-session distribution (save
+count, time to first save, time to first share) as an exact histogram per day
+and slice: parallel arrays of distinct values and the number of sessions with
+each. Pooling histograms is lossless, so quantiles over any date range and
+filter combination equal percentile_cont over the underlying sessions:
+
+    values, counts = merge_histograms(rows["ttfs_values"], rows["ttfs_counts"])
+    weighted_quantiles(values, counts, (0.5, 0.9, 0.99))
+"""
+
+import numpy as np
+
+
+def merge_histograms(values, counts):
+    """Pool histograms into one.
+
+    Args:
+        values: sequence of value arrays (None for an empty histogram).
+        counts: matching sequence of count arrays.
+
+    Returns:
+        (values, counts) as NumPy arrays, values ascending and distinct.
+    """
+    present = [i for i, v in enumerate(values) if v is not None and len(v)]
+    if not present:
+        return np.array([], dtype=np.float64), np.array([], dtype=np.int64)
+
+    flat_values = np.concatenate([np.asarray(values[i], dtype=np.float64) for i in present])
+    flat_counts = np.concatenate([np.asarray(counts[i], dtype=np.int64) for i in present])
+    merged, inverse = np.unique(flat_values, return_inverse=True)
+    return merged, np.bincount(inverse, weights=flat_counts).astype(np.int64)
+
+
+def weighted_quantiles(values, counts, quantiles):
+    """Quantiles of a histogram with percentile_cont (linear) interpolation.
+
+    Returns:
+        Array of the same length as ``quantiles``; NaN for an empty histogram.
+    """
+    quantiles = np.asarray(quantiles, dtype=np.float64)
+    total = int(counts.sum())
+    if not total:
+        return np.full(len(quantiles), np.nan)
+
+    # Rank r (0-based) of the sorted sessions falls in the first bucket whose
+    # cumulative count exceeds r
+    cumulative = np.cumsum(counts)
+    position = quantiles * (total - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, total - 1)
+    lower_value = values[np.searchsorted(cumulative, lower, side="right")]
+    upper_value = values[np.searchsorted(cumulative, upper, side="right")]
+    return lower_value + (upper_value - lower_value) * (position - lower)
+
+
+def summarize_histograms(values, counts, quantiles=(0.5, 0.9, 0.99)):
+    """Merge histograms and describe the pooled distribution.
+
+    Returns:
+        dict with ``sessions``, ``mean`` and ``p50``/``p90``/... for each
+        requested quantile.
+    """
+    merged, merged_counts = merge_histograms(list(values), list(counts))
+    total = int(merged_counts.sum())
+    summary = {
+        "sessions": total,
+        "mean": float((merged * merged_counts).sum() / total) if total else np.nan,
+    }
+    for q, value in zip(quantiles, weighted_quantiles(merged, merged_counts, quantiles)):
+        summary[f"p{q * 100:g}"] = float(value)
+    return summary
@@ -0,0 +1,99 @@
+"""Merging and estimating HyperLogLog distinct-user sketches.
+
+``fct_active_users_daily_sketch`` stores one sparse sketch per day and slice
+(parallel arrays of register indexes and ranks, see macros/hll.sql). Merging
+is a per-register max, so unique users over any window is the estimate of the
+merged sketch:
+
+    count_distinct(rows, "planner_registers", "planner_ranks")
+    count_distinct(rows, "active_registers", "active_ranks", by="period_start")
+
+Estimates have a relative standard error of ``HLL_RELATIVE_ERROR`` (~1.6%);
+about 95% of estimates land within twice that of the exact count. Small
+counts use linear counting and are close to exact.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+# Must match macros/hll.sql
+HLL_PRECISION = 12
+HLL_REGISTERS = 1 << HLL_PRECISION
+HLL_RELATIVE_ERROR = 1.04 / math.sqrt(HLL_REGISTERS)
+
+_ALPHA = 0.7213 / (1 + 1.079 / HLL_REGISTERS)
+
+
+def merge_sketches(registers, ranks, groups=None, n_groups=1):
+    """Merge sparse sketches into dense register arrays.
+
+    Args:
+        registers: sequence of register-index arrays (None for an empty sketch).
+        ranks: matching sequence of rank arrays.
+        groups: optional integer group code per sketch; sketches sharing a code
+            are merged together.
+        n_groups: number of distinct group codes.
+
+    Returns:
+        uint8 array of shape (n_groups, HLL_REGISTERS).
+    """
+    dense = np.zeros((n_groups, HLL_REGISTERS), dtype=np.uint8)
+    lengths = np.array([0 if r is None else len(r) for r in registers], dtype=np.int64)
+    if not lengths.sum():
+        return dense
+
+    present = [i for i, n in enumerate(lengths) if n]
+    flat_registers = np.concatenate([np.asarray(registers[i], dtype=np.int64) for i in present])
+    flat_ranks = np.concatenate([np.asarray(ranks[i], dtype=np.uint8) for i in present])
+    if groups is None:
+        flat_groups = np.zeros(len(flat_registers), dtype=np.int64)
+    else:
+        flat_groups = np.repeat(np.asarray(groups, dtype=np.int64), lengths)
+
+    np.maximum.at(dense, (flat_groups, flat_registers), flat_ranks)
+    return dense
+
+
+def estimate(dense):
+    """Distinct-count estimate for each row of a dense register array."""
+    dense = np.atleast_2d(dense)
+    m = HLL_REGISTERS
+    raw = _ALPHA * m * m / np.exp2(-dense.astype(np.float64)).sum(axis=1)
+    zeros = (dense == 0).sum(axis=1)
+    # Linear counting is far more accurate while many registers are empty
+    linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.rint(np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)).astype(np.int64)
+
+
+def count_distinct(frame, registers_col, ranks_col, by=None):
+    """Estimated distinct users across the sketches in ``frame``.
+
+    Args:
+        frame: sketch rows.
+        registers_col, ranks_col: columns holding the sparse sketch arrays.
+        by: optional column (or list of columns) to merge within.
+
+    Returns:
+        int when ``by`` is None, else a DataFrame of the ``by`` columns and an
+        ``estimate`` column.
+    """
+    registers = frame[registers_col].tolist()
+    ranks = frame[ranks_col].tolist()
+    if by is None:
+        return int(estimate(merge_sketches(registers, ranks))[0])
+
+    keys = [by] if isinstance(by, str) else list(by)
+    codes = frame.groupby(keys, sort=True, dropna=False).ngroup().to_numpy()
+    result = (
+        frame[keys].assign(_group=codes)
+        .drop_duplicates("_group")
+        .sort_values("_group")
+        .drop(columns="_group")
+        .reset_index(drop=True)
+    )
+    dense = merge_sketches(registers, ranks, groups=codes, n_groups=len(result))
+    result["estimate"] = estimate(dense)
+    return result
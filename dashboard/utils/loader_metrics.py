@@ -0,0 +1,229 @@
+"""Per-call latency and cache instrumentation for dashboard loaders.
+
+Every ``@cached_loader`` call is recorded here: loader name, normalized
+arguments, where the result came from (``memory`` = in-process cache, ``disk`` =
+shared result cache, ``miss`` = database), wall time, time spent executing SQL,
+row count and result size. Records go to an in-process ring buffer and,
+optionally, to an append-only JSON-lines log that every Streamlit process on
+the host can share. The hidden Loader Metrics page (pages/99_⏱️_Loader_Metrics.py)
+summarizes them as p50/p95 per loader.
+
+Configure with an optional [loader_metrics] section in .streamlit/secrets.toml
+(see METRICS_DEFAULTS).
+"""
+
+import collections
+import contextlib
+import json
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+import pandas as pd
+import streamlit as st
+
+
+METRICS_DEFAULTS = {
+    "enabled": True,
+    # Calls kept in memory per process; the oldest are dropped first.
+    "buffer_size": 5000,
+    # Append-only JSON-lines log, off when empty. Only calls taking at least
+    # log_min_ms are written, so it doubles as a slow-query log.
+    "log_path": "",
+    "log_min_ms": 0,
+}
+
+# "stale": a stale_while_revalidate loader served its previous result;
+# "coalesced": waited for another caller's identical in-flight load.
+CACHE_OUTCOMES = ("memory", "disk", "stale", "coalesced", "miss")
+
+_current_call = ContextVar("deck_loader_call", default=None)
+_buffer_lock = threading.Lock()
+_log_lock = threading.Lock()
+_buffer = collections.deque(maxlen=METRICS_DEFAULTS["buffer_size"])
+
+
+def metrics_settings():
+    """Merge the [loader_metrics] secrets section over METRICS_DEFAULTS."""
+    settings = dict(METRICS_DEFAULTS)
+    with contextlib.suppress(FileNotFoundError, KeyError):
+        settings.update(st.secrets.get("loader_metrics", {}))
+    return settings
+
+
+def result_bytes(value):
+    """In-memory size of a loader result: deep for DataFrames, JSON length otherwise."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (dict, list, tuple)):
+        return len(json.dumps(value if isinstance(value, dict) else list(value), default=str))
+    return None
+
+
+def _result_shape(value, measure_bytes):
+    """(rows, bytes) of a loader result. bytes is None unless measure_bytes."""
+    if isinstance(value, pd.DataFrame):
+        rows = len(value)
+    elif isinstance(value, dict):
+        rows = 1 if value else 0
+    elif isinstance(value, (list, tuple)):
+        rows = len(value)
+    else:
+        rows = None
+    return rows, result_bytes(value) if measure_bytes else None
+
+
+@contextlib.contextmanager
+def track_call(loader, params):
+    """Record one loader call made inside the ``with`` block.
+
+    Args:
+        loader: loader function name.
+        params: the call's normalized arguments as a JSON string.
+
+    The call starts as a ``memory`` hit; the code that actually loads the
+    result reports another outcome through mark_cache(), SQL timings
+    through record_sql() and the returned value through record_result().
+    """
+    settings = metrics_settings()
+    if not settings["enabled"]:
+        yield None
+        return
+
+    call = {
+        "loader": loader,
+        "params": params,
+        "cache": "memory",
+        "sql_ms": 0.0,
+        "queries": 0,
+        "rows": None,
+        "bytes": None,
+        "error": None,
+    }
+    token = _current_call.set(call)
+    started = time.perf_counter()
+    try:
+        yield call
+    except Exception as e:
+        call["error"] = type(e).__name__
+        raise
+    finally:
+        call["total_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        call["sql_ms"] = round(call["sql_ms"], 2)
+        call["ts"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        _current_call.reset(token)
+        _record(call, settings)
+
+
+def mark_cache(outcome):
+    """Report where the current call's result came from (see CACHE_OUTCOMES)."""
+    call = _current_call.get()
+    if call is not None:
+        call["cache"] = outcome
+
+
+def record_sql(elapsed_seconds):
+    """Add one executed query's wall time to the current call."""
+    call = _current_call.get()
+    if call is not None:
+        call["sql_ms"] += elapsed_seconds * 1000
+        call["queries"] += 1
+
+
+def record_result(value):
+    """Attach the row count and size of the current call's result.
+
+    Size is only measured when the result was actually loaded (disk or
+    database): deep memory accounting on every in-process hit would cost
+    more than the hit itself.
+    """
+    call = _current_call.get()
+    if call is not None:
+        call["rows"], call["bytes"] = _result_shape(value, call["cache"] != "memory")
+
+
+def _record(call, settings):
+    """Append a finished call to the ring buffer and, if configured, the log."""
+    global _buffer
+    size = int(settings["buffer_size"])
+    with _buffer_lock:
+        if _buffer.maxlen != size:
+            _buffer = collections.deque(_buffer, maxlen=size)
+        _buffer.append(call)
+
+    if settings["log_path"] and call["total_ms"] >= float(settings["log_min_ms"]):
+        line = json.dumps(call) + "\n"
+        with _log_lock, contextlib.suppress(OSError):
+            with open(settings["log_path"], "a") as f:
+                f.write(line)
+
+
+def recent_calls():
+    """Calls recorded by this process, oldest first, as a DataFrame."""
+    with _buffer_lock:
+        calls = list(_buffer)
+    return pd.DataFrame(calls)
+
+
+def read_call_log(path=None, limit=50000):
+    """The last ``limit`` calls from the JSON-lines log (all processes)."""
+    path = path or metrics_settings()["log_path"]
+    if not path:
+        return pd.DataFrame()
+    try:
+        with open(path) as f:
+            lines = collections.deque(f, maxlen=limit)
+    except OSError:
+        return pd.DataFrame()
+    calls = []
+    for line in lines:
+        with contextlib.suppress(ValueError):
+            calls.append(json.loads(line))
+    return pd.DataFrame(calls)
+
+
+def clear_recent_calls():
+    """Empty this process's ring buffer. The log file is left alone."""
+    with _buffer_lock:
+        _buffer.clear()
+
+
+def summarize_calls(calls):
+    """Per-loader latency and cache summary of a calls DataFrame.
+
+    Returns one row per loader with call counts per cache outcome, hit rate,
+    p50/p95 wall time over all calls, p50/p95 SQL time over database misses,
+    and typical result rows/bytes. Sorted by p95 wall time, slowest first.
+    """
+    if calls.empty:
+        return pd.DataFrame()
+
+    outcomes = (
+        pd.crosstab(calls["loader"], calls["cache"])
+        .reindex(columns=list(CACHE_OUTCOMES), fill_value=0)
+    )
+    latency = calls.groupby("loader")["total_ms"].quantile([0.5, 0.95]).unstack()
+    latency.columns = ["p50_ms", "p95_ms"]
+
+    misses = calls[calls["cache"] == "miss"]
+    if misses.empty:
+        sql = pd.DataFrame(columns=["p50_sql_ms", "p95_sql_ms"])
+    else:
+        sql = misses.groupby("loader")["sql_ms"].quantile([0.5, 0.95]).unstack()
+        sql.columns = ["p50_sql_ms", "p95_sql_ms"]
+
+    sizes = calls.groupby("loader").agg(
+        median_rows=("rows", "median"),
+        max_bytes=("bytes", "max"),
+        last_called=("ts", "max"),
+    )
+
+    summary = outcomes.join([latency, sql, sizes])
+    summary.insert(0, "calls", outcomes.sum(axis=1))
+    summary.insert(
+        len(CACHE_OUTCOMES) + 1,
+        "hit_rate",
+        (summary["calls"] - summary["miss"]) / summary["calls"],
+    )
+    return summary.sort_values("p95_ms", ascending=False).reset_index()
@@ -0,0 +1,106 @@
+"""Parallel loader execution for DECK Analytics Dashboard pages.
+
+Pages call 8-12 independent ``load_*`` functions per rerun. ``run_loaders``
+runs them on a bounded thread pool so the wall-clock cost approaches the
+slowest single query instead of the sum. Each worker checks out its own
+connection from the pooled engine, and the loaders are the same
+``@cached_loader`` functions a page would call directly, so a parallel run
+fills exactly the cache entries a sequential run would.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+import threading
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from .db_connection import _pool_settings
+from .result_cache import quiet_loader_errors
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_capacity():
+    """Most connections the engine will hand out at once."""
+    pool = _pool_settings()
+    return int(pool["pool_size"]) + int(pool["max_overflow"])
+
+
+def _as_callable(call):
+    """Normalize a loader call: a callable, or a (fn, args[, kwargs]) tuple."""
+    if callable(call):
+        return call
+    fn, args, *rest = call
+    kwargs = rest[0] if rest else {}
+    return partial(fn, *args, **kwargs)
+
+
+def run_loaders(calls, max_workers=None):
+    """Run loader calls concurrently and return their results in order.
+
+    Args:
+        calls: list of loader calls, or dict of name -> loader call. Each call
+            is a zero-arg callable (lambda / functools.partial) or a
+            ``(fn, args)`` / ``(fn, args, kwargs)`` tuple.
+        max_workers: thread cap. Defaults to the engine's pool capacity so
+            workers never queue on pool checkout.
+
+    Returns:
+        list of results in the order of ``calls``, or a dict with the same keys
+        when ``calls`` is a dict. If any loader raises, the first exception (in
+        call order) is re-raised after every call has finished, as it would have
+        been by the sequential loop.
+    """
+    keys = list(calls.keys()) if isinstance(calls, dict) else None
+    fns = [_as_callable(c) for c in (calls.values() if keys is not None else calls)]
+    if not fns:
+        return {} if keys is not None else []
+
+    workers = min(len(fns), max_workers or _pool_capacity())
+    ctx = get_script_run_ctx()
+
+    def _run(fn):
+        # Attach the page's script context so st.error and other st calls
+        # behave exactly as they do on the script thread.
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fn()
+
+    if workers <= 1:
+        results = [fn() for fn in fns]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="deck-loader") as pool:
+            futures = [pool.submit(_run, fn) for fn in fns]
+        for future in futures:
+            exc = future.exception()
+            if exc is not None:
+                raise exc
+        results = [future.result() for future in futures]
+
+    if keys is not None:
+        return dict(zip(keys, results))
+    return results
+
+
+def prefetch_loaders(calls, max_workers=None):
+    """Warm the cache for ``calls`` in parallel, discarding results.
+
+    Use on pages that call their loaders lazily further down the script: the
+    later direct calls then resolve from the in-process cache. Failures are
+    logged, not shown: a failed load isn't cached, so the direct call runs it
+    again and reports the error on the page once.
+    """
+    safe_calls = [_swallow(_as_callable(c)) for c in (calls.values() if isinstance(calls, dict) else calls)]
+    run_loaders(safe_calls, max_workers=max_workers)
+
+
+def _swallow(fn):
+    """Wrap fn so a failure surfaces on the later direct call, not here."""
+    def _call():
+        try:
+            with quiet_loader_errors():
+                fn()
+        except Exception:
+            logger.exception("Prefetching %s failed", getattr(getattr(fn, "func", fn), "__name__", fn))
+    return _call
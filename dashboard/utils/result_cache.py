@@ -0,0 +1,655 @@
+"""Persistent loader result cache shared across Streamlit processes.
+
+``st.cache_data`` lives inside one process, so every dashboard restart or extra
+replica runs each heavy gold query cold. ``cached_loader`` is a drop-in for
+``@st.cache_data(ttl=...)`` that layers a pluggable on-disk result cache
+underneath it: results are written as zstd Parquet files keyed by loader name
+plus normalized arguments, so every process on the host shares warm results.
+
+Gold and silver tables only change when dbt rebuilds them, so loaders are keyed
+on a *build generation* — the latest dbt invocation recorded in
+analytics_ops.dbt_build_log (or a local run_results.json) — rather than expiring
+on a fixed TTL. A cached result is served until the next build lands. Loaders
+over live application tables pass an explicit ``ttl`` instead.
+
+Configure with an optional [result_cache] section in .streamlit/secrets.toml
+(see CACHE_DEFAULTS). ``backend = "none"`` turns the shared layer off.
+"""
+
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+from sqlalchemy import text
+from streamlit.runtime.scriptrunner import (
+    RerunException,
+    StopException,
+    add_script_run_ctx,
+    get_script_run_ctx,
+)
+
+from . import loader_metrics
+from .bulk_fetch import STRING_DTYPE
+from .db_connection import get_database_connection
+
+
+CACHE_DEFAULTS = {
+    # In-process layer: byte budget shared by every loader, and the eviction
+    # policy once it is full ("lru" or "lfu").
+    "memory_max_mb": 512,
+    "memory_policy": "lru",
+    "backend": "disk",
+    "path": os.path.join(tempfile.gettempdir(), "deck_dashboard_cache"),
+    "max_mb": 512,
+    # Build-generation polling. run_results_path, when set, points at a dbt
+    # target/run_results.json on this host and is checked before the database.
+    "generation_poll_seconds": 60,
+    "run_results_path": "",
+    # Upper bound on how long a build-scoped result is kept, and the fixed TTL
+    # used while no build generation can be read (e.g. before the
+    # dbt_build_log table exists).
+    "max_age_seconds": 86400,
+    "fallback_ttl_seconds": 300,
+    # Oldest previous result a stale_while_revalidate loader will serve while
+    # it reloads in the background.
+    "stale_max_seconds": 3600,
+}
+
+BUILD_GENERATION_SQL = """
+    select invocation_id
+    from analytics_ops.dbt_build_log
+    order by finished_at desc
+    limit 1
+"""
+
+_MISS = object()
+_KIND_KEY = b"deck_result_kind"
+
+_generation_lock = threading.Lock()
+_generation_state = {"token": None, "checked_at": float("-inf")}
+
+logger = logging.getLogger(__name__)
+
+# Messages passed to report_loader_error() by the loader call running in this
+# context, or None outside cached_loader
+_loader_errors = ContextVar("deck_loader_errors", default=None)
+# Set by quiet_loader_errors(): log loader errors instead of showing them
+_quiet_errors = ContextVar("deck_quiet_loader_errors", default=False)
+
+# Cache key -> Future of the load currently running for it (single-flight)
+_in_flight_lock = threading.Lock()
+_in_flight = {}
+
+
+class ResultCache:
+    """Backend interface. The base class caches nothing (backend = "none")."""
+
+    def get(self, key, ttl):
+        """Return the cached value for key, or _MISS if absent or older than ttl seconds."""
+        return _MISS
+
+    def set(self, key, value):
+        """Store value under key. Unsupported values are silently skipped."""
+
+    def clear(self):
+        """Drop every entry."""
+
+
+class DiskResultCache(ResultCache):
+    """Parquet files in one directory, shared by every process on the host.
+
+    Freshness is judged from the file's mtime (write time); recency of use is
+    tracked in its atime, which drives LRU eviction once the directory grows
+    past max_bytes. Writes go to a temp file and are renamed into place, so
+    concurrent readers never see a partial file.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.parquet")
+
+    def get(self, key, ttl):
+        path = self._file(key)
+        try:
+            stat = os.stat(path)
+            if ttl is not None and time.time() - stat.st_mtime > ttl:
+                return _MISS
+            table = pq.read_table(path)
+            # Bump the LRU position without restarting the TTL clock
+            os.utime(path, (time.time(), stat.st_mtime))
+        except (OSError, pa.ArrowException):
+            return _MISS
+        return _decode(table)
+
+    def set(self, key, value):
+        table = _encode(value)
+        if table is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression="zstd")
+            os.replace(tmp_path, self._file(key))
+        except (OSError, pa.ArrowException):
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def clear(self):
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".parquet"):
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+
+    def _evict(self):
+        """Delete least recently used files until the directory is under 90% of max_bytes."""
+        entries = []
+        for entry in os.scandir(self.path):
+            if not entry.name.endswith(".parquet"):
+                continue
+            with contextlib.suppress(OSError):
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                total -= size
+            if total <= target:
+                break
+
+
+class MemoryResultCache:
+    """In-process layer in front of the shared cache, bounded by total bytes.
+
+    Each result's in-memory size is measured once when it is stored (deep
+    ``memory_usage`` for DataFrames). Once the total passes max_bytes, expired
+    entries are dropped first, then the least recently used ("lru") or least
+    often hit ("lfu", ties broken by recency) until it fits again. A result
+    larger than the whole budget is not kept. Hit, miss and eviction counts and
+    resident bytes are tracked per loader for the Loader Metrics page.
+
+    Entries can carry a *slot*: the loader call without its build generation.
+    Storing a result drops the previous one in its slot, and get_stale() returns
+    it even after it expired or its generation was superseded, for
+    stale-while-revalidate. Expired entries otherwise stay until evicted.
+
+    Like st.cache_data, callers get their own copy of a cached value, so a
+    page adding a column to a frame doesn't change what the next rerun reads.
+    """
+
+    def __init__(self, max_bytes, policy="lru"):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"policy must be 'lru' or 'lfu', got {policy!r}")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._lock = threading.Lock()
+        # key -> entry dict, least recently used first
+        self._entries = collections.OrderedDict()
+        # slot -> key of the latest entry stored for it
+        self._slots = {}
+        self._bytes = 0
+        self._stats = collections.defaultdict(lambda: {"hits": 0, "stale": 0, "misses": 0, "evictions": 0})
+
+    def get(self, loader, key):
+        """Return a copy of the live value for key, or _MISS."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["expires_at"] <= time.time():
+                self._stats[loader]["misses"] += 1
+                return _MISS
+            self._entries.move_to_end(key)
+            entry["hits"] += 1
+            self._stats[loader]["hits"] += 1
+            value = entry["value"]
+        return _copy(value)
+
+    def get_stale(self, loader, slot, max_age):
+        """Return a copy of the latest value stored for slot within max_age seconds, or _MISS."""
+        with self._lock:
+            key = self._slots.get(slot)
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry["stored_at"] > max_age:
+                return _MISS
+            self._entries.move_to_end(key)
+            self._stats[loader]["stale"] += 1
+            value = entry["value"]
+        return _copy(value)
+
+    def set(self, loader, key, value, ttl, slot=None):
+        """Keep value under key for ttl seconds, evicting others to stay in budget."""
+        size = loader_metrics.result_bytes(value) or 0
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        entry = {
+            "loader": loader,
+            "slot": slot,
+            "value": _copy(value),
+            "bytes": size,
+            "stored_at": now,
+            "expires_at": now + ttl,
+            "hits": 0,
+        }
+        with self._lock:
+            for previous in (key, self._slots.get(slot)):
+                if previous in self._entries:
+                    self._remove(previous)
+            self._entries[key] = entry
+            if slot is not None:
+                self._slots[slot] = key
+            self._bytes += size
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def clear(self, loader=None):
+        """Drop every entry, or only ``loader``'s."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if loader is None or e["loader"] == loader]:
+                self._remove(key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry["bytes"]
+        if entry["slot"] is not None and self._slots.get(entry["slot"]) == key:
+            del self._slots[entry["slot"]]
+        return entry
+
+    def _evict(self):
+        now = time.time()
+        for key in [k for k, e in self._entries.items() if e["expires_at"] <= now]:
+            self._remove(key)
+        # The entry just stored is last and never a candidate: under LFU it
+        # would always lose with zero hits
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            if self.policy == "lfu":
+                # min() keeps the first of equal hit counts, i.e. the least recent
+                key = min(list(self._entries)[:-1], key=lambda k: self._entries[k]["hits"])
+            else:
+                key = next(iter(self._entries))
+            self._stats[self._remove(key)["loader"]]["evictions"] += 1
+
+    def stats(self):
+        """One row per loader: entries, resident_bytes, hits, stale, misses, hit_ratio, evictions."""
+        with self._lock:
+            rows = {
+                loader: {"loader": loader, "entries": 0, "resident_bytes": 0, **counts}
+                for loader, counts in self._stats.items()
+            }
+            for entry in self._entries.values():
+                row = rows.setdefault(entry["loader"], {
+                    "loader": entry["loader"], "entries": 0, "resident_bytes": 0,
+                    "hits": 0, "stale": 0, "misses": 0, "evictions": 0,
+                })
+                row["entries"] += 1
+                row["resident_bytes"] += entry["bytes"]
+        frame = pd.DataFrame(
+            list(rows.values()),
+            columns=["loader", "entries", "resident_bytes", "hits", "stale", "misses", "evictions"],
+        )
+        lookups = frame["hits"] + frame["misses"]
+        frame.insert(6, "hit_ratio", (frame["hits"] / lookups).where(lookups > 0))
+        return frame.sort_values("resident_bytes", ascending=False).reset_index(drop=True)
+
+    @property
+    def resident_bytes(self):
+        return self._bytes
+
+
+def _copy(value):
+    """Copy of a loader result that a caller can mutate freely."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return type(value)(value)
+    return value
+
+
+def _encode(value):
+    """Convert a loader result to an Arrow table, or None if it can't be persisted.
+
+    DataFrames are stored as-is; dict results (single-row KPI loaders) as a
+    one-row frame; list results as a one-column frame. Empty results are
+    stored too: a filter that matches nothing is an answer worth caching.
+    """
+    if isinstance(value, pd.DataFrame):
+        kind, frame = "frame", value
+    elif isinstance(value, dict):
+        kind, frame = "record", pd.DataFrame([value]) if value else pd.DataFrame()
+    elif isinstance(value, list):
+        kind, frame = "list", pd.DataFrame({"value": value})
+    else:
+        return None
+    try:
+        table = pa.Table.from_pandas(frame)
+    except (pa.ArrowException, TypeError, ValueError):
+        # e.g. object columns holding UUIDs — keep these in-process only
+        return None
+    metadata = dict(table.schema.metadata or {})
+    metadata[_KIND_KEY] = kind.encode()
+    return table.replace_schema_metadata(metadata)
+
+
+def _decode(table):
+    """Inverse of _encode."""
+    metadata = table.schema.metadata or {}
+    kind = metadata.get(_KIND_KEY, b"frame").decode()
+    frame = table.to_pandas()
+    if kind == "frame":
+        # Arrow-backed text columns (bulk=True loaders) read back as
+        # string[python]; restore read_frame's dtype. Object text stays object.
+        for column in json.loads(metadata.get(b"pandas", b"{}")).get("columns", []):
+            if column["numpy_type"] == "string" and column["name"] in frame.columns:
+                frame[column["name"]] = frame[column["name"]].astype(STRING_DTYPE)
+        return frame
+    if kind == "record":
+        return frame.to_dict(orient="records")[0] if len(frame) else {}
+    return frame["value"].tolist()
+
+
+def _normalize(value):
+    """JSON fallback for loader arguments: dates as ISO strings, sets sorted."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _bound_arguments(fn, args, kwargs):
+    """fn's call arguments by parameter name, with defaults applied."""
+    bound = inspect.signature(fn).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def _cache_key(fn, source_hash, args, kwargs):
+    """Loader name + hash of its source and normalized, defaults-applied arguments."""
+    payload = json.dumps(
+        [source_hash, _bound_arguments(fn, args, kwargs)], sort_keys=True, default=_normalize
+    )
+    digest = hashlib.sha256(payload.encode()).hexdigest()[:32]
+    return f"{fn.__name__}-{digest}"
+
+
+def _cache_settings():
+    """Merge the [result_cache] secrets section over CACHE_DEFAULTS."""
+    settings = dict(CACHE_DEFAULTS)
+    with contextlib.suppress(FileNotFoundError, KeyError):
+        settings.update(st.secrets.get("result_cache", {}))
+    return settings
+
+
+@st.cache_resource
+def get_memory_cache():
+    """Build this process's in-memory result cache."""
+    settings = _cache_settings()
+    return MemoryResultCache(int(settings["memory_max_mb"]) * 1024 * 1024, settings["memory_policy"])
+
+
+@st.cache_resource
+def get_result_cache():
+    """Build the configured shared result cache backend (once per process)."""
+    settings = _cache_settings()
+    if settings["backend"] == "disk":
+        return DiskResultCache(settings["path"], int(settings["max_mb"]) * 1024 * 1024)
+    return ResultCache()
+
+
+def _read_build_generation(settings):
+    """Latest dbt invocation id from run_results.json or dbt_build_log, else None."""
+    if settings["run_results_path"]:
+        with contextlib.suppress(OSError, ValueError, KeyError):
+            with open(settings["run_results_path"]) as f:
+                return json.load(f)["metadata"]["invocation_id"]
+    try:
+        with get_database_connection().connect() as conn:
+            return conn.execute(text(BUILD_GENERATION_SQL)).scalar()
+    except Exception:
+        return None
+
+
+def current_build_generation():
+    """Token identifying the latest dbt build, polled at most once per interval.
+
+    Falls back to a time bucket of fallback_ttl_seconds when no build has been
+    recorded, so build-scoped loaders then behave like the old fixed-TTL cache.
+    """
+    settings = _cache_settings()
+    now = time.time()
+    with _generation_lock:
+        if now - _generation_state["checked_at"] >= float(settings["generation_poll_seconds"]):
+            _generation_state["token"] = _read_build_generation(settings)
+            _generation_state["checked_at"] = now
+        token = _generation_state["token"]
+    if token is None:
+        return f"ttl-{int(now // float(settings['fallback_ttl_seconds']))}"
+    return token
+
+
+def cached_loader(ttl=None, stale_while_revalidate=False):
+    """Drop-in for ``@st.cache_data`` backed by the shared result cache.
+
+    Lookups go in-process memory cache -> shared result cache -> database.
+    A database result is written to the shared cache so other processes, and
+    this one after a restart, start warm. Every call is recorded in
+    loader_metrics with the layer that answered it.
+
+    The memory layer (MemoryResultCache) replaces st.cache_data, which has
+    no bound on total size: loaders keyed on free-form arguments would
+    otherwise grow the process with every distinct call. Empty results are
+    cached like any other; a loader that caught an error reports it with
+    report_loader_error(), and its fallback result is kept out of both
+    layers.
+
+    Misses are single-flight: concurrent calls with the same arguments (e.g.
+    every session opening Home right after a build lands) wait for one load
+    instead of each querying the database.
+
+    Args:
+        ttl: None (the default) for loaders over dbt-built tables: results are
+            keyed on current_build_generation() and kept until the next build
+            (capped at max_age_seconds). Pass seconds for loaders that read
+            live application tables, which dbt builds don't track.
+        stale_while_revalidate: on a miss, return this process's previous
+            result for the same arguments (stored within stale_max_seconds)
+            straight away and reload it on a background thread.
+    """
+    def decorator(fn):
+        source_hash = hashlib.sha256(inspect.getsource(fn).encode()).hexdigest()
+        settings = _cache_settings()
+        max_age = ttl if ttl is not None else int(settings["max_age_seconds"])
+        max_stale = float(settings["stale_max_seconds"])
+
+        def load(memory, cache, key, slot, args, kwargs):
+            value = cache.get(key, max_age)
+            if value is _MISS:
+                loader_metrics.mark_cache("miss")
+                errors = []
+                token = _loader_errors.set(errors)
+                try:
+                    value = fn(*args, **kwargs)
+                finally:
+                    _loader_errors.reset(token)
+                if errors:
+                    return value
+                cache.set(key, value)
+            else:
+                loader_metrics.mark_cache("disk")
+            memory.set(fn.__name__, key, value, max_age, slot=slot)
+            return value
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            generation = current_build_generation() if ttl is None else None
+            params = json.dumps(_bound_arguments(fn, args, kwargs), sort_keys=True, default=_normalize)
+            with loader_metrics.track_call(fn.__name__, params):
+                memory, cache = get_memory_cache(), get_result_cache()
+                key = _cache_key(fn, f"{source_hash}:{generation}", args, kwargs)
+                slot = _cache_key(fn, source_hash, args, kwargs)
+                reload = functools.partial(load, memory, cache, key, slot, args, kwargs)
+
+                value = memory.get(fn.__name__, key)
+                if value is _MISS and stale_while_revalidate:
+                    value = memory.get_stale(fn.__name__, slot, max_stale)
+                    if value is not _MISS:
+                        loader_metrics.mark_cache("stale")
+                        _revalidate(fn.__name__, params, key, reload)
+                if value is _MISS:
+                    value, leader = _single_flight(key, reload)
+                    if not leader:
+                        value = _copy(value)
+                loader_metrics.record_result(value)
+            return value
+
+        wrapper.clear = functools.partial(_clear_memory, fn.__name__)
+        return wrapper
+
+    return decorator
+
+
+def _single_flight(key, load):
+    """Run load() once for all concurrent callers with the same key.
+
+    Returns (value, leader): leader is True for the caller that ran it. Other
+    callers block until it finishes and share its value (not a copy) or
+    exception. If the leader's run is cut short by Streamlit (a rerun or stop
+    of its own session), a waiting caller retries instead.
+    """
+    while True:
+        with _in_flight_lock:
+            future = _in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = _in_flight[key] = concurrent.futures.Future()
+        if leader:
+            return _lead(key, future, load), True
+        loader_metrics.mark_cache("coalesced")
+        try:
+            return future.result(), False
+        except Exception:
+            raise
+        except BaseException:
+            # The leader's script was rerun or stopped mid-load
+            continue
+
+
+def _lead(key, future, load):
+    """Run load() for key, already registered in _in_flight as future, and wake its waiters."""
+    # Unregister before waking the waiters, so a retrying one doesn't find
+    # this finished future again
+    try:
+        value = load()
+    except BaseException as e:
+        _release(key)
+        future.set_exception(e)
+        raise
+    _release(key)
+    future.set_result(value)
+    return value
+
+
+def _release(key):
+    with _in_flight_lock:
+        del _in_flight[key]
+
+
+def _revalidate(loader, params, key, load):
+    """Reload key on a background thread, unless a load of it is already running.
+
+    The key is registered as in flight before the thread starts, so two
+    reruns serving the same stale result start one refresh between them, and
+    callers arriving meanwhile wait on it. The thread carries the page's
+    script context, so a loader's st.error during the refresh is shown like
+    any other.
+    """
+    with _in_flight_lock:
+        if key in _in_flight:
+            return
+        future = _in_flight[key] = concurrent.futures.Future()
+    ctx = get_script_run_ctx()
+
+    def run():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        # The page's session may rerun or stop mid-refresh; waiters then retry
+        with contextlib.suppress(Exception, RerunException, StopException):
+            with loader_metrics.track_call(loader, params):
+                _lead(key, future, load)
+
+    threading.Thread(target=run, name=f"deck-revalidate-{loader}", daemon=True).start()
+
+
+def report_loader_error(message):
+    """Show a loader's caught exception and keep its fallback result uncached.
+
+    Loaders catch their own exceptions and return an empty or placeholder
+    result so the page still renders. Call this instead of st.error in the
+    except block: that result then isn't stored in either cache layer, so the
+    next call retries the query rather than serving the failure.
+    """
+    errors = _loader_errors.get()
+    if errors is not None:
+        errors.append(message)
+    if _quiet_errors.get():
+        logger.warning(message)
+    else:
+        st.error(message)
+
+
+@contextlib.contextmanager
+def quiet_loader_errors():
+    """Log report_loader_error() messages inside the block instead of showing them.
+
+    For cache warming (utils.parallel.prefetch_loaders): the failed result
+    isn't cached, so the page's own call retries and shows the error once.
+    """
+    token = _quiet_errors.set(True)
+    try:
+        yield
+    finally:
+        _quiet_errors.reset(token)
+
+
+def _clear_memory(loader):
+    """Drop one loader's in-process results (its ``.clear()``)."""
+    get_memory_cache().clear(loader)
+
+
+def memory_cache_stats():
+    """Per-loader entries, resident bytes, hit ratio and evictions of this process's memory cache."""
+    return get_memory_cache().stats()
+
+
+def clear_loader_caches():
+    """Clear the in-process and shared result caches (for Refresh buttons).
+
+    Also forces the next loader call to re-read the build generation.
+    """
+    get_memory_cache().clear()
+    get_result_cache().clear()
+    with _generation_lock:
+        _generation_state["checked_at"] = float("-inf")
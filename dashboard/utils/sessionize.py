@@ -0,0 +1,146 @@
+"""Re-sessionize an event extract for any inactivity gap.
+
+stg_unified_sessions splits inferred sessions at a fixed 5-minute gap.
+``SessionExtract`` sorts an event extract (see ``load_session_event_extract``)
+by user and time once and keeps the gap before each event; sessionizing at
+any gap is then a comparison against the precomputed ``diff`` and a
+difference of running ``cumsum`` totals of the event flags, with no dbt
+rebuild:
+
+    extract = SessionExtract(load_session_event_extract(start_date, end_date))
+    extract.sessionize(gap_seconds=600)        # one row per session
+    extract.compare([120, 300, 600, 1800])     # one summary row per gap
+
+Session boundaries and counts follow stg_unified_sessions: a session starts
+at a user's first event or after more than ``gap_seconds`` of inactivity;
+queries are event_type 'query', swipes 'swipe_right'/'swipe_left', saves
+'save', shares event_category 'Share'; a genuine planning attempt has at least
+one query, save or share.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_GAP_SECONDS = 300
+
+
+class SessionExtract:
+    """Events sorted by (user, time) with per-event action flags.
+
+    Args:
+        events: extract with user_id, event_timestamp, event_type and
+            event_category.
+    """
+
+    def __init__(self, events):
+        # A failed extract load is a column-less frame; treat it as no events
+        if not {"user_id", "event_timestamp"} <= set(events.columns):
+            events = pd.DataFrame(columns=["user_id", "event_timestamp", "event_type", "event_category"])
+        events = events.dropna(subset=["user_id", "event_timestamp"])
+        codes, self.user_ids = pd.factorize(events["user_id"])
+        ns = pd.to_datetime(events["event_timestamp"], utc=True).astype("int64").to_numpy()
+
+        # Sort user-major then time, at full nanosecond precision
+        order = np.lexsort((ns, codes))
+        self._user = codes[order]
+        self._ts = ns[order]
+        self.n_users = len(self.user_ids)
+
+        flags = np.column_stack([
+            events["event_type"].isin(["query"]).to_numpy(),
+            events["event_type"].isin(["swipe_right", "swipe_left"]).to_numpy(),
+            events["event_type"].isin(["save"]).to_numpy(),
+            events["event_category"].isin(["Share"]).to_numpy(),
+        ])[order]
+        # Running totals of query/swipe/save/share; any session's counts are
+        # the difference at its two ends.
+        self._cumulative = np.vstack([
+            np.zeros((1, flags.shape[1]), dtype=np.int64), np.cumsum(flags, axis=0, dtype=np.int64)
+        ])
+
+        # Nanoseconds since the same user's previous event; -1 at each user's
+        # first event so it always opens a session.
+        self._gap = np.full(len(self._ts), -1, dtype=np.int64)
+        if len(self._ts) > 1:
+            same_user = self._user[1:] == self._user[:-1]
+            self._gap[1:] = np.where(same_user, np.diff(self._ts), -1)
+
+    def __len__(self):
+        return len(self._ts)
+
+    def _boundaries(self, gap_seconds):
+        """Index of each session's first and last event for a gap."""
+        is_start = (self._gap < 0) | (self._gap > round(gap_seconds * 10**9))
+        starts = np.flatnonzero(is_start)
+        ends = np.append(starts[1:], len(self._ts)) - 1
+        return starts, ends
+
+    def _durations(self, starts, ends):
+        """Seconds between each session's first and last event."""
+        return (self._ts[ends] - self._ts[starts]) / 10**9
+
+    def _counts(self, starts, ends):
+        """Query, swipe, save and share counts per session (one column each)."""
+        return self._cumulative[ends + 1] - self._cumulative[starts]
+
+    def sessionize(self, gap_seconds=DEFAULT_GAP_SECONDS):
+        """One row per session for an inactivity gap.
+
+        Returns:
+            DataFrame with user_id, started_at, ended_at,
+            session_duration_seconds, event_count, query_count, swipe_count,
+            save_count, share_count and is_genuine_planning_attempt.
+        """
+        starts, ends = self._boundaries(gap_seconds)
+        if not len(starts):
+            return pd.DataFrame(columns=[
+                "user_id", "started_at", "ended_at", "session_duration_seconds", "event_count",
+                "query_count", "swipe_count", "save_count", "share_count", "is_genuine_planning_attempt",
+            ])
+
+        counts = self._counts(starts, ends)
+        sessions = pd.DataFrame({
+            "user_id": self.user_ids[self._user[starts]],
+            "started_at": pd.to_datetime(self._ts[starts], unit="ns", utc=True),
+            "ended_at": pd.to_datetime(self._ts[ends], unit="ns", utc=True),
+            "session_duration_seconds": self._durations(starts, ends),
+            "event_count": ends - starts + 1,
+            "query_count": counts[:, 0],
+            "swipe_count": counts[:, 1],
+            "save_count": counts[:, 2],
+            "share_count": counts[:, 3],
+        })
+        sessions["is_genuine_planning_attempt"] = (counts[:, [0, 2, 3]] > 0).any(axis=1)
+        return sessions
+
+    def summarize(self, gap_seconds=DEFAULT_GAP_SECONDS):
+        """Headline session metrics for one gap, without materializing sessions.
+
+        Returns:
+            dict with gap_seconds, sessions, sessions_per_user,
+            median_duration_seconds, median_events, save_rate, share_rate and
+            genuine_planning_rate (shares of sessions).
+        """
+        starts, ends = self._boundaries(gap_seconds)
+        sessions = len(starts)
+        if not sessions:
+            return {"gap_seconds": gap_seconds, "sessions": 0, "sessions_per_user": np.nan,
+                    "median_duration_seconds": np.nan, "median_events": np.nan,
+                    "save_rate": np.nan, "share_rate": np.nan, "genuine_planning_rate": np.nan}
+
+        has_action = self._counts(starts, ends) > 0
+        return {
+            "gap_seconds": gap_seconds,
+            "sessions": sessions,
+            "sessions_per_user": sessions / self.n_users,
+            "median_duration_seconds": float(np.median(self._durations(starts, ends))),
+            "median_events": float(np.median(ends - starts + 1)),
+            "save_rate": float(has_action[:, 2].mean()),
+            "share_rate": float(has_action[:, 3].mean()),
+            "genuine_planning_rate": float(has_action[:, [0, 2, 3]].any(axis=1).mean()),
+        }
+
+    def compare(self, gaps):
+        """summarize() for each gap, one row per gap."""
+        return pd.DataFrame([self.summarize(gap) for gap in gaps])
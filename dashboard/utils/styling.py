@@ -196,6 +196,11 @@ def apply_deck_branding():
         font-weight: 500;
     }}
 
+    /* Admin pages are reachable by URL only */
+    [data-testid="stSidebarNav"] li:has(a[href$="/Loader_Metrics"]) {{
+        display: none;
+    }}
+
     /* Metric Container - Minimal Card */
     [data-testid="metric-container"] {{
         background-color: {BRAND_COLORS['bg_main']};
@@ -0,0 +1,31 @@
+{#
+    WHERE clause for incremental bronze models (tag:incremental_bronze).
+
+    On an incremental run, keeps only source rows whose watermark column is no
+    more than bronze_lookback_days older than the newest row already copied.
+    Rows inside that window are re-copied and replace their earlier copy via
+    the model's unique_key, so late inserts and recent updates are absorbed.
+
+    The watermark is the source's own timestamp (for app_events the client's
+    event time), so a row that lands more than the lookback after that time is
+    never copied incrementally, and the incremental silver models downstream
+    would skip it too: they look back the same window on the same time. The
+    weekly `dbt run --full-refresh --select tag:incremental_bronze+`
+    (.github/workflows/dbt-scheduled.yml) rebuilds the bronze copies and every
+    model built on them, so such rows are in silver and gold within a week.
+
+    Future-dated rows (client clocks) are ignored when reading the watermark so
+    one bad timestamp can't push the window past rows that haven't arrived.
+    On a full build the macro renders nothing.
+#}
+{% macro bronze_watermark_filter(column) %}
+    {% if is_incremental() %}
+    where {{ column }} >= (
+        select coalesce(
+            max({{ column }}) filter (where {{ column }} <= now()),
+            '1900-01-01'
+        ) - interval '{{ var("bronze_lookback_days") }} days'
+        from {{ this }}
+    )
+    {% endif %}
+{% endmacro %}
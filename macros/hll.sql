@@ -0,0 +1,24 @@
+{#
+    HyperLogLog helpers for mergeable distinct counts.
+
+    A sketch is 4096 registers (precision 12). Each value is hashed with md5:
+    the first 12 bits pick the register, and the register keeps the highest
+    rank (leading zeros + 1) seen in the next 52 bits. Sketches are stored
+    sparse, as parallel arrays of non-empty register indexes and their ranks,
+    and merge by taking the per-register max — so sketches for any set of
+    days/slices combine into the sketch of their union.
+
+    Standard error of the estimate is 1.04 / sqrt(4096) ≈ 1.6%.
+    dashboard/utils/hll.py merges and estimates; its precision must match.
+#}
+
+{% macro hll_register(column) -%}
+    ('x' || substr(md5({{ column }}::text), 1, 3))::bit(12)::integer
+{%- endmacro %}
+
+{% macro hll_rank(column) -%}
+    coalesce(
+        nullif(position('1' in ('x' || substr(md5({{ column }}::text), 4, 13))::bit(52)::text), 0),
+        53
+    )
+{%- endmacro %}
@@ -0,0 +1,20 @@
+{#
+    Overrides dbt's built-in is_incremental() so models materialized as
+    partitioned_incremental (macros/materializations/partitioned_incremental.sql)
+    can use it too. For those, an existing table only counts once it is
+    actually partitioned: a plain table left by an earlier materialization is
+    rebuilt from scratch, so the model must render its full-build SQL.
+#}
+{% macro is_incremental() %}
+    {% if not execute %}
+        {{ return(false) }}
+    {% endif %}
+    {% set relation = adapter.get_relation(this.database, this.schema, this.table) %}
+    {% if relation is none or relation.type != 'table' or should_full_refresh() %}
+        {{ return(false) }}
+    {% endif %}
+    {% if model.config.materialized == 'partitioned_incremental' %}
+        {{ return(is_partitioned_relation(relation)) }}
+    {% endif %}
+    {{ return(model.config.materialized == 'incremental') }}
+{% endmacro %}
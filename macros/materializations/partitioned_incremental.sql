@@ -0,0 +1,141 @@
+{#
+    partitioned_incremental — an incremental model stored as a Postgres
+    declaratively partitioned table, so filters on the partition column only
+    read the matching partitions.
+
+        config(
+            materialized='partitioned_incremental',
+            unique_key='event_id',
+            partition_by={'column': 'event_name', 'type': 'list'},
+            -- or {'column': 'event_date', 'type': 'range', 'granularity': 'month'}
+            indexes=[...],
+        )
+
+    list:  one partition per distinct value (created as new values appear).
+    range: one partition per month ('granularity' is only 'month' for now).
+    Both get a DEFAULT partition for rows that fit nowhere else (e.g. nulls).
+
+    Each run builds the model SQL into a temp table first. A full build (no
+    table yet, --full-refresh, or an existing table that isn't partitioned)
+    then recreates the partitioned table in the same transaction; an
+    incremental run creates any missing partitions and applies delete+insert
+    on unique_key, like the stock incremental materialization. is_incremental()
+    works in these models (see macros/is_incremental.sql). Config indexes are
+    created on the parent, which Postgres propagates to every partition.
+#}
+{% materialization partitioned_incremental, adapter='postgres' %}
+    {%- set unique_key = config.get('unique_key') -%}
+    {%- set partition_by = config.require('partition_by') -%}
+    {%- set existing_relation = load_cached_relation(this) -%}
+    {%- set target_relation = this.incorporate(type='table') -%}
+    {%- set temp_relation = make_temp_relation(target_relation) -%}
+    {%- set full_refresh = existing_relation is none
+            or should_full_refresh()
+            or not is_partitioned_relation(existing_relation) -%}
+
+    {{ run_hooks(pre_hooks, inside_transaction=False) }}
+    {{ run_hooks(pre_hooks, inside_transaction=True) }}
+
+    {% call statement('build_temp') %}
+        {{ get_create_table_as_sql(True, temp_relation, sql) }}
+    {% endcall %}
+
+    {% if full_refresh %}
+        {% if existing_relation is not none %}
+            {% do adapter.drop_relation(existing_relation) %}
+        {% endif %}
+        {% call statement('create_parent') %}
+            create table {{ target_relation }} (like {{ temp_relation }})
+            partition by {{ 'list' if partition_by['type'] == 'list' else 'range' }} ({{ partition_by['column'] }});
+            create table {{ partition_relation(target_relation, 'default') }}
+            partition of {{ target_relation }} default
+        {% endcall %}
+        {% do adapter.cache_added(target_relation) %}
+        {% do create_missing_partitions(target_relation, temp_relation, partition_by) %}
+        {% call statement('main') %}
+            insert into {{ target_relation }} select * from {{ temp_relation }}
+        {% endcall %}
+        {% do create_indexes(target_relation) %}
+    {% else %}
+        {%- set dest_columns = adapter.get_columns_in_relation(target_relation) -%}
+        {%- set new_columns = adapter.get_columns_in_relation(temp_relation) -%}
+        {% if dest_columns | map(attribute='name') | list != new_columns | map(attribute='name') | list %}
+            {% do exceptions.raise_compiler_error(
+                "Columns of " ~ target_relation ~ " changed; run it with --full-refresh."
+            ) %}
+        {% endif %}
+        {% do create_missing_partitions(target_relation, temp_relation, partition_by) %}
+        {% call statement('main') %}
+            {{ get_delete_insert_merge_sql(target_relation, temp_relation, unique_key, dest_columns, none) }}
+        {% endcall %}
+    {% endif %}
+
+    {% do adapter.drop_relation(temp_relation) %}
+
+    {{ run_hooks(post_hooks, inside_transaction=True) }}
+    {% do adapter.commit() %}
+    {{ run_hooks(post_hooks, inside_transaction=False) }}
+
+    {% set grant_config = config.get('grants') %}
+    {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke(existing_relation, full_refresh_mode=full_refresh)) %}
+    {% do persist_docs(target_relation, model) %}
+
+    {{ return({'relations': [target_relation]}) }}
+{% endmaterialization %}
+
+
+{% macro is_partitioned_relation(relation) %}
+    {% if not execute or relation is none %}
+        {{ return(false) }}
+    {% endif %}
+    {% set result = run_query(
+        "select c.relkind = 'p' from pg_class c join pg_namespace n on n.oid = c.relnamespace"
+        ~ " where n.nspname = '" ~ relation.schema ~ "' and c.relname = '" ~ relation.identifier ~ "'"
+    ) %}
+    {{ return(result.rows | length > 0 and result.rows[0][0]) }}
+{% endmacro %}
+
+
+{#- Partition table name: <table>__<suffix>, kept inside Postgres' 63-byte limit
+    and suffixed with a hash whenever the value had to be rewritten. -#}
+{% macro partition_relation(parent, value) %}
+    {%- set slug = modules.re.sub('[^a-z0-9]+', '_', (value | string) | lower).strip('_') -%}
+    {%- if slug != (value | string) or (parent.identifier ~ '__' ~ slug) | length > 63 -%}
+        {%- set slug = slug[:63 - (parent.identifier | length) - 11] ~ '_' ~ local_md5(value | string)[:8] -%}
+    {%- endif -%}
+    {{ return(parent.incorporate(path={'identifier': parent.identifier ~ '__' ~ slug})) }}
+{% endmacro %}
+
+
+{% macro create_missing_partitions(target_relation, source_relation, partition_by) %}
+    {%- set column = partition_by['column'] -%}
+    {% if partition_by['type'] == 'list' %}
+        {% set values = run_query(
+            "select distinct " ~ column ~ "::text from " ~ source_relation
+        ).columns[0].values() %}
+        {% for value in values %}
+            {% set bound = 'null' if value is none else "'" ~ value | replace("'", "''") ~ "'" %}
+            {% call statement('create_partition') %}
+                create table if not exists {{ partition_relation(target_relation, 'null' if value is none else value) }}
+                partition of {{ target_relation }} for values in ({{ bound }})
+            {% endcall %}
+        {% endfor %}
+    {% elif partition_by['type'] == 'range' and partition_by.get('granularity', 'month') == 'month' %}
+        {% set months = run_query(
+            "select distinct to_char(m, 'YYYY-MM-DD'), to_char(m + interval '1 month', 'YYYY-MM-DD')"
+            ~ " from (select date_trunc('month', " ~ column ~ ") as m from " ~ source_relation
+            ~ " where " ~ column ~ " is not null) months"
+        ).rows %}
+        {% for month_start, month_end in months %}
+            {% call statement('create_partition') %}
+                create table if not exists {{ partition_relation(target_relation, 'p' ~ month_start[:7] | replace('-', '_')) }}
+                partition of {{ target_relation }}
+                for values from ('{{ month_start }}') to ('{{ month_end }}')
+            {% endcall %}
+        {% endfor %}
+    {% else %}
+        {% do exceptions.raise_compiler_error(
+            "partition_by must be {'column': ..., 'type': 'list'} or {'column': ..., 'type': 'range', 'granularity': 'month'}"
+        ) %}
+    {% endif %}
+{% endmacro %}
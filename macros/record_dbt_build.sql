@@ -0,0 +1,40 @@
+{#
+    on-run-end hook: append this invocation to analytics_ops.dbt_build_log so the
+    dashboard can key its loader caches on the latest build instead of a fixed TTL.
+
+    Only invocations that built at least one model, seed or snapshot are
+    recorded (dbt test, compile, etc. leave the tables untouched). The table is
+    owned by the dashboard (dashboard/sql/003_dbt_build_log.sql); until it
+    exists this hook does nothing. The insert is committed here: on-run-end
+    hooks run on a connection dbt does not commit on its own.
+#}
+{% macro record_dbt_build(results) %}
+    {% if not execute or flags.WHICH not in ('run', 'build', 'seed', 'snapshot') %}
+        {{ return('') }}
+    {% endif %}
+
+    {% set log_relation = adapter.get_relation(
+        database=target.database,
+        schema='analytics_ops',
+        identifier='dbt_build_log'
+    ) %}
+    {% if log_relation is none %}
+        {{ return('') }}
+    {% endif %}
+
+    {% set nodes = results
+        | selectattr('node.resource_type', 'in', ['model', 'seed', 'snapshot'])
+        | list %}
+    {% set built = nodes | selectattr('status', 'equalto', 'success') | list | length %}
+    {% set failed = nodes | selectattr('status', 'equalto', 'error') | list | length %}
+    {% if built == 0 %}
+        {{ return('') }}
+    {% endif %}
+
+    {% call statement('record_dbt_build') %}
+        insert into {{ log_relation }} (invocation_id, command, nodes_built, nodes_failed)
+        values ('{{ invocation_id }}', '{{ flags.WHICH }}', {{ built }}, {{ failed }})
+        on conflict (invocation_id) do nothing
+    {% endcall %}
+    {% do adapter.commit() %}
+{% endmacro %}
@@ -1,3 +1,21 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        tags=['incremental_bronze'],
+        indexes=[
+            {'columns': ['id']},
+            {'columns': ['event_timestamp']},
+        ]
+    )
+}}
+
+-- Incremental copy keyed on id, watermarked on event_timestamp (see
+-- macros/bronze_watermark_filter.sql). Clients flush offline queues late, so
+-- the lookback window re-copies recent events; queues flushed later than that
+-- are picked up by the weekly downstream full refresh.
 select
     id,
     event_name,
@@ -14,3 +32,4 @@ select
     device_type,
     app_version
 from {{ source('public', 'app_events') }}
+{{ bronze_watermark_filter('event_timestamp') }}
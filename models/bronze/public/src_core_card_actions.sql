@@ -1,2 +1,15 @@
+{{
+    config(
+        materialized='incremental',
+        on_schema_change='fail',
+        tags=['incremental_bronze']
+    )
+}}
+
+-- Historical source, closed 2026-01-29: copied once on a full build. Incremental
+-- runs add nothing; the weekly full-refresh reconciliation re-copies it.
 select card_id, user_id, source, source_id, action_type, timestamp, created_at
 from {{ source("public", "core_card_actions") }}
+{% if is_incremental() %}
+where false
+{% endif %}
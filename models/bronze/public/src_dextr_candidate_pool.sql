@@ -1,3 +1,20 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        tags=['incremental_bronze'],
+        indexes=[
+            {'columns': ['id']},
+            {'columns': ['created_at']},
+        ]
+    )
+}}
+
+-- Incremental copy keyed on id, watermarked on created_at. `served` flips after
+-- insert; flips inside the lookback are picked up here, older ones by the
+-- weekly full-refresh reconciliation.
 select
     id,
     pack_id,
@@ -8,3 +25,4 @@ select
     batch_number,
     created_at
 from {{ source('public', 'dextr_candidate_pool') }}
+{{ bronze_watermark_filter('created_at') }}
@@ -1,3 +1,13 @@
+{{
+    config(
+        materialized='incremental',
+        on_schema_change='fail',
+        tags=['incremental_bronze']
+    )
+}}
+
+-- Historical source, closed 2025-11-19: copied once on a full build. Incremental
+-- runs add nothing; the weekly full-refresh reconciliation re-copies it.
 select
     pack_id,
     coalesce(featured_place_id, card_id) as card_id,
@@ -7,3 +17,6 @@ select
     user_action,
     created_at
 from {{ source("public", "dextr_pack_cards") }}
+{% if is_incremental() %}
+where false
+{% endif %}
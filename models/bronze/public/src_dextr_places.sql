@@ -1,3 +1,19 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        tags=['incremental_bronze'],
+        indexes=[
+            {'columns': ['id']},
+            {'columns': ['updated_at']},
+        ]
+    )
+}}
+
+-- Incremental copy keyed on id. Rows are updated in place as the user acts on
+-- them, so the watermark is the last write (updated_at, else created_at).
 select
     id,
     place_id,
@@ -12,3 +28,4 @@ select
     refinement_score,
     swipe_duration_ms
 from {{ source('public', 'dextr_places') }}
+{{ bronze_watermark_filter('coalesce(updated_at, created_at)') }}
@@ -1,3 +1,18 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='query_id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        tags=['incremental_bronze'],
+        indexes=[
+            {'columns': ['query_id']},
+            {'columns': ['query_timestamp']},
+        ]
+    )
+}}
+
+-- Incremental copy keyed on query_id, watermarked on query_timestamp.
 select
     query_id,
     user_id,
@@ -8,3 +23,4 @@ select
     query_context::jsonb ->> 'location' as location,
     query_context::jsonb ->> 'app_version' as app_version
 from {{ source("public", "dextr_queries") }}
+{{ bronze_watermark_filter('query_timestamp') }}
@@ -1,3 +1,18 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        tags=['incremental_bronze'],
+        indexes=[
+            {'columns': ['id']},
+            {'columns': ['created_at']},
+        ]
+    )
+}}
+
+-- Incremental copy keyed on id, watermarked on created_at (append-only log).
 select
     id,
     pack_id,
@@ -10,3 +25,4 @@ select
     latency_ms,
     created_at
 from {{ source('public', 'dextr_refine_log') }}
+{{ bronze_watermark_filter('created_at') }}
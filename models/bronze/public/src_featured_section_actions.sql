@@ -1,3 +1,13 @@
+{{
+    config(
+        materialized='incremental',
+        on_schema_change='fail',
+        tags=['incremental_bronze']
+    )
+}}
+
+-- Historical source, closed 2026-01-29: copied once on a full build. Incremental
+-- runs add nothing; the weekly full-refresh reconciliation re-copies it.
 select
     action_id,
     user_id,
@@ -13,3 +23,6 @@ select
     created_at
 from {{ source("public", "featured_section_actions") }}
 where action_type <> 'carousel_cycle_complete'
+{% if is_incremental() %}
+and false
+{% endif %}
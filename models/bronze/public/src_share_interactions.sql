@@ -1,3 +1,18 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        tags=['incremental_bronze'],
+        indexes=[
+            {'columns': ['id']},
+            {'columns': ['interaction_timestamp']},
+        ]
+    )
+}}
+
+-- Incremental copy keyed on id, watermarked on interaction_timestamp.
 select
     id,
     share_link_id,
@@ -7,3 +22,4 @@ select
     interaction_timestamp,
     is_sharer
 from {{ source('public', 'share_interactions') }}
+{{ bronze_watermark_filter('interaction_timestamp') }}
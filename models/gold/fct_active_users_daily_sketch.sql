@@ -0,0 +1,71 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='metric_date',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        indexes=[
+            {'columns': ['metric_date']},
+        ]
+    )
+}}
+
+-- Mergeable per-day distinct-user sketches at the base grain
+-- metric_date × data_source × session_type × app_version.
+--
+-- Distinct users don't add up across days or slices, so each row holds a
+-- HyperLogLog sketch (see macros/hll.sql) instead of a count:
+--   active_*  — users with any session
+--   planner_* — users with a session with ≥1 prompt OR ≥1 save OR ≥1 share
+-- Unique users over any window and filter combination is the merge of the
+-- matching rows (at most 365 days × a few slices per year), estimated in
+-- dashboard/utils/hll.py with ~1.6% standard error.
+--
+-- Incremental by metric_date, like fct_north_star_daily_sketch: days from
+-- unified_events_lookback_days before the newest loaded day onward are
+-- re-sketched; older days are kept as built.
+with user_days as (
+    select
+        session_date as metric_date,
+        data_source,
+        case when is_prompt_session then 'prompt' else 'non_prompt' end as session_type,
+        coalesce(effective_app_version, 'unknown') as app_version,
+        user_id,
+        bool_or(has_save or has_share or is_prompt_session) as is_planner
+    from {{ ref('fct_session_outcomes') }}
+    where session_date is not null
+      and user_id is not null
+    {% if is_incremental() %}
+      and session_date >= (
+          select least(coalesce(max(metric_date), date '1900-01-01'), current_date)
+                 - {{ var('unified_events_lookback_days') }}
+          from {{ this }}
+      )
+    {% endif %}
+    group by 1, 2, 3, 4, 5
+),
+
+registers as (
+    select
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
+        {{ hll_register('user_id') }} as register,
+        max({{ hll_rank('user_id') }}) as active_rank,
+        max({{ hll_rank('user_id') }}) filter (where is_planner) as planner_rank
+    from user_days
+    group by 1, 2, 3, 4, 5
+)
+
+select
+    metric_date,
+    data_source,
+    session_type,
+    app_version,
+    array_agg(register::smallint order by register) as active_registers,
+    array_agg(active_rank::smallint order by register) as active_ranks,
+    array_agg(register::smallint order by register) filter (where planner_rank is not null) as planner_registers,
+    array_agg(planner_rank::smallint order by register) filter (where planner_rank is not null) as planner_ranks
+from registers
+group by metric_date, data_source, session_type, app_version
@@ -1,136 +1,168 @@
-with daily_metrics as (
-    select
-        session_date as metric_date,
-        data_source as ds,
-        case when is_prompt_session then 'prompt' else 'non_prompt' end as st,
-        coalesce(effective_app_version, 'unknown') as av,
-
-        count(*) as total_sessions,
-        count(*) filter (where has_3plus_swipes) as sessions_with_3plus_swipes,
-        count(*) filter (where has_save) as sessions_with_save,
-        count(*) filter (where has_share) as sessions_with_share,
-        count(*) filter (where meets_psr_broad) as sessions_with_psr_broad,
-        count(*) filter (where meets_psr_strict) as sessions_with_psr_strict,
-        count(*) filter (where is_no_value_session) as no_value_sessions,
-        count(*) filter (where has_share and has_post_share_interaction) as sessions_with_pir,
-        count(*) filter (where has_native_session_id) as sessions_with_attribution,
-        count(*) filter (where is_genuine_planning_attempt) as genuine_planning_sessions,
-
-        -- Density
-        avg(save_count) filter (where has_save) as avg_saves_per_saving_session,
-        percentile_cont(0.5) within group (order by save_count) as median_saves_per_saving_session,
+{{
+    config(
+        materialized='incremental',
+        unique_key='metric_date',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail'
+    )
+}}
 
-        -- Timing
-        percentile_cont(0.5) within group (order by time_to_first_save_seconds) as median_ttfs,
-        percentile_cont(0.5) within group (order by time_to_first_share_seconds) as median_tts
+-- Rolls the base-grain sketches in fct_north_star_daily_sketch up to every
+-- data_source / session_type / app_version combination ('all' = rolled up).
+-- Counts are summed and histograms pooled bucket by bucket, so the 'all' rows
+-- carry the exact average and median over their sessions rather than an
+-- average of the per-group averages and medians. Medians are read from the
+-- pooled buckets' running counts, never by expanding them back into sessions.
+--
+-- Incremental by metric_date over the same lookback as the sketch model.
 
-    from {{ ref('fct_session_outcomes') }}
-    where session_date is not null
-    group by session_date, data_source, case when is_prompt_session then 'prompt' else 'non_prompt' end, coalesce(effective_app_version, 'unknown')
-),
+{% set recompute_from %}
+    (
+        select least(coalesce(max(metric_date), date '1900-01-01'), current_date)
+               - {{ var('unified_events_lookback_days') }}
+        from {{ this }}
+    )
+{% endset %}
 
--- Generate all aggregation combinations
-expanded as (
-    -- Per ds × st × av (base grain)
-    select * from daily_metrics
+{% set rollups %}
+    grouping sets (
+        (metric_date, data_source, session_type, app_version),
+        (metric_date, data_source, session_type),
+        (metric_date, session_type, app_version),
+        (metric_date, data_source, app_version),
+        (metric_date, app_version),
+        (metric_date, session_type),
+        (metric_date, data_source),
+        (metric_date)
+    )
+{% endset %}
 
-    union all
+with sketches as (
+    select *
+    from {{ ref('fct_north_star_daily_sketch') }}
+    {% if is_incremental() %}
+    where metric_date >= {{ recompute_from }}
+    {% endif %}
+),
 
-    -- All app versions, per ds × st
+rollup_counts as (
     select
-        metric_date, ds, st, 'all' as av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date, ds, st
+        metric_date,
+        case when grouping(data_source) = 1 then 'all' else data_source end as ds,
+        case when grouping(session_type) = 1 then 'all' else session_type end as st,
+        case when grouping(app_version) = 1 then 'all' else app_version end as av,
 
-    union all
+        sum(total_sessions) as total_sessions,
+        sum(sessions_with_3plus_swipes) as sessions_with_3plus_swipes,
+        sum(sessions_with_save) as sessions_with_save,
+        sum(sessions_with_share) as sessions_with_share,
+        sum(sessions_with_psr_broad) as sessions_with_psr_broad,
+        sum(sessions_with_psr_strict) as sessions_with_psr_strict,
+        sum(no_value_sessions) as no_value_sessions,
+        sum(sessions_with_pir) as sessions_with_pir,
+        sum(sessions_with_attribution) as sessions_with_attribution,
+        sum(genuine_planning_sessions) as genuine_planning_sessions,
 
-    -- All data sources, per st × av
-    select
-        metric_date, 'all' as ds, st, av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date, st, av
+        -- Density
+        sum(saves_in_saving_sessions)::numeric / nullif(sum(sessions_with_save), 0)
+            as avg_saves_per_saving_session
 
-    union all
+    from sketches
+    group by {{ rollups }}
+),
 
-    -- All session types, per ds × av
-    select
-        metric_date, ds, 'all' as st, av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date, ds, av
+-- Every histogram bucket, labelled with its metric.
+histogram_buckets as (
+    select s.metric_date, s.data_source, s.session_type, s.app_version,
+           'save_count' as metric, h.value, h.n
+    from sketches s
+    cross join lateral unnest(s.save_count_values, s.save_count_counts) as h(value, n)
 
     union all
 
-    -- All ds + all st, per av
-    select
-        metric_date, 'all' as ds, 'all' as st, av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date, av
+    select s.metric_date, s.data_source, s.session_type, s.app_version,
+           'ttfs' as metric, h.value, h.n
+    from sketches s
+    cross join lateral unnest(s.ttfs_values, s.ttfs_counts) as h(value, n)
 
     union all
 
-    -- All ds + all av, per st
+    select s.metric_date, s.data_source, s.session_type, s.app_version,
+           'tts' as metric, h.value, h.n
+    from sketches s
+    cross join lateral unnest(s.tts_values, s.tts_counts) as h(value, n)
+),
+
+-- Pool the histograms of each rollup's groups: one row per distinct value
+-- with the number of sessions that had it.
+rollup_buckets as (
     select
-        metric_date, 'all' as ds, st, 'all' as av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date, st
+        metric_date,
+        case when grouping(data_source) = 1 then 'all' else data_source end as ds,
+        case when grouping(session_type) = 1 then 'all' else session_type end as st,
+        case when grouping(app_version) = 1 then 'all' else app_version end as av,
+        metric,
+        value,
+        sum(n) as n
+    from histogram_buckets
+    group by metric, value, {{ rollups }}
+),
 
-    union all
+-- Walk each pooled histogram in value order: the session at 0-based rank r
+-- sits in the first bucket whose running count exceeds r (the same walk as
+-- dashboard/utils/histograms.py).
+cumulative_buckets as (
+    select
+        *,
+        sum(n) over (partition by metric_date, ds, st, av, metric order by value) as running_n,
+        sum(n) over (partition by metric_date, ds, st, av, metric) as total_n
+    from rollup_buckets
+),
 
-    -- All st + all av, per ds
+-- percentile_cont(0.5) over N sessions interpolates between ranks
+-- floor((N - 1) / 2) and the one after it.
+medians as (
     select
-        metric_date, ds, 'all' as st, 'all' as av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date, ds
+        metric_date,
+        ds,
+        st,
+        av,
+        metric,
+        min(value) filter (where running_n > floor((total_n - 1) / 2.0)) as lower_value,
+        min(value) filter (where running_n > least(floor((total_n - 1) / 2.0) + 1, total_n - 1)) as upper_value,
+        (total_n - 1) / 2.0 - floor((total_n - 1) / 2.0) as fraction
+    from cumulative_buckets
+    group by metric_date, ds, st, av, metric, total_n
+),
 
-    union all
+rollup_quantiles as (
+    select
+        metric_date,
+        ds,
+        st,
+        av,
+        max(lower_value + (upper_value - lower_value) * fraction)
+            filter (where metric = 'save_count') as median_saves_per_saving_session,
+        max(lower_value + (upper_value - lower_value) * fraction)
+            filter (where metric = 'ttfs') as median_ttfs,
+        max(lower_value + (upper_value - lower_value) * fraction)
+            filter (where metric = 'tts') as median_tts
+    from medians
+    group by metric_date, ds, st, av
+),
 
-    -- All combined
+expanded as (
     select
-        metric_date, 'all' as ds, 'all' as st, 'all' as av,
-        sum(total_sessions), sum(sessions_with_3plus_swipes), sum(sessions_with_save), sum(sessions_with_share),
-        sum(sessions_with_psr_broad), sum(sessions_with_psr_strict),
-        sum(no_value_sessions), sum(sessions_with_pir), sum(sessions_with_attribution),
-        sum(genuine_planning_sessions),
-        avg(avg_saves_per_saving_session), avg(median_saves_per_saving_session),
-        avg(median_ttfs)::numeric, avg(median_tts)::numeric
-    from daily_metrics
-    group by metric_date
+        c.*,
+        q.median_saves_per_saving_session,
+        q.median_ttfs,
+        q.median_tts
+    from rollup_counts c
+    left join rollup_quantiles q
+        on c.metric_date = q.metric_date
+        and c.ds = q.ds
+        and c.st = q.st
+        and c.av = q.av
 ),
 
 with_rates as (
@@ -166,9 +198,40 @@ with_rates as (
     from expanded
 ),
 
-with_rolling as (
+{% if is_incremental() %}
+-- The rolling averages and week-over-week lags look back up to 7 rows per
+-- series; take those rows from the already-built table.
+prior_rates as (
+    select metric_date, data_source, session_type, app_version, ssr, shr, psr_broad, nvr
+    from (
+        select
+            *,
+            row_number() over (
+                partition by data_source, session_type, app_version
+                order by metric_date desc
+            ) as rows_back
+        from {{ this }}
+        where metric_date < {{ recompute_from }}
+    ) t
+    where rows_back <= 7
+),
+{% endif %}
+
+rolling_input as (
+    select metric_date, data_source, session_type, app_version, ssr, shr, psr_broad, nvr
+    from with_rates
+    {% if is_incremental() %}
+    union all
+    select * from prior_rates
+    {% endif %}
+),
+
+rolling as (
     select
-        *,
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
         avg(ssr) over (partition by data_source, session_type, app_version order by metric_date rows between 6 preceding and current row) as ssr_7d_avg,
         avg(shr) over (partition by data_source, session_type, app_version order by metric_date rows between 6 preceding and current row) as shr_7d_avg,
         avg(psr_broad) over (partition by data_source, session_type, app_version order by metric_date rows between 6 preceding and current row) as psr_broad_7d_avg,
@@ -176,7 +239,24 @@ with_rolling as (
 
         ssr - lag(ssr, 7) over (partition by data_source, session_type, app_version order by metric_date) as ssr_wow_change,
         psr_broad - lag(psr_broad, 7) over (partition by data_source, session_type, app_version order by metric_date) as psr_broad_wow_change
-    from with_rates
+    from rolling_input
+),
+
+with_rolling as (
+    select
+        r.*,
+        w.ssr_7d_avg,
+        w.shr_7d_avg,
+        w.psr_broad_7d_avg,
+        w.nvr_7d_avg,
+        w.ssr_wow_change,
+        w.psr_broad_wow_change
+    from with_rates r
+    inner join rolling w
+        on r.metric_date = w.metric_date
+        and r.data_source = w.data_source
+        and r.session_type = w.session_type
+        and r.app_version = w.app_version
 )
 
 select * from with_rolling
@@ -0,0 +1,133 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='metric_date',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        indexes=[
+            {'columns': ['metric_date']},
+        ]
+    )
+}}
+
+-- Mergeable per-day sketches behind fct_north_star_daily, at the base grain
+-- metric_date × data_source × session_type × app_version.
+--
+-- Counts and sums merge by addition. Medians don't (an average of medians is
+-- not a median), so each distribution is kept as an exact histogram: parallel
+-- arrays of distinct values and the number of sessions with that value.
+-- Merging histograms pools their counts, so every rollup in
+-- fct_north_star_daily reads the exact median of the combined sessions.
+--
+-- Incremental by metric_date: days from unified_events_lookback_days before
+-- the newest loaded day onward are re-sketched (their sessions can still gain
+-- late events); older days are kept as built.
+with sessions as (
+    select
+        session_date as metric_date,
+        data_source,
+        case when is_prompt_session then 'prompt' else 'non_prompt' end as session_type,
+        coalesce(effective_app_version, 'unknown') as app_version,
+        has_3plus_swipes,
+        has_save,
+        has_share,
+        has_post_share_interaction,
+        meets_psr_broad,
+        meets_psr_strict,
+        is_no_value_session,
+        has_native_session_id,
+        is_genuine_planning_attempt,
+        save_count,
+        time_to_first_save_seconds,
+        time_to_first_share_seconds
+    from {{ ref('fct_session_outcomes') }}
+    where session_date is not null
+    {% if is_incremental() %}
+      and session_date >= (
+          select least(coalesce(max(metric_date), date '1900-01-01'), current_date)
+                 - {{ var('unified_events_lookback_days') }}
+          from {{ this }}
+      )
+    {% endif %}
+),
+
+counts as (
+    select
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
+
+        count(*) as total_sessions,
+        count(*) filter (where has_3plus_swipes) as sessions_with_3plus_swipes,
+        count(*) filter (where has_save) as sessions_with_save,
+        count(*) filter (where has_share) as sessions_with_share,
+        count(*) filter (where meets_psr_broad) as sessions_with_psr_broad,
+        count(*) filter (where meets_psr_strict) as sessions_with_psr_strict,
+        count(*) filter (where is_no_value_session) as no_value_sessions,
+        count(*) filter (where has_share and has_post_share_interaction) as sessions_with_pir,
+        count(*) filter (where has_native_session_id) as sessions_with_attribution,
+        count(*) filter (where is_genuine_planning_attempt) as genuine_planning_sessions,
+
+        -- Numerator of avg_saves_per_saving_session (denominator: sessions_with_save)
+        coalesce(sum(save_count) filter (where has_save), 0) as saves_in_saving_sessions
+
+    from sessions
+    group by metric_date, data_source, session_type, app_version
+),
+
+-- One row per (group, metric, distinct value). Nulls are left out, matching
+-- percentile_cont.
+value_counts as (
+    select metric_date, data_source, session_type, app_version,
+           'save_count' as metric, save_count as value, count(*) as n
+    from sessions
+    group by metric_date, data_source, session_type, app_version, save_count
+
+    union all
+
+    select metric_date, data_source, session_type, app_version,
+           'ttfs' as metric, time_to_first_save_seconds as value, count(*) as n
+    from sessions
+    where time_to_first_save_seconds is not null
+    group by metric_date, data_source, session_type, app_version, time_to_first_save_seconds
+
+    union all
+
+    select metric_date, data_source, session_type, app_version,
+           'tts' as metric, time_to_first_share_seconds as value, count(*) as n
+    from sessions
+    where time_to_first_share_seconds is not null
+    group by metric_date, data_source, session_type, app_version, time_to_first_share_seconds
+),
+
+histograms as (
+    select
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
+        array_agg(value order by value) filter (where metric = 'save_count') as save_count_values,
+        array_agg(n order by value) filter (where metric = 'save_count') as save_count_counts,
+        array_agg(value order by value) filter (where metric = 'ttfs') as ttfs_values,
+        array_agg(n order by value) filter (where metric = 'ttfs') as ttfs_counts,
+        array_agg(value order by value) filter (where metric = 'tts') as tts_values,
+        array_agg(n order by value) filter (where metric = 'tts') as tts_counts
+    from value_counts
+    group by metric_date, data_source, session_type, app_version
+)
+
+select
+    c.*,
+    h.save_count_values,
+    h.save_count_counts,
+    h.ttfs_values,
+    h.ttfs_counts,
+    h.tts_values,
+    h.tts_counts
+from counts c
+left join histograms h
+    on c.metric_date = h.metric_date
+    and c.data_source = h.data_source
+    and c.session_type = h.session_type
+    and c.app_version = h.app_version
@@ -0,0 +1,70 @@
+{{
+    config(
+        materialized='table',
+        indexes=[
+            {'columns': ['event_date']},
+            {'columns': ['event_date', 'user_id']},
+        ]
+    )
+}}
+
+-- Pre-aggregated event counts behind the Daily / Weekly / Monthly Report page.
+--
+-- Grain: event_date × user × event_type × event_category × place × card
+-- category row counts. Test users are excluded here, so report loaders filter
+-- on the indexed event_date instead of scanning stg_unified_events with
+-- DATE(event_timestamp) and re-joining stg_users on every click. A day, a
+-- week and a month are all just event_date ranges over the same rows.
+--
+-- resolved_place_id comes from int_place_resolver. The *_card_rows columns
+-- count the stg_cards rows of the event's card carrying each category flag:
+-- category popularity has always joined swipes to stg_cards row by row, so a
+-- card listed more than once counts once per matching row, and the loaders
+-- weight event_count by these columns to keep that. Both are null for events
+-- without a card (or a card not in stg_cards).
+with card_categories as (
+    select
+        card_id,
+        count(*) filter (where is_drinks) as drinks_card_rows,
+        count(*) filter (where is_dining) as dining_card_rows,
+        count(*) filter (where is_entertainment) as entertainment_card_rows,
+        count(*) filter (where is_culture) as culture_card_rows,
+        count(*) filter (where is_adventure) as adventure_card_rows,
+        count(*) filter (where is_health) as health_card_rows
+    from {{ ref('stg_cards') }}
+    group by card_id
+)
+
+select
+    e.event_date,
+    e.user_id,
+    e.event_type,
+    e.event_category,
+    pr.resolved_place_id,
+    cc.drinks_card_rows,
+    cc.dining_card_rows,
+    cc.entertainment_card_rows,
+    cc.culture_card_rows,
+    cc.adventure_card_rows,
+    cc.health_card_rows,
+    count(*) as event_count
+from {{ ref('stg_unified_events') }} e
+inner join {{ ref('stg_users') }} u using (user_id)
+left join {{ ref('int_place_resolver') }} pr
+    on e.card_id = pr.original_card_id
+left join card_categories cc
+    on e.card_id = cc.card_id
+where u.is_test_user = 0
+  and e.event_date is not null
+group by
+    e.event_date,
+    e.user_id,
+    e.event_type,
+    e.event_category,
+    pr.resolved_place_id,
+    cc.drinks_card_rows,
+    cc.dining_card_rows,
+    cc.entertainment_card_rows,
+    cc.culture_card_rows,
+    cc.adventure_card_rows,
+    cc.health_card_rows
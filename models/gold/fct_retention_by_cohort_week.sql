@@ -1,60 +1,70 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='cohort_week',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        post_hook=[
+            "delete from {{ this }}
+             where cohort_week is null
+                or cohort_week not in (
+                    select cohort_week
+                    from {{ ref('fct_user_retention_windows') }}
+                    where cohort_week is not null
+                )"
+        ]
+    )
+}}
+
 -- Weekly cohort retention summary
 -- Aggregates activated users by cohort_week (Monday of activation week)
 -- Tracks D7/D30/D60/D90 retention with maturity flags
 -- Retention = had another session with ≥1 prompt OR ≥1 save OR ≥1 share after activation_date
-
-with activated_users as (
+--
+-- Incremental: per-user retention windows come from fct_user_retention_windows.
+-- A cohort whose users are all final (every D90 window closed, plus the
+-- late-event lookback) can't change, so its row is kept as built and only
+-- cohorts still maturing are re-aggregated. The exception is users leaving
+-- the activated set (fct_user_retention_windows drops them): a final cohort
+-- whose size no longer matches its users is re-aggregated, and the post-hook
+-- drops cohorts left with no users.
+
+with user_retention as (
     select
         user_id,
         activation_date,
         cohort_week,
-        activation_type
-    from {{ ref('fct_user_activation') }}
-    where is_activated = true
-      and activation_date is not null
-),
-
--- Retention = had another session with prompt, save, or share after activation_date
-user_activity_dates as (
-    select distinct
-        user_id,
-        session_date
-    from {{ ref('fct_session_outcomes') }}
-    where has_save or has_share or is_prompt_session
-),
-
--- Calculate retention flags for each user
-user_retention as (
-    select
-        a.user_id,
-        a.activation_date,
-        a.cohort_week,
-        a.activation_type,
+        activation_type,
 
         -- Maturity flags (has enough time passed to measure retention?)
-        current_date >= a.activation_date + 7 as is_mature_d7,
-        current_date >= a.activation_date + 30 as is_mature_d30,
-        current_date >= a.activation_date + 60 as is_mature_d60,
-        current_date >= a.activation_date + 90 as is_mature_d90,
+        current_date >= activation_date + 7 as is_mature_d7,
+        current_date >= activation_date + 30 as is_mature_d30,
+        current_date >= activation_date + 60 as is_mature_d60,
+        current_date >= activation_date + 90 as is_mature_d90,
 
         -- Retention flags (had activity in retention window?)
         -- Note: Activity must be AFTER activation_date (days 1-X, not day 0)
-        bool_or(
-            ua.session_date between a.activation_date + 1 and a.activation_date + 7
-        ) as had_activity_d7,
-        bool_or(
-            ua.session_date between a.activation_date + 1 and a.activation_date + 30
-        ) as had_activity_d30,
-        bool_or(
-            ua.session_date between a.activation_date + 1 and a.activation_date + 60
-        ) as had_activity_d60,
-        bool_or(
-            ua.session_date between a.activation_date + 1 and a.activation_date + 90
-        ) as had_activity_d90
-
-    from activated_users a
-    left join user_activity_dates ua on a.user_id = ua.user_id
-    group by a.user_id, a.activation_date, a.cohort_week, a.activation_type
+        retained_d7 as had_activity_d7,
+        retained_d30 as had_activity_d30,
+        retained_d60 as had_activity_d60,
+        retained_d90 as had_activity_d90,
+
+        is_final
+
+    from {{ ref('fct_user_retention_windows') }}
+    {% if is_incremental() %}
+    where cohort_week not in (
+        select t.cohort_week
+        from {{ this }} t
+        where t.is_final
+          and t.cohort_week is not null
+          and t.cohort_size = (
+              select count(*)
+              from {{ ref('fct_user_retention_windows') }} w
+              where w.cohort_week = t.cohort_week
+          )
+    )
+    {% endif %}
 ),
 
 -- Aggregate by cohort_week
@@ -81,7 +91,9 @@ cohort_aggregates as (
         count(*) filter (where activation_type = 'save_prompted') as cohort_save_prompted,
         count(*) filter (where activation_type = 'saved') as cohort_saved,
         count(*) filter (where activation_type = 'shared') as cohort_shared,
-        count(*) filter (where activation_type = 'multiple') as cohort_multiple
+        count(*) filter (where activation_type = 'multiple') as cohort_multiple,
+
+        bool_and(is_final) as is_final
 
     from user_retention
     group by cohort_week
@@ -114,7 +126,9 @@ select
     cohort_save_prompted,
     cohort_saved,
     cohort_shared,
-    cohort_multiple
+    cohort_multiple,
+
+    is_final
 
 from cohort_aggregates
 order by cohort_week desc
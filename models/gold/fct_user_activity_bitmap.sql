@@ -0,0 +1,113 @@
+{{
+    config(
+        materialized='table',
+        indexes=[
+            {'columns': ['user_id'], 'unique': True},
+        ]
+    )
+}}
+
+-- Per-user activity bitmap for ad-hoc retention slicing in the dashboard
+-- Grain: one row per activated user
+--
+-- activity_bits bit i (leftmost = 0) is set when the user had a meaningful
+-- session (≥1 prompt OR ≥1 save OR ≥1 share) on activation_date + i; there is
+-- one bit per day from activation through the build date (tracked_days).
+-- Retention at DN = any bit in 1..N, among users with tracked_days > N —
+-- the same definition as fct_retention_by_cohort_week.
+--
+-- The slicing attributes below are the ones fct_retention_by_acquisition_attribute
+-- and fct_retention_by_social_connectivity cut by. dashboard/utils/activity_bitmaps.py
+-- loads the table into NumPy and answers retention for any subset or
+-- grouping of these columns without another dbt model.
+
+with activated_users as (
+    select
+        user_id,
+        activation_date,
+        cohort_week,
+        activation_type
+    from {{ ref('fct_user_activation') }}
+    where is_activated = true
+      and activation_date is not null
+),
+
+activity_offsets as (
+    select
+        a.user_id,
+        array_agg(distinct s.session_date - a.activation_date) as active_days
+    from activated_users a
+    inner join {{ ref('fct_session_outcomes') }} s
+        on a.user_id = s.user_id
+        and s.session_date >= a.activation_date
+    where s.has_save or s.has_share or s.is_prompt_session
+    group by a.user_id
+),
+
+bitmaps as (
+    select
+        a.user_id,
+        count(*) as tracked_days,
+        string_agg(
+            case when d = any(o.active_days) then '1' else '0' end,
+            '' order by d
+        )::varbit as activity_bits
+    from activated_users a
+    left join activity_offsets o on a.user_id = o.user_id
+    cross join lateral generate_series(0, current_date - a.activation_date) as d
+    group by a.user_id
+),
+
+-- Same attribute definitions as fct_retention_by_acquisition_attribute
+user_first_prompt as (
+    select distinct on (user_id)
+        user_id,
+        prompt_intent
+    from {{ ref('fct_prompt_analysis') }}
+    order by user_id, query_timestamp asc
+),
+
+user_first_session as (
+    select distinct on (user_id)
+        user_id,
+        app_version
+    from {{ ref('stg_unified_sessions') }}
+    where user_id is not null
+    order by user_id, started_at asc
+),
+
+-- Same bucketing as fct_retention_by_social_connectivity
+user_group_count as (
+    select
+        a.user_id,
+        count(distinct gm.group_id) as groups_joined_near_activation
+    from activated_users a
+    inner join {{ ref('src_group_members') }} gm
+        on gm.user_id = a.user_id
+       and gm.joined_at is not null
+       and gm.joined_at::date <= a.activation_date + 7
+    group by a.user_id
+)
+
+select
+    a.user_id,
+    a.activation_date,
+    a.cohort_week,
+    a.activation_type,
+    coalesce(s.referral_source, 'unknown') as referral_source,
+    coalesce(s.activation_trigger, 'unknown') as activation_trigger,
+    coalesce(fp.prompt_intent, '_no_prompt') as first_prompt_intent,
+    coalesce(ufs.app_version, 'unknown') as app_version_at_signup,
+    case
+        when coalesce(g.groups_joined_near_activation, 0) = 0 then '0_groups'
+        when g.groups_joined_near_activation between 1 and 2 then '1-2_groups'
+        else '3+_groups'
+    end as connectivity_bucket,
+    b.tracked_days,
+    b.activity_bits
+from activated_users a
+inner join bitmaps b on a.user_id = b.user_id
+left join {{ ref('fct_user_segments') }} s on a.user_id = s.user_id
+left join user_first_prompt fp on a.user_id = fp.user_id
+left join user_first_session ufs on a.user_id = ufs.user_id
+left join user_group_count g on a.user_id = g.user_id
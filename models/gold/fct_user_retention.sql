@@ -41,25 +41,18 @@ user_profiles as (
     from {{ ref('fct_user_segments') }}
 ),
 
--- Post-activation session activity (prompt/save/share only)
-post_activation_sessions as (
+-- D7-D90 window metrics. Final once the windows close, so they are kept
+-- incrementally in fct_user_retention_windows instead of rescanning every
+-- session since launch.
+retention_windows as (
+    select *
+    from {{ ref('fct_user_retention_windows') }}
+),
+
+-- Lifetime post-activation activity (changes every day for every user)
+lifetime_sessions as (
     select
         s.user_id,
-        a.activation_date,
-
-        -- Session counts in retention windows
-        count(*) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 7
-        ) as sessions_d7,
-        count(*) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 30
-        ) as sessions_d30,
-        count(*) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 60
-        ) as sessions_d60,
-        count(*) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 90
-        ) as sessions_d90,
 
         -- Total sessions all-time (post-activation)
         count(*) filter (
@@ -72,46 +65,12 @@ post_activation_sessions as (
         -- Last meaningful activity date (prompt, save, or share)
         max(s.session_date) filter (
             where s.has_save or s.has_share or s.is_prompt_session
-        ) as last_meaningful_activity_date,
-
-        -- Save counts in windows
-        sum(s.save_count) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 7
-        ) as saves_d7,
-        sum(s.save_count) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 30
-        ) as saves_d30,
-
-        -- Share counts in windows
-        sum(s.share_count) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 7
-        ) as shares_d7,
-        sum(s.share_count) filter (
-            where s.session_date between a.activation_date + 1 and a.activation_date + 30
-        ) as shares_d30,
-
-        -- Retention flags (had meaningful activity = prompt, save, or share)
-        bool_or(
-            s.session_date between a.activation_date + 1 and a.activation_date + 7
-            and (s.has_save or s.has_share or s.is_prompt_session)
-        ) as retained_d7,
-        bool_or(
-            s.session_date between a.activation_date + 1 and a.activation_date + 30
-            and (s.has_save or s.has_share or s.is_prompt_session)
-        ) as retained_d30,
-        bool_or(
-            s.session_date between a.activation_date + 1 and a.activation_date + 60
-            and (s.has_save or s.has_share or s.is_prompt_session)
-        ) as retained_d60,
-        bool_or(
-            s.session_date between a.activation_date + 1 and a.activation_date + 90
-            and (s.has_save or s.has_share or s.is_prompt_session)
-        ) as retained_d90
+        ) as last_meaningful_activity_date
 
     from activated_users a
-    left join {{ ref('fct_session_outcomes') }} s
+    inner join {{ ref('fct_session_outcomes') }} s
         on a.user_id = s.user_id
-    group by s.user_id, a.activation_date
+    group by s.user_id
 )
 
 select
@@ -138,24 +97,24 @@ select
     current_date >= a.activation_date + 90 as is_mature_d90,
 
     -- Retention flags
-    coalesce(s.retained_d7, false) as retained_d7,
-    coalesce(s.retained_d30, false) as retained_d30,
-    coalesce(s.retained_d60, false) as retained_d60,
-    coalesce(s.retained_d90, false) as retained_d90,
+    coalesce(w.retained_d7, false) as retained_d7,
+    coalesce(w.retained_d30, false) as retained_d30,
+    coalesce(w.retained_d60, false) as retained_d60,
+    coalesce(w.retained_d90, false) as retained_d90,
 
     -- Post-activation engagement depth
-    coalesce(s.sessions_d7, 0) as sessions_d7,
-    coalesce(s.sessions_d30, 0) as sessions_d30,
-    coalesce(s.sessions_d60, 0) as sessions_d60,
-    coalesce(s.sessions_d90, 0) as sessions_d90,
+    coalesce(w.sessions_d7, 0) as sessions_d7,
+    coalesce(w.sessions_d30, 0) as sessions_d30,
+    coalesce(w.sessions_d60, 0) as sessions_d60,
+    coalesce(w.sessions_d90, 0) as sessions_d90,
     coalesce(s.sessions_post_activation, 0) as sessions_post_activation,
     coalesce(s.total_sessions_to_date, 0) as total_sessions_to_date,
     s.last_meaningful_activity_date,
 
-    coalesce(s.saves_d7, 0) as saves_d7,
-    coalesce(s.saves_d30, 0) as saves_d30,
-    coalesce(s.shares_d7, 0) as shares_d7,
-    coalesce(s.shares_d30, 0) as shares_d30,
+    coalesce(w.saves_d7, 0) as saves_d7,
+    coalesce(w.saves_d30, 0) as saves_d30,
+    coalesce(w.shares_d7, 0) as shares_d7,
+    coalesce(w.shares_d30, 0) as shares_d30,
 
     -- All-time engagement (from segmentation)
     coalesce(p.total_prompts, 0) as total_prompts,
@@ -178,4 +137,5 @@ select
 
 from activated_users a
 left join user_profiles p on a.user_id = p.user_id
-left join post_activation_sessions s on a.user_id = s.user_id
+left join retention_windows w on a.user_id = w.user_id
+left join lifetime_sessions s on a.user_id = s.user_id
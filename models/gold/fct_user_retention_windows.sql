@@ -0,0 +1,125 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='user_id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        indexes=[
+            {'columns': ['user_id']},
+            {'columns': ['cohort_week']},
+        ],
+        post_hook=[
+            "delete from {{ this }}
+             where user_id is null
+                or user_id not in (
+                    select user_id
+                    from {{ ref('fct_user_activation') }}
+                    where is_activated = true
+                      and activation_date is not null
+                      and user_id is not null
+                )"
+        ]
+    )
+}}
+
+-- Per-user D7/D30/D60/D90 retention windows — the part of retention that
+-- stops changing. Feeds fct_user_retention and fct_retention_by_cohort_week.
+-- Grain: one row per activated user
+-- Retained = had a session with ≥1 prompt OR ≥1 save OR ≥1 share on days
+-- 1-N after activation_date (not day 0)
+--
+-- Incremental: a user's last window closes 90 days after activation. Once
+-- that, plus unified_events_lookback_days for late events, has passed the row
+-- is final and incremental runs keep it as built; only users still inside
+-- their windows are recomputed, against the sessions that can fall in them.
+-- Build time therefore tracks the last ~3 months of activations, not all of
+-- history. Run with --full-refresh if activation or session history is
+-- rebuilt.
+--
+-- delete+insert only rewrites the users in the batch, so the post-hook drops
+-- users who have since left the activated set (flagged as test users,
+-- deleted accounts), final or not.
+
+with activated_users as (
+    select
+        a.user_id,
+        a.activation_date,
+        a.cohort_week,
+        a.activation_type
+    from {{ ref('fct_user_activation') }} a
+    where a.is_activated = true
+      and a.activation_date is not null
+    {% if is_incremental() %}
+      and not exists (
+          select 1
+          from {{ this }} r
+          where r.user_id = a.user_id
+            and r.is_final
+      )
+    {% endif %}
+),
+
+window_sessions as (
+    select
+        s.user_id,
+        s.session_date - a.activation_date as days_after_activation,
+        s.save_count,
+        s.share_count,
+        (s.has_save or s.has_share or s.is_prompt_session) as is_meaningful
+    from activated_users a
+    inner join {{ ref('fct_session_outcomes') }} s
+        on a.user_id = s.user_id
+        and s.session_date between a.activation_date + 1 and a.activation_date + 90
+    where s.session_date > (select min(activation_date) from activated_users)
+),
+
+window_metrics as (
+    select
+        user_id,
+
+        -- Session counts in retention windows
+        count(*) filter (where days_after_activation <= 7) as sessions_d7,
+        count(*) filter (where days_after_activation <= 30) as sessions_d30,
+        count(*) filter (where days_after_activation <= 60) as sessions_d60,
+        count(*) as sessions_d90,
+
+        -- Save / share counts in windows
+        sum(save_count) filter (where days_after_activation <= 7) as saves_d7,
+        sum(save_count) filter (where days_after_activation <= 30) as saves_d30,
+        sum(share_count) filter (where days_after_activation <= 7) as shares_d7,
+        sum(share_count) filter (where days_after_activation <= 30) as shares_d30,
+
+        -- Retention flags
+        bool_or(is_meaningful and days_after_activation <= 7) as retained_d7,
+        bool_or(is_meaningful and days_after_activation <= 30) as retained_d30,
+        bool_or(is_meaningful and days_after_activation <= 60) as retained_d60,
+        bool_or(is_meaningful) as retained_d90
+
+    from window_sessions
+    group by user_id
+)
+
+select
+    a.user_id,
+    a.activation_date,
+    a.cohort_week,
+    a.activation_type,
+
+    coalesce(w.retained_d7, false) as retained_d7,
+    coalesce(w.retained_d30, false) as retained_d30,
+    coalesce(w.retained_d60, false) as retained_d60,
+    coalesce(w.retained_d90, false) as retained_d90,
+
+    coalesce(w.sessions_d7, 0) as sessions_d7,
+    coalesce(w.sessions_d30, 0) as sessions_d30,
+    coalesce(w.sessions_d60, 0) as sessions_d60,
+    coalesce(w.sessions_d90, 0) as sessions_d90,
+    coalesce(w.saves_d7, 0) as saves_d7,
+    coalesce(w.saves_d30, 0) as saves_d30,
+    coalesce(w.shares_d7, 0) as shares_d7,
+    coalesce(w.shares_d30, 0) as shares_d30,
+
+    current_date > a.activation_date + 90 + {{ var('unified_events_lookback_days') }} as is_final
+
+from activated_users a
+left join window_metrics w on a.user_id = w.user_id
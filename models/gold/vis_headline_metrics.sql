@@ -61,7 +61,7 @@ cumulative_swipes as (
         count(distinct case when e.event_type in ('swipe_right', 'swipe_left') then e.user_id end) as users_who_swiped
     from date_spine ds
     left join {{ ref('stg_unified_events') }} e
-        on e.event_timestamp::date <= ds.metric_date
+        on e.event_date <= ds.metric_date
     group by ds.metric_date
 ),
 
@@ -72,17 +72,17 @@ daily_new_metrics as (
         count(distinct case when c.created_at::date = ds.metric_date then c.card_id end) as new_cards_today,
         count(case when dq.query_timestamp::date = ds.metric_date then 1 end) as prompts_today,
         count(case
-            when e.event_timestamp::date = ds.metric_date
+            when e.event_date = ds.metric_date
             and e.event_type in ('swipe_right', 'swipe_left')
             then 1
         end) as swipes_today,
-        count(distinct case when e.event_timestamp::date = ds.metric_date then e.user_id end) as active_users_today
+        count(distinct case when e.event_date = ds.metric_date then e.user_id end) as active_users_today
 
     from date_spine ds
     left join {{ ref('stg_users') }} u on u.created_at::date = ds.metric_date
     left join {{ ref('stg_cards') }} c on c.created_at::date = ds.metric_date
     left join {{ ref('src_dextr_queries') }} dq on dq.query_timestamp::date = ds.metric_date
-    left join {{ ref('stg_unified_events') }} e on e.event_timestamp::date = ds.metric_date
+    left join {{ ref('stg_unified_events') }} e on e.event_date = ds.metric_date
     group by ds.metric_date
 )
 
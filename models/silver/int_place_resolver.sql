@@ -1,4 +1,15 @@
-{{ config(materialized='table') }}
+{{
+    config(
+        materialized='incremental',
+        unique_key='original_card_id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        indexes=[
+            {'columns': ['original_card_id']},
+            {'columns': ['resolution_method']},
+        ]
+    )
+}}
 
 -- Place Identity Resolver
 -- Resolves any card_id format to places.place_id (integer)
@@ -9,11 +20,36 @@
 --   2. Deck SKU (e.g., "DECKC38367CT") → places.deck_sku
 --   3. Google Place ID (e.g., "ChIJaer-OwAF...") → places.google_place_id
 --   4. UUID (e.g., "060A0FC9-3540...") → board_places_v2.id (UUID PK) → place_id
+--
+-- Incremental: a resolved card_id keeps its place, so each run only resolves
+-- card_ids seen in events since the last check (event_date pruning on
+-- stg_unified_events, minus unified_events_lookback_days) that aren't resolved
+-- yet, and re-checks every previously unresolved one — its place may have
+-- been created since. Run with --full-refresh after a full refresh of
+-- stg_unified_events, or if places are re-keyed.
 
 with distinct_card_ids as (
     select distinct card_id
-    from {{ ref('stg_unified_events') }}
+    from {{ ref('stg_unified_events') }} e
     where card_id is not null
+    {% if is_incremental() %}
+      and event_date >= (
+          select coalesce(max(checked_at)::date, date '1900-01-01')
+          from {{ this }}
+      ) - {{ var('unified_events_lookback_days') }}
+      and not exists (
+          select 1
+          from {{ this }} r
+          where r.original_card_id = e.card_id
+            and r.resolution_method <> 'unresolved'
+      )
+
+    union
+
+    select original_card_id
+    from {{ this }}
+    where resolution_method = 'unresolved'
+    {% endif %}
 ),
 
 -- Places lookup table (all 3 identifiers populated)
@@ -60,7 +96,9 @@ select
              and bp.place_id is not null
             then 'uuid_board_place'
         else 'unresolved'
-    end as resolution_method
+    end as resolution_method,
+
+    now() as checked_at
 
 from distinct_card_ids ids
 -- Integer match: card_id is numeric and matches places.place_id
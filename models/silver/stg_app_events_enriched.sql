@@ -1,14 +1,59 @@
+{{
+    config(
+        materialized='partitioned_incremental',
+        unique_key='event_id',
+        partition_by={'column': 'event_name', 'type': 'list'},
+        indexes=[
+            {'columns': ['event_id']},
+            {'columns': ['event_timestamp']},
+        ]
+    )
+}}
+
+-- Incremental dedup. The built table is the persisted set of seen dedup keys
+-- (event_id = coalesce(client_event_id, id::text), indexed). Incremental runs
+-- sort only the events from a trailing lookback window (var
+-- unified_events_lookback_days) below the newest event already loaded, and
+-- delete+insert replaces any key already present. A duplicate older than the
+-- window has an earlier event_timestamp than every row in it, so the newest
+-- copy still wins, exactly as the full distinct on does.
+--
+-- The window is keyed on the client's event_timestamp (app_events has no
+-- ingestion time), so an offline queue flushed more than the lookback after
+-- its events is skipped by incremental runs. The weekly
+-- `dbt run --full-refresh --select tag:incremental_bronze+`
+-- (.github/workflows/dbt-scheduled.yml) rebuilds this model from bronze and
+-- picks those events up; see macros/bronze_watermark_filter.sql.
+--
+-- Stored list-partitioned by event_name (one partition per event). The
+-- per-event silver models (stg_session_saves, stg_session_swipes,
+-- stg_permission_events, ...) filter on literal event_name values, so each
+-- reads only its own partitions instead of rescanning every event; the
+-- event_timestamp index is created on every partition for time ranges.
 with deduplicated_events as (
     select distinct on (coalesce(client_event_id, id::text))
+        coalesce(client_event_id, id::text) as event_id,
         *
     from {{ ref('src_app_events') }}
     where event_timestamp is not null
       and user_id is not null
+    {% if is_incremental() %}
+      -- Watermark ignores future-dated client clocks so they can't push the
+      -- window past events that haven't arrived yet.
+      and event_timestamp >= (
+          select coalesce(
+              max(event_timestamp) filter (where event_timestamp <= now()),
+              '2026-01-30'::timestamptz
+          )
+          from {{ this }}
+      ) - interval '{{ var("unified_events_lookback_days") }} days'
+    {% endif %}
     order by coalesce(client_event_id, id::text), event_timestamp desc
 ),
 
 enriched as (
     select
+        e.event_id,
         e.id,
         e.event_name,
         e.event_timestamp,
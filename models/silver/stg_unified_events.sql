@@ -1,4 +1,37 @@
-{{ config(materialized='table') }}
+{{
+    config(
+        materialized='partitioned_incremental',
+        unique_key='event_id',
+        partition_by={'column': 'event_date', 'type': 'range', 'granularity': 'month'},
+        indexes=[
+            {'columns': ['event_id']},
+            {'columns': ['event_timestamp']},
+            {'columns': ['event_date', 'user_id']},
+            {'columns': ['event_type', 'event_date']},
+        ]
+    )
+}}
+
+-- Incremental build.
+--
+-- Every pre-telemetry era (CTEs 1-7) closed by 2026-02-05, so those sources are
+-- read only on a full build; incremental runs reprocess just the telemetry
+-- branch from a trailing lookback window (var unified_events_lookback_days,
+-- default 3) below the newest telemetry event already loaded. That window
+-- catches late-arriving events from clients flushing an offline queue. Rows
+-- are keyed on event_id (the telemetry dedup key), and delete+insert replaces
+-- any row already loaded, so a duplicate client_event_id that straddles the
+-- window still resolves to the newest copy, exactly as a full build would.
+-- The window is keyed on the client's event_timestamp, so events flushed more
+-- than the lookback after they happened are skipped by incremental runs. The
+-- weekly `dbt run --full-refresh --select tag:incremental_bronze+`
+-- (.github/workflows/dbt-scheduled.yml) rebuilds every era from scratch and
+-- picks them up, along with stg_unified_sessions and the gold models below.
+--
+-- Stored range-partitioned by month on event_date (= date(event_timestamp)),
+-- so date-filtered readers (filter on event_date, not date(event_timestamp))
+-- touch only the months they ask for, and incremental runs only add rows to
+-- the most recent months.
 
 -- CTE 1: Queries from dextr_queries (legacy direct-insert path).
 --
@@ -197,6 +230,18 @@ telemetry_deduped as (
     where ae.event_timestamp >= '2026-01-30'::timestamptz
       and ae.user_id is not null
       and ae.event_timestamp is not null
+    {% if is_incremental() %}
+      -- Watermark ignores future-dated client clocks so they can't push the
+      -- window past events that haven't arrived yet.
+      and ae.event_timestamp >= (
+          select coalesce(
+              max(event_timestamp) filter (where event_timestamp <= now()),
+              '2026-01-30'::timestamptz
+          )
+          from {{ this }}
+          where source_table = 'app_events'
+      ) - interval '{{ var("unified_events_lookback_days") }} days'
+    {% endif %}
     order by coalesce(ae.client_event_id, ae.id::text), ae.event_timestamp desc
 ),
 
@@ -285,27 +330,32 @@ telemetry_events as (
         coalesce(
             nullif(properties->>'source_id', ''),
             nullif(properties->>'source_board_id', '')
-        ) as origin_source_id
+        ) as origin_source_id,
+        coalesce(client_event_id, id::text) as event_id
     from telemetry_deduped
 ),
 
 -- UNION ALL
+-- Pre-telemetry rows have no stable source key; they carry a null event_id
+-- and are only ever written by a full build.
 all_events as (
-    select * from queries
+    select * from telemetry_events
+    {% if not is_incremental() %}
     union all
-    select * from swipes_legacy
+    select *, null::text as event_id from queries
     union all
-    select * from swipes_current
+    select *, null::text as event_id from swipes_legacy
     union all
-    select * from saves_from_entity_tables
+    select *, null::text as event_id from swipes_current
     union all
-    select * from shares_from_entity_tables
+    select *, null::text as event_id from saves_from_entity_tables
     union all
-    select * from clicks_from_entity_tables
+    select *, null::text as event_id from shares_from_entity_tables
     union all
-    select * from featured_actions
+    select *, null::text as event_id from clicks_from_entity_tables
     union all
-    select * from telemetry_events
+    select *, null::text as event_id from featured_actions
+    {% endif %}
 )
 
 -- Add event_category and normalized origin_surface in the final wrapping CTE.
@@ -316,8 +366,10 @@ all_events as (
 -- collapsed to the canonical top-level surfaces so gold models and tests
 -- have a stable allowlist.
 select
+    event_id,
     user_id,
     event_timestamp,
+    date(event_timestamp) as event_date,
     event_type,
     card_id,
     pack_id,
@@ -1,4 +1,26 @@
-{{ config(materialized='table') }}
+{{
+    config(
+        materialized='incremental',
+        unique_key='session_id',
+        incremental_strategy='delete+insert',
+        on_schema_change='fail',
+        indexes=[
+            {'columns': ['session_id']},
+            {'columns': ['started_at']},
+        ]
+    )
+}}
+
+-- Incremental build.
+--
+-- Inferred sessions (Part A) cover a closed era, so the lag()/running-sum
+-- sessionization runs only on a full build and its rows are kept thereafter.
+-- Incremental runs recompute only native sessions whose event window reaches
+-- past the watermark: the newest native session already loaded, minus
+-- unified_events_lookback_days (the same window stg_unified_events reloads).
+-- That covers new sessions, sessions that gained late events, and sessions
+-- whose ended_at was filled in since the last run; delete+insert on
+-- session_id replaces their previous rows. --full-refresh rebuilds both parts.
 
 -- ===================================================================
 -- Part A: Inferred sessions (before Jan 30 2026)
@@ -133,6 +155,16 @@ native_sessions_base as (
         app_version
     from {{ ref('stg_planning_sessions') }}
     where started_at >= '2026-01-30'::timestamptz
+    {% if is_incremental() %}
+      and coalesce(ended_at, started_at + interval '2 hours') >= (
+          select coalesce(
+              max(started_at) filter (where started_at <= now()),
+              '2026-01-30'::timestamptz
+          )
+          from {{ this }}
+          where session_source = 'native'
+      ) - interval '{{ var("unified_events_lookback_days") }} days'
+    {% endif %}
 ),
 
 native_event_counts as (
@@ -151,6 +183,10 @@ native_event_counts as (
         and e.event_timestamp >= ns.started_at
         and e.event_timestamp <= coalesce(ns.ended_at, ns.started_at + interval '2 hours')
     where e.event_timestamp >= '2026-01-30'::timestamptz
+    {% if is_incremental() %}
+      -- Lets the planner range-scan events from the earliest recomputed session
+      and e.event_timestamp >= (select min(started_at) from native_sessions_base)
+    {% endif %}
     group by ns.session_id
 ),
 
@@ -184,6 +220,8 @@ native_sessions as (
 -- ===================================================================
 -- UNION both session types
 -- ===================================================================
+{% if not is_incremental() %}
 select * from inferred_sessions
 union all
+{% endif %}
 select * from native_sessions
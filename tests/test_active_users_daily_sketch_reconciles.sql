@@ -0,0 +1,86 @@
+-- fct_active_users_daily_sketch must have one row per
+-- (metric_date, data_source, session_type, app_version), and over the last
+-- 35 days each row's sketch must equal one rebuilt from scratch over
+-- fct_session_outcomes (a slice with users but no row, or a row whose
+-- registers or ranks differ, means the incremental build drifted).
+-- Returns every duplicated or mismatched slice.
+
+with sketch as (
+    select *
+    from {{ ref('fct_active_users_daily_sketch') }}
+),
+
+duplicates as (
+    select metric_date, data_source, session_type, app_version, 'duplicate grain' as failure
+    from sketch
+    group by 1, 2, 3, 4
+    having count(*) > 1
+),
+
+user_days as (
+    select
+        session_date as metric_date,
+        data_source,
+        case when is_prompt_session then 'prompt' else 'non_prompt' end as session_type,
+        coalesce(effective_app_version, 'unknown') as app_version,
+        user_id,
+        bool_or(has_save or has_share or is_prompt_session) as is_planner
+    from {{ ref('fct_session_outcomes') }}
+    where session_date >= current_date - 35
+      and user_id is not null
+    group by 1, 2, 3, 4, 5
+),
+
+registers as (
+    select
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
+        {{ hll_register('user_id') }} as register,
+        max({{ hll_rank('user_id') }}) as active_rank,
+        max({{ hll_rank('user_id') }}) filter (where is_planner) as planner_rank
+    from user_days
+    group by 1, 2, 3, 4, 5
+),
+
+rebuilt as (
+    select
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
+        array_agg(register::smallint order by register) as active_registers,
+        array_agg(active_rank::smallint order by register) as active_ranks,
+        array_agg(register::smallint order by register) filter (where planner_rank is not null) as planner_registers,
+        array_agg(planner_rank::smallint order by register) filter (where planner_rank is not null) as planner_ranks
+    from registers
+    group by 1, 2, 3, 4
+),
+
+mismatches as (
+    select
+        coalesce(r.metric_date, s.metric_date) as metric_date,
+        coalesce(r.data_source, s.data_source) as data_source,
+        coalesce(r.session_type, s.session_type) as session_type,
+        coalesce(r.app_version, s.app_version) as app_version,
+        'sketch differs from fct_session_outcomes' as failure
+    from rebuilt r
+    full outer join (
+        select * from sketch where metric_date >= current_date - 35
+    ) s
+        on r.metric_date = s.metric_date
+        and r.data_source = s.data_source
+        and r.session_type = s.session_type
+        and r.app_version = s.app_version
+    where r.metric_date is null
+       or s.metric_date is null
+       or r.active_registers is distinct from s.active_registers
+       or r.active_ranks is distinct from s.active_ranks
+       or r.planner_registers is distinct from s.planner_registers
+       or r.planner_ranks is distinct from s.planner_ranks
+)
+
+select * from duplicates
+union all
+select * from mismatches
@@ -61,6 +61,14 @@ retention_violations as (
     select 'fct_user_retention' as table_name, r.user_id
     from {{ ref('fct_user_retention') }} r
     inner join test_users t on r.user_id = t.user_id
+),
+
+-- Check fct_user_retention_windows (incremental: final rows are kept, so a
+-- user flagged as a test user after their windows closed must be deleted)
+retention_windows_violations as (
+    select 'fct_user_retention_windows' as table_name, w.user_id
+    from {{ ref('fct_user_retention_windows') }} w
+    inner join test_users t on w.user_id = t.user_id
 )
 
 select * from segments_violations
@@ -78,3 +86,5 @@ union all
 select * from viral_violations
 union all
 select * from retention_violations
+union all
+select * from retention_windows_violations
@@ -0,0 +1,91 @@
+-- fct_north_star_daily_sketch must have one row per
+-- (metric_date, data_source, session_type, app_version), and over the last
+-- 35 days every fct_north_star_daily row (base grain and 'all' rollups) must
+-- match the same numbers computed straight from fct_session_outcomes:
+-- session counts, and medians with percentile_cont over the pooled sessions.
+-- Returns every duplicated sketch row and every mismatched daily row.
+
+with duplicates as (
+    select
+        metric_date,
+        data_source,
+        session_type,
+        app_version,
+        'duplicate sketch grain' as failure
+    from {{ ref('fct_north_star_daily_sketch') }}
+    group by 1, 2, 3, 4
+    having count(*) > 1
+),
+
+sessions as (
+    select
+        session_date as metric_date,
+        data_source,
+        case when is_prompt_session then 'prompt' else 'non_prompt' end as session_type,
+        coalesce(effective_app_version, 'unknown') as app_version,
+        has_save,
+        has_share,
+        save_count,
+        time_to_first_save_seconds,
+        time_to_first_share_seconds
+    from {{ ref('fct_session_outcomes') }}
+    where session_date >= current_date - 35
+),
+
+baseline as (
+    select
+        metric_date,
+        case when grouping(data_source) = 1 then 'all' else data_source end as data_source,
+        case when grouping(session_type) = 1 then 'all' else session_type end as session_type,
+        case when grouping(app_version) = 1 then 'all' else app_version end as app_version,
+        count(*) as total_sessions,
+        count(*) filter (where has_save) as sessions_with_save,
+        count(*) filter (where has_share) as sessions_with_share,
+        round((percentile_cont(0.5) within group (order by save_count))::numeric, 2) as median_saves_per_saving_session,
+        (percentile_cont(0.5) within group (order by time_to_first_save_seconds))::integer as median_ttfs,
+        (percentile_cont(0.5) within group (order by time_to_first_share_seconds))::integer as median_tts
+    from sessions
+    group by grouping sets (
+        (metric_date, data_source, session_type, app_version),
+        (metric_date, data_source, session_type),
+        (metric_date, session_type, app_version),
+        (metric_date, data_source, app_version),
+        (metric_date, app_version),
+        (metric_date, session_type),
+        (metric_date, data_source),
+        (metric_date)
+    )
+),
+
+daily as (
+    select *
+    from {{ ref('fct_north_star_daily') }}
+    where metric_date >= current_date - 35
+),
+
+mismatches as (
+    select
+        coalesce(b.metric_date, d.metric_date) as metric_date,
+        coalesce(b.data_source, d.data_source) as data_source,
+        coalesce(b.session_type, d.session_type) as session_type,
+        coalesce(b.app_version, d.app_version) as app_version,
+        'differs from fct_session_outcomes' as failure
+    from baseline b
+    full outer join daily d
+        on b.metric_date = d.metric_date
+        and b.data_source = d.data_source
+        and b.session_type = d.session_type
+        and b.app_version = d.app_version
+    where b.metric_date is null
+       or d.metric_date is null
+       or b.total_sessions <> d.total_sessions
+       or b.sessions_with_save <> d.sessions_with_save
+       or b.sessions_with_share <> d.sessions_with_share
+       or b.median_saves_per_saving_session is distinct from d.median_saves_per_saving_session
+       or b.median_ttfs is distinct from d.median_ttfs
+       or b.median_tts is distinct from d.median_tts
+)
+
+select * from duplicates
+union all
+select * from mismatches
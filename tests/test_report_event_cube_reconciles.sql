@@ -0,0 +1,98 @@
+-- fct_report_event_cube must reproduce the Report page's pre-cube queries.
+--
+-- Per event_date and event_type, over the last 35 days:
+--   - event totals equal a count over stg_unified_events for non-test users
+--     (the topline / trend / activity loaders);
+--   - per-category swipe counts equal the old row-by-row join of swipes to
+--     stg_cards (a card with several stg_cards rows counts once per row).
+-- Returns every day/type/category whose numbers differ.
+
+with recent_events as (
+    select e.event_date, e.event_type, e.card_id
+    from {{ ref('stg_unified_events') }} e
+    inner join {{ ref('stg_users') }} u using (user_id)
+    where u.is_test_user = 0
+      and e.event_date >= current_date - 35
+),
+
+cube as (
+    select *
+    from {{ ref('fct_report_event_cube') }}
+    where event_date >= current_date - 35
+),
+
+total_mismatches as (
+    select
+        coalesce(b.event_date, c.event_date) as event_date,
+        coalesce(b.event_type, c.event_type) as event_type,
+        'all' as category,
+        b.n as baseline_count,
+        c.n as cube_count
+    from (
+        select event_date, event_type, count(*) as n
+        from recent_events
+        group by 1, 2
+    ) b
+    full outer join (
+        select event_date, event_type, sum(event_count) as n
+        from cube
+        group by 1, 2
+    ) c
+        on b.event_date = c.event_date
+        and b.event_type is not distinct from c.event_type
+    where b.n is distinct from c.n
+),
+
+baseline_categories as (
+    select s.event_date, s.event_type, x.category, count(*) as n
+    from recent_events s
+    inner join {{ ref('stg_cards') }} k on k.card_id = s.card_id
+    cross join lateral (
+        values
+            ('Drinks', k.is_drinks),
+            ('Dining', k.is_dining),
+            ('Entertainment', k.is_entertainment),
+            ('Culture', k.is_culture),
+            ('Adventure', k.is_adventure),
+            ('Health', k.is_health)
+    ) as x(category, flagged)
+    where s.event_type in ('swipe_right', 'swipe_left')
+      and x.flagged
+    group by 1, 2, 3
+),
+
+cube_categories as (
+    select c.event_date, c.event_type, x.category, sum(c.event_count * x.card_rows) as n
+    from cube c
+    cross join lateral (
+        values
+            ('Drinks', c.drinks_card_rows),
+            ('Dining', c.dining_card_rows),
+            ('Entertainment', c.entertainment_card_rows),
+            ('Culture', c.culture_card_rows),
+            ('Adventure', c.adventure_card_rows),
+            ('Health', c.health_card_rows)
+    ) as x(category, card_rows)
+    where c.event_type in ('swipe_right', 'swipe_left')
+      and x.card_rows > 0
+    group by 1, 2, 3
+),
+
+category_mismatches as (
+    select
+        coalesce(b.event_date, c.event_date) as event_date,
+        coalesce(b.event_type, c.event_type) as event_type,
+        coalesce(b.category, c.category) as category,
+        b.n as baseline_count,
+        c.n as cube_count
+    from baseline_categories b
+    full outer join cube_categories c
+        on b.event_date = c.event_date
+        and b.event_type = c.event_type
+        and b.category = c.category
+    where b.n is distinct from c.n
+)
+
+select * from total_mismatches
+union all
+select * from category_mismatches
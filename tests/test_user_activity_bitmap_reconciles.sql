@@ -0,0 +1,40 @@
+-- fct_user_activity_bitmap must cover the same users as
+-- fct_user_retention_windows, with one bit per day since activation, and
+-- its D7/D30 retention (any bit set on days 1..N) must equal the windows'
+-- flags for every row those still rebuild (is_final = false).
+-- Returns every user whose membership, width or retention differs.
+
+with bitmap as (
+    select
+        user_id,
+        activation_date,
+        tracked_days,
+        length(activity_bits) as bit_length,
+        substring(activity_bits::text from 2 for 7) like '%1%' as retained_d7,
+        substring(activity_bits::text from 2 for 30) like '%1%' as retained_d30
+    from {{ ref('fct_user_activity_bitmap') }}
+)
+
+select
+    coalesce(b.user_id, w.user_id) as user_id,
+    case
+        when b.user_id is null then 'missing from fct_user_activity_bitmap'
+        when w.user_id is null then 'missing from fct_user_retention_windows'
+        when b.tracked_days <> current_date - b.activation_date + 1
+          or b.bit_length <> b.tracked_days then 'bitmap width does not match activation_date'
+        else 'retention differs from fct_user_retention_windows'
+    end as failure
+from bitmap b
+full outer join {{ ref('fct_user_retention_windows') }} w
+    on b.user_id = w.user_id
+where b.user_id is null
+   or w.user_id is null
+   or b.tracked_days <> current_date - b.activation_date + 1
+   or b.bit_length <> b.tracked_days
+   or (
+       not w.is_final
+       and (
+           (b.tracked_days > 7 and b.retained_d7 <> w.retained_d7)
+           or (b.tracked_days > 30 and b.retained_d30 <> w.retained_d30)
+       )
+   )
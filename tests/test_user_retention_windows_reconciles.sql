@@ -0,0 +1,57 @@
+-- fct_user_retention_windows must hold exactly the activated users of
+-- fct_user_activation, and every row still being rebuilt (is_final = false)
+-- must match a from-scratch recomputation over fct_session_outcomes.
+-- Final rows are kept as built by design, so only their presence is checked.
+-- Returns every user whose membership, flags or session counts differ.
+
+with activated_users as (
+    select user_id, activation_date
+    from {{ ref('fct_user_activation') }}
+    where is_activated = true
+      and activation_date is not null
+      and user_id is not null
+),
+
+baseline as (
+    select
+        a.user_id,
+        coalesce(bool_or(
+            (s.has_save or s.has_share or s.is_prompt_session)
+            and s.session_date <= a.activation_date + 7
+        ), false) as retained_d7,
+        coalesce(bool_or(
+            (s.has_save or s.has_share or s.is_prompt_session)
+            and s.session_date <= a.activation_date + 30
+        ), false) as retained_d30,
+        coalesce(bool_or(s.has_save or s.has_share or s.is_prompt_session), false) as retained_d90,
+        count(s.user_id) filter (where s.session_date <= a.activation_date + 30) as sessions_d30,
+        count(s.user_id) as sessions_d90
+    from activated_users a
+    left join {{ ref('fct_session_outcomes') }} s
+        on a.user_id = s.user_id
+        and s.session_date between a.activation_date + 1 and a.activation_date + 90
+    group by a.user_id
+)
+
+select
+    coalesce(b.user_id, w.user_id) as user_id,
+    case
+        when w.user_id is null then 'missing from fct_user_retention_windows'
+        when b.user_id is null then 'not an activated user'
+        else 'windows differ from fct_session_outcomes'
+    end as failure
+from baseline b
+full outer join {{ ref('fct_user_retention_windows') }} w
+    on b.user_id = w.user_id
+where b.user_id is null
+   or w.user_id is null
+   or (
+       not w.is_final
+       and (
+           w.retained_d7 <> b.retained_d7
+           or w.retained_d30 <> b.retained_d30
+           or w.retained_d90 <> b.retained_d90
+           or w.sessions_d30 <> b.sessions_d30
+           or w.sessions_d90 <> b.sessions_d90
+       )
+   )